@@ -1,24 +1,43 @@
 import serial
 import time
 import vgamepad as vg
-from enum import Enum, auto
+from enum import Enum
 import tkinter as tk
-from tkinter import ttk, simpledialog
-import pystray
-from PIL import Image, ImageTk
+from tkinter import simpledialog
 import threading
-import queue
+from collections import deque
 import pyvjoy  # Changed from vjoy to pyvjoy
 import json
+from dataclasses import asdict, dataclass, fields
+from types import SimpleNamespace
+from functools import lru_cache, partial, wraps
 import os
+import traceback
 import math
-import inspect
-import ctypes
+import struct
+from array import array
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import serial.tools.list_ports
 import darkdetect
 
+# orjson is optional; it is much faster than json, mainly when writing the
+# indented settings file
+try:
+    import orjson
+    
+    def _loads(data):
+        return orjson.loads(data)
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+    
+    def _dumps(obj):
+        return json.dumps(obj, indent=4).encode()
+
 class ControlProfile(Enum):
     MSFS = "Microsoft Flight Simulator"
     DCS = "DCS World"
@@ -26,10 +45,242 @@ class ControlProfile(Enum):
     IL2 = "IL-2 Sturmovik"
     WAR_THUNDER = "War Thunder"
 
+# Profile that follows each profile when cycling
+_PROFILES = list(ControlProfile)
+_NEXT_PROFILE = {profile: _PROFILES[(i + 1) % len(_PROFILES)] for i, profile in enumerate(_PROFILES)}
+
 class ControllerType(Enum):
     XBOX = "Xbox Controller"
     VJOY = "vJoy Device"
 
+# Mouse wheel delta reported per notch on Windows
+_WHEEL_DIV = 120
+
+# Height in pixels of the per-pot value bars in the control panel tab, and of
+# the text row (value and raw reading) drawn under each bar on the same canvas
+_POT_BAR_HEIGHT = 12
+_POT_TEXT_HEIGHT = 18
+# Vertical centre of that text row
+_POT_TEXT_Y = _POT_BAR_HEIGHT + _POT_TEXT_HEIGHT // 2
+
+# Calibration needle end-point offsets for every raw pot reading (0-1023),
+# sweeping -135 to 135 degrees with a 35 px needle
+_NEEDLE_DX = [35 * math.cos(math.radians(v / 1023 * 270 - 135)) for v in range(1024)]
+_NEEDLE_DY = [35 * math.sin(math.radians(v / 1023 * 270 - 135)) for v in range(1024)]
+
+@dataclass(slots=True)
+class CalEntry:
+    """Calibration points for one throttle quadrant control"""
+    min: float = 0
+    max: float = 100
+    idle: float = 0
+
+@dataclass(slots=True)
+class PotUIState:
+    """Tk variables (and the threshold label) behind one pot's settings widgets"""
+    name: tk.StringVar
+    type: tk.StringVar
+    invert: tk.BooleanVar
+    threshold: tk.IntVar
+    threshold_label: object
+    axis: tk.StringVar
+    button: tk.StringVar
+    cal_min: tk.StringVar
+    cal_max: tk.StringVar
+
+# Field names accepted from saved calibration settings
+_CAL_FIELDS = frozenset(f.name for f in fields(CalEntry))
+
+# Radio button values for each controller type
+_XBOX_V = ControllerType.XBOX.value
+_VJOY_V = ControllerType.VJOY.value
+
+# Enum lookups for radio button values and saved settings
+_CONTROLLER_BY_VALUE = {ct.value: ct for ct in ControllerType}
+_CONTROLLER_BY_NAME = {ct.name: ct for ct in ControllerType}
+_PROFILE_BY_NAME = {p.name: p for p in ControlProfile}
+
+# Read timeout for the serial threads: long enough that an idle port costs no
+# CPU, short enough that the running flags are still checked promptly
+_SERIAL_TIMEOUT = 0.2
+
+def _read_serial_lines(ser, buffer):
+    """Read the bytes waiting on a port into buffer and return any complete lines.
+    
+    Blocks for at most the port timeout when nothing is waiting. A trailing
+    partial line stays in buffer for the next call.
+    """
+    chunk = ser.read(ser.in_waiting or 1)
+    if not chunk:
+        return ()
+    buffer += chunk
+    
+    end = buffer.rfind(b'\n')
+    if end < 0:
+        # Drop runaway data that never contains a newline
+        if len(buffer) > 4096:
+            del buffer[:]
+        return ()
+    
+    lines = bytes(buffer[:end]).split(b'\n')
+    del buffer[:end + 1]
+    return lines
+
+# Padding for short control panel frames
+_ZERO7 = [0.0] * 7
+
+def _parse_control_panel_line(line):
+    """Parse a CTRLPANEL,raw,smoothed,... line (bytes) into 7 raw floats, or None if it isn't one"""
+    if not line.startswith(b"CTRLPANEL"):
+        return None
+    
+    # Split after the device identifier and filter out empty fields; each
+    # field keeps its position, so a bad reading can't shift the pots after it
+    parts = [p for p in line[9:].split(b',') if p.strip()]
+    
+    # Raw values are every other field; float() accepts the bytes directly
+    raw_values = []
+    for part in parts[0:14:2]:
+        try:
+            value = float(part)
+        except ValueError:
+            value = 0.0
+        # Arduino prints nan/inf for bad readings; treat them like garbage too
+        raw_values.append(value if math.isfinite(value) else 0.0)
+    
+    # Ensure we have 7 values
+    raw_values += _ZERO7[len(raw_values):]
+    return raw_values
+
+# Integer ids for the pot control types, used by the hot-path kernel
+POT_TYPE_AXIS = 0
+POT_TYPE_SWITCH = 1
+POT_TYPE_BUTTON = 2
+POT_TYPE_DISABLED = 3
+POT_TYPE_IDS = {
+    "Axis": POT_TYPE_AXIS,
+    "Switch": POT_TYPE_SWITCH,
+    "Button": POT_TYPE_BUTTON,
+    "Disabled": POT_TYPE_DISABLED
+}
+
+def _pot_kernel(raw, cal_offset, cal_scale, invert, type_id, threshold):
+    """Map a raw pot reading to 0-100 (or 0/100 for switches) using scalars only.
+    
+    cal_offset/cal_scale are precomputed by ControlPanelConfig._sync_pot.
+    """
+    # Skip disabled controls
+    if type_id == POT_TYPE_DISABLED:
+        return 0
+    
+    # Ensure raw value is within expected range
+    if raw < 0:
+        raw = 0
+    elif raw > 1023:
+        raw = 1023
+    
+    # Map from calibrated min to max and clamp to 0-100
+    calibrated = (raw - cal_offset) * cal_scale
+    if calibrated < 0:
+        calibrated = 0
+    elif calibrated > 100:
+        calibrated = 100
+    
+    # Apply inversion if needed
+    if invert:
+        calibrated = 100 - calibrated
+    
+    # Switches and buttons collapse to on/off around the threshold
+    if type_id != POT_TYPE_AXIS:
+        return 100 if calibrated > threshold else 0
+    return calibrated
+
+# vJoy data struct field behind each axis name offered in the UI
+VJOY_AXIS_FIELDS = {
+    "X": "wAxisX",
+    "Y": "wAxisY",
+    "Z": "wAxisZ",
+    "RX": "wAxisXRot",
+    "RY": "wAxisYRot",
+    "RZ": "wAxisZRot",
+    "SL0": "wSlider",
+    "SL1": "wDial"
+}
+
+# Choices for the per-pot vJoy axis combobox, shared by every pot
+VJOY_AXIS_CHOICES = ("None",) + tuple(VJOY_AXIS_FIELDS)
+
+# lButtons bit for each vJoy button id (index is button id - 1)
+_BUTTON_MASKS = tuple(1 << i for i in range(128))
+# Bits lButtons can hold (buttons 1-32); higher ids go through set_button
+_LBUTTONS_BITS = (1 << 32) - 1
+
+def _button_mask(button_id):
+    """Return the lButtons bit for a 1-based button id, rejecting ids outside the table"""
+    if not 1 <= button_id <= len(_BUTTON_MASKS):
+        raise ValueError(f"Button ID {button_id} out of range")
+    return _BUTTON_MASKS[button_id - 1]
+
+def _to_axis(value):
+    """Scale a 0-100 value to the vJoy 0-32768 axis range, clamped"""
+    axis_value = int(value * 327.68)
+    return 0 if axis_value < 0 else (32768 if axis_value > 32768 else axis_value)
+
+def _calibrate_kernel(throttle_raw, prop_raw, mixture_raw, params):
+    """Calibrate and invert throttle, reverse, prop and mixture in one call.
+    
+    params is the flat tuple built by FlightControls.refresh_calibration.
+    """
+    (thr_idle, thr_max, rev_idle, rev_min, prop_idle, prop_max,
+     mix_idle, mix_max, inv_thr, inv_rev, inv_prop, inv_mix) = params
+    
+    # Forward thrust: 0 at or below idle, idle to max maps to 0-100
+    if throttle_raw <= thr_idle:
+        forward = 0.0
+    elif thr_max == thr_idle:
+        forward = 100.0
+    else:
+        forward = (throttle_raw - thr_idle) / (thr_max - thr_idle) * 100.0
+        forward = 0.0 if forward < 0.0 else (100.0 if forward > 100.0 else forward)
+    
+    # Reverse thrust: 0 at or above idle, idle down to min maps to 0-100
+    if throttle_raw >= rev_idle:
+        reverse = 0.0
+    elif rev_idle == rev_min:
+        reverse = 100.0
+    else:
+        reverse = (rev_idle - throttle_raw) / (rev_idle - rev_min) * 100.0
+        reverse = 0.0 if reverse < 0.0 else (100.0 if reverse > 100.0 else reverse)
+    
+    # Prop and mixture use the same idle-to-max mapping as forward thrust
+    if prop_raw <= prop_idle:
+        prop = 0.0
+    elif prop_max == prop_idle:
+        prop = 100.0
+    else:
+        prop = (prop_raw - prop_idle) / (prop_max - prop_idle) * 100.0
+        prop = 0.0 if prop < 0.0 else (100.0 if prop > 100.0 else prop)
+    
+    if mixture_raw <= mix_idle:
+        mixture = 0.0
+    elif mix_max == mix_idle:
+        mixture = 100.0
+    else:
+        mixture = (mixture_raw - mix_idle) / (mix_max - mix_idle) * 100.0
+        mixture = 0.0 if mixture < 0.0 else (100.0 if mixture > 100.0 else mixture)
+    
+    # Apply axis inversion
+    if inv_thr:
+        forward = 100 - forward
+    if inv_rev:
+        reverse = 100 - reverse
+    if inv_prop:
+        prop = 100 - prop
+    if inv_mix:
+        mixture = 100 - mixture
+    
+    return forward, reverse, prop, mixture
+
 class ControlPanelConfig:
     def __init__(self):
         # Control types
@@ -43,6 +294,7 @@ class ControlPanelConfig:
             self.pot_config.append({
                 'name': f"Pot {i+1}",
                 'type': "Axis",  # Axis, Switch, Button, or Disabled
+                'type_id': POT_TYPE_AXIS,  # Integer form of 'type' for the kernel
                 'invert': False,
                 'min': 0,
                 'max': 100,
@@ -52,6 +304,60 @@ class ControlPanelConfig:
                 'calibrated_min': 0,
                 'calibrated_max': 100
             })
+        
+        # Setter per axis name, resolved once when a pot's axis is configured
+        self._axis_setters = {
+            name: (lambda data, value, field=field: setattr(data, field, value))
+            for name, field in VJOY_AXIS_FIELDS.items()
+        }
+        
+        # Structure-of-arrays mirror of pot_config for the per-frame hot path.
+        # Kept in sync by the setters below - edit pots through them, not the dicts.
+        count = len(self.pot_config)
+        self.cal_offsets = [0] * count
+        self.cal_scales = [0.0] * count
+        self.inverts = [False] * count
+        self.type_ids = [POT_TYPE_AXIS] * count
+        self.thresholds = [0] * count
+        self.vjoy_axes = [None] * count
+        self.axis_setters = [None] * count
+        self.button_ids = [None] * count
+        self.button_masks = [0] * count
+        for i in range(count):
+            self._sync_pot(i)
+    
+    def _sync_pot(self, index):
+        """Copy one pot's dict config into the parallel arrays"""
+        config = self.pot_config[index]
+        
+        # Resolve the calibration to offset/scale here so the per-frame
+        # kernel does one subtract and multiply instead of a divide
+        cal_min = config['calibrated_min']
+        cal_max = config['calibrated_max']
+        if cal_min >= cal_max:
+            # Default to full range if calibration is invalid
+            cal_min = 0
+            cal_max = 1023
+        self.cal_offsets[index] = cal_min
+        self.cal_scales[index] = 100.0 / (cal_max - cal_min)
+        self.inverts[index] = config['invert']
+        self.type_ids[index] = config['type_id']
+        self.thresholds[index] = config['threshold']
+        self.vjoy_axes[index] = config['vjoy_axis']
+        self.axis_setters[index] = self._axis_setters.get(config['vjoy_axis'])
+        
+        # Parse the button id once here instead of on every frame
+        try:
+            self.button_ids[index] = int(config['button_id']) if config['button_id'] is not None else None
+        except (TypeError, ValueError):
+            self.button_ids[index] = None
+        
+        # Look up its lButtons bit too; ids outside 1-128 get no bit
+        button_id = self.button_ids[index]
+        if button_id is not None and 1 <= button_id <= len(_BUTTON_MASKS):
+            self.button_masks[index] = _BUTTON_MASKS[button_id - 1]
+        else:
+            self.button_masks[index] = 0
     
     def get_pot_names(self):
         """Return list of pot names"""
@@ -66,70 +372,87 @@ class ControlPanelConfig:
         """Set type for a pot"""
         if 0 <= index < len(self.pot_config) and type_name in self.CONTROL_TYPES:
             self.pot_config[index]['type'] = type_name
+            self.pot_config[index]['type_id'] = POT_TYPE_IDS[type_name]
+            self._sync_pot(index)
     
     def set_pot_threshold(self, index, threshold):
         """Set threshold for a pot in switch/button mode"""
         if 0 <= index < len(self.pot_config):
             self.pot_config[index]['threshold'] = threshold
+            self._sync_pot(index)
     
     def toggle_pot_inversion(self, index):
         """Toggle inversion for a pot"""
         if 0 <= index < len(self.pot_config):
             self.pot_config[index]['invert'] = not self.pot_config[index]['invert']
+            self._sync_pot(index)
     
     def calibrate_pot_min(self, index, value):
         """Set calibrated minimum for a pot"""
         if 0 <= index < len(self.pot_config):
             self.pot_config[index]['calibrated_min'] = value
+            self._sync_pot(index)
     
     def calibrate_pot_max(self, index, value):
         """Set calibrated maximum for a pot"""
         if 0 <= index < len(self.pot_config):
             self.pot_config[index]['calibrated_max'] = value
+            self._sync_pot(index)
+    
+    def set_pot_vjoy_axis(self, index, axis_name):
+        """Set vJoy axis mapping for a pot (None to unmap)"""
+        if 0 <= index < len(self.pot_config):
+            # Unknown names are stored as unmapped so the hot path never has to check
+            if axis_name not in VJOY_AXIS_FIELDS:
+                axis_name = None
+            self.pot_config[index]['vjoy_axis'] = axis_name
+            self._sync_pot(index)
+    
+    def set_pot_button_id(self, index, button_id):
+        """Set vJoy button mapping for a pot (None to unmap)"""
+        if 0 <= index < len(self.pot_config):
+            self.pot_config[index]['button_id'] = button_id
+            self._sync_pot(index)
+    
+    def update_pot(self, index, values):
+        """Set several pot_config fields at once, syncing the arrays a single time"""
+        if not 0 <= index < len(self.pot_config):
+            return
+        config = self.pot_config[index]
+        values = dict(values)
+        
+        # Same validation as the individual setters
+        if values.get('type', config['type']) not in self.CONTROL_TYPES:
+            del values['type']
+        if 'vjoy_axis' in values and values['vjoy_axis'] not in VJOY_AXIS_FIELDS:
+            values['vjoy_axis'] = None
+        if 'invert' in values:
+            values['invert'] = bool(values['invert'])
+        
+        config.update(values)
+        config['type_id'] = POT_TYPE_IDS[config['type']]
+        self._sync_pot(index)
     
     def process_pot_value(self, index, raw_value):
         """Process a pot value based on its configuration"""
         if index < 0 or index >= len(self.pot_config):
             return 0
         
-        config = self.pot_config[index]
-        
-        # Skip disabled controls
-        if config['type'] == "Disabled":
-            return 0
-        
-        # Ensure raw_value is within expected range
-        raw_value = max(0, min(1023, raw_value))
-        
-        # Apply calibration
-        cal_min = config['calibrated_min']
-        cal_max = config['calibrated_max']
-        
-        # Ensure calibration values are valid
-        if cal_min >= cal_max:
-            # Default to full range if calibration is invalid
-            cal_min = 0
-            cal_max = 1023
-        
-        # Map from calibrated min to max
-        if cal_max == cal_min:  # Avoid division by zero
-            calibrated = 50
-        else:
-            # Map from calibrated min to max
-            calibrated = (raw_value - cal_min) / (cal_max - cal_min) * 100
-            calibrated = max(0, min(100, calibrated))
-        
-        # Apply inversion if needed
-        if config['invert']:
-            calibrated = 100 - calibrated
-        
-        # Process based on type
-        if config['type'] == "Axis":
-            return calibrated
-        elif config['type'] == "Switch" or config['type'] == "Button":
-            return 100 if calibrated > config['threshold'] else 0
-        
-        return calibrated
+        return _pot_kernel(raw_value, self.cal_offsets[index], self.cal_scales[index],
+                           self.inverts[index], self.type_ids[index], self.thresholds[index])
+    
+    def process_all(self, pot_values, out=None):
+        """Process a whole frame of pot values in one pass over the arrays.
+        
+        Results are written into out (a list, reused in place) when given.
+        """
+        # map() stops at the shortest input, so extra values are ignored
+        results = map(_pot_kernel, pot_values, self.cal_offsets, self.cal_scales,
+                      self.inverts, self.type_ids, self.thresholds)
+        if out is None:
+            return list(results)
+        out[:] = results
+        return out
 
 class FlightControls:
     def __init__(self):
@@ -140,6 +463,10 @@ class FlightControls:
         self.gamepad = vg.VX360Gamepad()  # Main gamepad for all games
         self.current_profile = ControlProfile.MSFS
         
+        # Whether buttons can be written through the lButtons bitfield; probed
+        # once below and cleared if a later write fails, after which set_button is used
+        self.vjoy_bitfield = False
+        
         # Initialize vJoy with better error checking
         try:
             self.vjoy_dev = pyvjoy.VJoyDevice(1)  # Use device ID 1
@@ -157,17 +484,33 @@ class FlightControls:
             print(f"Z Axis (Mixture): {self.vjoy_dev.data.wAxisZ}")
             print(f"XRot Axis (Reverse Thrust): {self.vjoy_dev.data.wAxisXRot}")
             
+            # Probe the button bitfield by writing its current value back
+            try:
+                self.vjoy_dev.data.lButtons = self.vjoy_dev.data.lButtons
+                self.vjoy_bitfield = True
+            except Exception as bit_error:
+                print(f"vJoy lButtons not writable, using set_button: {str(bit_error)}")
+            
         except Exception as e:
             print(f"vJoy error: {str(e)}")
             self.vjoy_dev = None
+        
+        # Debug output from the mapping hot path, rate limited when enabled
+        self._debug = False
+        self._last_dbg = 0.0
+        # Occasional per-pot prints from process_control_panel
+        self.control_panel_debug = False
+        
+        # Packer for writing the throttle axes into the vJoy struct in one call
+        self._throttle_axes_pack = self._find_throttle_axes_pack()
             
         # Calibration values for each control
-        self.calibration = {
-            'throttle': {'min': 0, 'max': 100, 'idle': 0},  # Forward thrust (idle to max)
-            'reverse': {'min': 0, 'max': 100, 'idle': 0},   # Reverse thrust (idle to max)
-            'prop': {'min': 0, 'max': 100, 'idle': 0},      # Changed to use idle point like throttle
-            'mixture': {'min': 0, 'max': 100, 'idle': 0}    # Changed to use idle point like throttle
-        }
+        self.calibration = SimpleNamespace(
+            throttle=CalEntry(),  # Forward thrust (idle to max)
+            reverse=CalEntry(),   # Reverse thrust (idle to max)
+            prop=CalEntry(),      # Changed to use idle point like throttle
+            mixture=CalEntry()    # Changed to use idle point like throttle
+        )
         
         # Axis inversion settings
         self.invert_axis = {
@@ -177,112 +520,142 @@ class FlightControls:
             'mixture': False
         }
         
+        # Xbox mapping per profile, built once instead of on every sample
+        self._mapping_functions = {
+            ControlProfile.MSFS: self.map_controls_msfs,
+            ControlProfile.DCS: self.map_controls_dcs,
+            ControlProfile.XPLANE: self.map_controls_xplane,
+            ControlProfile.IL2: self.map_controls_il2
+        }
+        
+        # Flat calibration/inversion parameters for the per-frame kernel;
+        # this also builds the specialised per-frame mapping function
+        self.refresh_calibration()
+        
         # Function mode for prop control
         self.prop_as_speedbrake = False
         
+        # Control panel output is only mapped to vJoy while controls are active
+        self.controls_active = True
+        
         # Add control panel configuration
         self.control_panel = ControlPanelConfig()
         
-        # Initialize button states
-        self.button_states = {}
-        self.last_pot_values = {}
-
-    def calibrate_simple(self, value, control_type):
-        """Simple calibration for prop and mixture"""
-        cal = self.calibration[control_type]
-        
-        # Ensure value is a float for calculations
-        value = float(value)
+        # Initialize button states, indexed by pot
+        self.reset_button_states()
         
-        # If value is below idle point, it's at minimum
-        if value <= cal['idle']:
-            return 0.0
+        # Reused output buffer for process_control_panel
+        self._processed_buf = [0.0] * len(self.control_panel.pot_config)
+
+    def reset_button_states(self):
+        """Clear switch toggle states and last threshold states for every pot"""
+        count = len(self.control_panel.pot_config)
+        if len(getattr(self, 'button_states', ())) == count:
+            # Clear in place so the lists keep their identity and nothing is reallocated
+            button_states = self.button_states
+            last_pot_values = self.last_pot_values
+            for i in range(count):
+                button_states[i] = 0
+                last_pot_values[i] = False
+        else:
+            self.button_states = [0] * count
+            self.last_pot_values = [False] * count
+
+    def load_button_states(self, saved_states):
+        """Restore switch toggle states saved as a list, or in the old keyed dict format"""
+        self.reset_button_states()
+        if isinstance(saved_states, dict):
+            # Old format used "pot_{i}_button_{id}" keys
+            saved_states = {int(key.split('_')[1]): state for key, state in saved_states.items()
+                            if key.startswith('pot_') and key.split('_')[1].isdigit()}
+            items = saved_states.items()
+        else:
+            items = enumerate(saved_states)
+        for i, state in items:
+            if 0 <= i < len(self.button_states):
+                self.button_states[i] = 1 if state else 0
+
+    def _find_throttle_axes_pack(self):
+        """Return (packer, offset) for wAxisX/Y/Z/XRot if they are contiguous longs, else None"""
+        if self.vjoy_dev is None:
+            return None
+        try:
+            import ctypes
+            data_type = type(self.vjoy_dev.data)
+            fields = [getattr(data_type, name) for name in ('wAxisX', 'wAxisY', 'wAxisZ', 'wAxisXRot')]
+            long_size = ctypes.sizeof(ctypes.c_long)
+            base = fields[0].offset
+            
+            # Only batch when the layout is exactly four back-to-back C longs
+            for i, field in enumerate(fields):
+                if field.size != long_size or field.offset != base + i * long_size:
+                    return None
+            return struct.Struct('4l'), base
+        except Exception as e:
+            print(f"vJoy axis layout check failed, using per-axis writes: {str(e)}")
+            return None
+
+    def refresh_calibration(self):
+        """Rebuild the cached kernel parameters - call after changing calibration or inversion"""
+        cal = self.calibration
+        inv = self.invert_axis
+        self._cal_params = (
+            cal.throttle.idle, cal.throttle.max,
+            cal.reverse.idle, cal.reverse.min,
+            cal.prop.idle, cal.prop.max,
+            cal.mixture.idle, cal.mixture.max,
+            inv['throttle'], inv['reverse'], inv['prop'], inv['mixture']
+        )
+        self._rebuild_frame_fn()
+
+    def _rebuild_frame_fn(self):
+        """Specialise apply_mapping for the current controller, profile and calibration"""
+        if self.controller_type == ControllerType.VJOY or self.current_profile == ControlProfile.WAR_THUNDER:
+            # For War Thunder or when vJoy is selected, use vJoy mapping
+            self._frame_fn = self.map_controls_vjoy
+            return
         
-        # Map from idle to max
-        if cal['max'] == cal['idle']:  # Avoid division by zero
-            return 100.0
-            
-        ratio = (value - cal['idle']) / (cal['max'] - cal['idle'])
-        ratio = max(0.0, min(1.0, ratio))  # Clamp between 0 and 1
-        return ratio * 100.0  # Map to 0 to 100
+        # For other profiles with Xbox controller, bake in the profile's mapper
+        # and the current calibration so a frame does no lookups
+        def frame(throttle_raw, prop_raw, mixture_raw,
+                  kernel=_calibrate_kernel, params=self._cal_params,
+                  mapper=self._mapping_functions[self.current_profile]):
+            forward, reverse, prop, mixture = kernel(throttle_raw, prop_raw, mixture_raw, params)
+            mapper(forward - reverse, prop, mixture)
+            return forward, reverse, prop, mixture
+        self._frame_fn = frame
+
+    def set_controller_type(self, controller_type):
+        """Select Xbox or vJoy output"""
+        self.controller_type = controller_type
+        self._rebuild_frame_fn()
+
+    def set_profile(self, profile):
+        """Select the game profile"""
+        self.current_profile = profile
+        self._rebuild_frame_fn()
 
     def calibrate_value(self, value, control_type):
         """Apply calibration to a raw value"""
-        cal = self.calibration[control_type]
+        cal = getattr(self.calibration, control_type)
         
         # Ensure value is a float for calculations
         value = float(value)
         
         # Map the value from the input range to the output range
-        if value <= cal['center']:
+        if value <= cal.center:
             # Map from min to center
-            if cal['center'] == cal['min']:  # Avoid division by zero
+            if cal.center == cal.min:  # Avoid division by zero
                 return 0.0
-            ratio = (value - cal['min']) / (cal['center'] - cal['min'])
+            ratio = (value - cal.min) / (cal.center - cal.min)
             return ratio * 50.0  # Map to 0 to 50
         else:
             # Map from center to max
-            if cal['max'] == cal['center']:  # Avoid division by zero
+            if cal.max == cal.center:  # Avoid division by zero
                 return 100.0
-            ratio = (value - cal['center']) / (cal['max'] - cal['center'])
+            ratio = (value - cal.center) / (cal.max - cal.center)
             return 50.0 + ratio * 50.0  # Map to 50 to 100
 
-    def calibrate_throttle(self, value):
-        """Apply calibration to throttle value"""
-        cal = self.calibration['throttle']
-        
-        # Ensure value is a float for calculations
-        value = float(value)
-        
-        # If value is below idle point, it's in reverse territory
-        if value <= cal['idle']:
-            return 0.0  # No forward thrust
-        
-        # Map from idle to max
-        if cal['max'] == cal['idle']:  # Avoid division by zero
-            return 100.0
-            
-        ratio = (value - cal['idle']) / (cal['max'] - cal['idle'])
-        ratio = max(0.0, min(1.0, ratio))  # Clamp between 0 and 1
-        return ratio * 100.0  # Map to 0 to 100
-    
-    def calibrate_reverse(self, value):
-        """Apply calibration to reverse value"""
-        cal = self.calibration['reverse']
-        
-        # Ensure value is a float for calculations
-        value = float(value)
-        
-        # If value is above idle point, it's in forward territory
-        if value >= cal['idle']:
-            return 0.0  # No reverse thrust
-        
-        # Map from min to idle
-        if cal['idle'] == cal['min']:  # Avoid division by zero
-            return 100.0
-            
-        ratio = (cal['idle'] - value) / (cal['idle'] - cal['min'])
-        ratio = max(0.0, min(1.0, ratio))  # Clamp between 0 and 1
-        return ratio * 100.0  # Map to 0 to 100
-
-    def process_throttle_input(self, raw_value):
-        """Process throttle input to determine forward and reverse values"""
-        # Calculate forward and reverse thrust
-        forward = self.calibrate_throttle(raw_value)
-        reverse = self.calibrate_reverse(raw_value)
-        
-        # Apply inversion if needed
-        forward = self.apply_inversion(forward, 'throttle')
-        reverse = self.apply_inversion(reverse, 'reverse')
-            
-        return forward, reverse
-
-    def apply_inversion(self, value, control_type):
-        """Apply axis inversion if enabled"""
-        if self.invert_axis[control_type]:
-            return 100 - value
-        return value
-
     def map_controls_msfs(self, throttle, prop, mixture):
         # MSFS mapping
         if throttle >= 0:
@@ -325,90 +698,12 @@ class FlightControls:
         self.gamepad.right_trigger(value=int((prop + 100) * 163.835))
         self.gamepad.left_joystick(y_value=int(throttle * 655.34 - 32768))
 
-    def map_controls_war_thunder(self, throttle_raw, prop_raw, mixture_raw):
-        if self.vjoy_dev is None:
-            return 0, 0, 0, 0
-            
-        try:
-            # Process throttle to get forward and reverse values
-            forward_throttle, reverse_throttle = self.process_throttle_input(throttle_raw)
-            
-            # Process prop and mixture
-            if self.prop_as_speedbrake:
-                # When prop is used as speedbrake, we want 0 at idle and 100 at max deflection
-                prop = self.calibrate_simple(prop_raw, 'prop')
-                prop = self.apply_inversion(prop, 'prop')
-            else:
-                # Normal prop control
-                prop = self.calibrate_simple(prop_raw, 'prop')
-                prop = self.apply_inversion(prop, 'prop')
-                
-            mixture = self.calibrate_simple(mixture_raw, 'mixture')
-            mixture = self.apply_inversion(mixture, 'mixture')
-            
-            # Map forward throttle to X axis (0-32768)
-            forward_value = int(forward_throttle * 327.68)  # 0-100 to 0-32768
-            forward_value = max(0, min(32768, forward_value))
-            self.vjoy_dev.data.wAxisX = forward_value
-            
-            # Map reverse throttle to XRot axis (0-32768)
-            reverse_value = int(reverse_throttle * 327.68)  # 0-100 to 0-32768
-            reverse_value = max(0, min(32768, reverse_value))
-            self.vjoy_dev.data.wAxisXRot = reverse_value
-            
-            # Map prop to Y axis (0-32768)
-            prop_value = int(prop * 327.68)  # 0,100 to 0,32768
-            prop_value = max(0, min(32768, prop_value))
-            self.vjoy_dev.data.wAxisY = prop_value
-            
-            # Map mixture to Z axis (0-32768)
-            mixture_value = int(mixture * 327.68)  # 0,100 to 0,32768
-            mixture_value = max(0, min(32768, mixture_value))
-            self.vjoy_dev.data.wAxisZ = mixture_value
-            
-            # Update all axes at once
-            self.vjoy_dev.update()
-            
-            # Print debug values occasionally
-            if forward_value % 1000 == 0 or reverse_value % 1000 == 0:
-                print(f"vJoy values - Forward: {forward_value}, Reverse: {reverse_value}, Prop/Speedbrake: {prop_value}, Mix: {mixture_value}")
-                
-            return forward_throttle, reverse_throttle, prop, mixture
-                
-        except Exception as e:
-            print(f"vJoy update error: {str(e)}")
-            return 0, 0, 0, 0
-
     def apply_mapping(self, throttle_raw, prop_raw, mixture_raw):
-        # Apply calibration to prop and mixture using the simpler method
-        prop = self.calibrate_simple(prop_raw, 'prop')
-        mixture = self.calibrate_simple(mixture_raw, 'mixture')
-        
-        # Apply axis inversion to prop and mixture
-        prop = self.apply_inversion(prop, 'prop')
-        mixture = self.apply_inversion(mixture, 'mixture')
-        
-        # For War Thunder or when vJoy is selected, use vJoy mapping
-        if self.controller_type == ControllerType.VJOY or self.current_profile == ControlProfile.WAR_THUNDER:
-            return self.map_controls_vjoy(throttle_raw, prop_raw, mixture_raw)
-        else:
-            # For other profiles with Xbox controller, use the appropriate mapping
-            mapping_functions = {
-                ControlProfile.MSFS: self.map_controls_msfs,
-                ControlProfile.DCS: self.map_controls_dcs,
-                ControlProfile.XPLANE: self.map_controls_xplane,
-                ControlProfile.IL2: self.map_controls_il2
-            }
-            
-            # Process throttle here for Xbox controller
-            forward, reverse = self.process_throttle_input(throttle_raw)
-            mapping_functions[self.current_profile](forward - reverse, prop, mixture)
-            return forward, reverse, prop, mixture
+        # Dispatch straight to the function specialised by _rebuild_frame_fn
+        return self._frame_fn(throttle_raw, prop_raw, mixture_raw)
     
     def next_profile(self):
-        profiles = list(ControlProfile)
-        current_index = profiles.index(self.current_profile)
-        self.current_profile = profiles[(current_index + 1) % len(profiles)]
+        self.set_profile(_NEXT_PROFILE[self.current_profile])
         return self.current_profile
 
     def map_controls_vjoy(self, throttle_raw, prop_raw, mixture_raw):
@@ -417,48 +712,37 @@ class FlightControls:
             return 0, 0, 0, 0
             
         try:
-            # Process throttle to get forward and reverse values
-            forward_throttle, reverse_throttle = self.process_throttle_input(throttle_raw)
-            
-            # Process prop and mixture
-            if self.prop_as_speedbrake:
-                # When prop is used as speedbrake, we want 0 at idle and 100 at max deflection
-                prop = self.calibrate_simple(prop_raw, 'prop')
-                prop = self.apply_inversion(prop, 'prop')
+            # Calibrate all controls in one pass. In speedbrake mode the prop
+            # already reads 0 at idle and 100 at max deflection.
+            forward_throttle, reverse_throttle, prop, mixture = _calibrate_kernel(
+                throttle_raw, prop_raw, mixture_raw, self._cal_params)
+            
+            # Scale to vJoy axis range (0-32768)
+            forward_value = _to_axis(forward_throttle)  # X axis
+            reverse_value = _to_axis(reverse_throttle)  # XRot axis
+            prop_value = _to_axis(prop)  # Y axis
+            mixture_value = _to_axis(mixture)  # Z axis
+            
+            # Write X, Y, Z and XRot in one pack when the struct layout allows it
+            if self._throttle_axes_pack is not None:
+                packer, offset = self._throttle_axes_pack
+                packer.pack_into(self.vjoy_dev.data, offset, forward_value, prop_value, mixture_value, reverse_value)
             else:
-                # Normal prop control
-                prop = self.calibrate_simple(prop_raw, 'prop')
-                prop = self.apply_inversion(prop, 'prop')
-                
-            mixture = self.calibrate_simple(mixture_raw, 'mixture')
-            mixture = self.apply_inversion(mixture, 'mixture')
-            
-            # Map forward throttle to X axis (0-32768)
-            forward_value = int(forward_throttle * 327.68)  # 0-100 to 0-32768
-            forward_value = max(0, min(32768, forward_value))
-            self.vjoy_dev.data.wAxisX = forward_value
-            
-            # Map reverse throttle to XRot axis (0-32768)
-            reverse_value = int(reverse_throttle * 327.68)  # 0-100 to 0-32768
-            reverse_value = max(0, min(32768, reverse_value))
-            self.vjoy_dev.data.wAxisXRot = reverse_value
-            
-            # Map prop to Y axis (0-32768)
-            prop_value = int(prop * 327.68)  # 0,100 to 0,32768
-            prop_value = max(0, min(32768, prop_value))
-            self.vjoy_dev.data.wAxisY = prop_value
-            
-            # Map mixture to Z axis (0-32768)
-            mixture_value = int(mixture * 327.68)  # 0,100 to 0,32768
-            mixture_value = max(0, min(32768, mixture_value))
-            self.vjoy_dev.data.wAxisZ = mixture_value
+                data = self.vjoy_dev.data
+                data.wAxisX = forward_value
+                data.wAxisY = prop_value
+                data.wAxisZ = mixture_value
+                data.wAxisXRot = reverse_value
             
             # Update all axes at once
             self.vjoy_dev.update()
             
-            # Print debug values occasionally
-            if forward_value % 1000 == 0 or reverse_value % 1000 == 0:
-                print(f"vJoy values - Forward: {forward_value}, Reverse: {reverse_value}, Prop/Speedbrake: {prop_value}, Mix: {mixture_value}")
+            # Print debug values at most twice a second, and only when debugging
+            if self._debug:
+                now = time.monotonic()
+                if now - self._last_dbg > 0.5:
+                    self._last_dbg = now
+                    print(f"vJoy values - Forward: {forward_value}, Reverse: {reverse_value}, Prop/Speedbrake: {prop_value}, Mix: {mixture_value}")
                 
             return forward_throttle, reverse_throttle, prop, mixture
                 
@@ -467,146 +751,141 @@ class FlightControls:
             return 0, 0, 0, 0
 
     def process_control_panel(self, pot_values):
-        """Process control panel pot values and map to vJoy if needed"""
+        """Process control panel pot values and map to vJoy if needed.
+        
+        The returned list is reused on the next call - copy it to keep it.
+        """
         if self.vjoy_dev is None:
             return pot_values
         
-        processed_values = []
-        
-        # Check if controls are active
-        controls_active = True
-        if hasattr(self, 'controls_active'):
-            controls_active = self.controls_active
-        
-        # Initialize button states dictionary if it doesn't exist
-        if not hasattr(self, 'button_states'):
-            self.button_states = {}
-        
-        # Initialize last pot values dictionary if it doesn't exist
-        if not hasattr(self, 'last_pot_values'):
-            self.last_pot_values = {}
-        
-        for i, raw_value in enumerate(pot_values):
-            if i >= len(self.control_panel.pot_config):
-                break
-                
-            config = self.control_panel.pot_config[i]
-            
-            # Skip processing if the value is invalid
+        # Plain attribute read; this runs on the serial thread, which must not call into Tcl
+        debug_on = self.control_panel_debug
+        
+        panel = self.control_panel
+        
+        # Treat invalid values as 0 for the batch pass, then zero their outputs
+        has_invalid = None in pot_values
+        raw_values = [0 if v is None else v for v in pot_values] if has_invalid else pot_values
+        processed_values = panel.process_all(raw_values, self._processed_buf)
+        if has_invalid:
+            for i in range(len(processed_values)):
+                if pot_values[i] is None:
+                    processed_values[i] = 0
+        
+        # Only the vJoy dispatch remains per pot, and only when controls are active
+        type_ids = panel.type_ids
+        vjoy_axes = panel.vjoy_axes
+        axis_setters = panel.axis_setters
+        button_ids = panel.button_ids
+        button_masks = panel.button_masks
+        thresholds = panel.thresholds
+        data = self.vjoy_dev.data
+        
+        # Button bits owned by the pots this frame, and which of them are pressed
+        care_mask = 0
+        set_mask = 0
+        
+        dispatch_count = len(processed_values) if self.controls_active else 0
+        for i in range(dispatch_count):
+            raw_value = pot_values[i]
+            
+            # Skip mapping if the value is invalid
             if raw_value is None:
-                processed_values.append(0)
                 continue
-                
-            processed = self.control_panel.process_pot_value(i, raw_value)
-            processed_values.append(processed)
             
-            # Only map to vJoy if controls are active
-            if not controls_active:
-                continue
+            processed = processed_values[i]
+            type_id = type_ids[i]
             
             # Map to vJoy if configured as an axis
-            if config['type'] == "Axis" and config['vjoy_axis'] is not None:
+            if type_id == POT_TYPE_AXIS and axis_setters[i] is not None:
                 # Map 0-100 to 0-32768
-                axis_value = int(processed * 327.68)
+                axis_value = _to_axis(processed)
                 
                 # Print debug info occasionally
-                if int(raw_value) % 500 == 0 and hasattr(self, 'control_panel_debug_var') and self.control_panel_debug_var.get():
-                    print(f"Mapping pot {i} ({config['name']}) to vJoy {config['vjoy_axis']} axis: {axis_value}")
+                if debug_on and int(raw_value) % 500 == 0:
+                    print(f"Mapping pot {i} ({panel.pot_config[i]['name']}) to vJoy {vjoy_axes[i]} axis: {axis_value}")
                 
-                # Set the appropriate axis
-                try:
-                    if config['vjoy_axis'] == "X":
-                        self.vjoy_dev.data.wAxisX = axis_value
-                    elif config['vjoy_axis'] == "Y":
-                        self.vjoy_dev.data.wAxisY = axis_value
-                    elif config['vjoy_axis'] == "Z":
-                        self.vjoy_dev.data.wAxisZ = axis_value
-                    elif config['vjoy_axis'] == "RX":
-                        self.vjoy_dev.data.wAxisXRot = axis_value
-                    elif config['vjoy_axis'] == "RY":
-                        self.vjoy_dev.data.wAxisYRot = axis_value
-                    elif config['vjoy_axis'] == "RZ":
-                        self.vjoy_dev.data.wAxisZRot = axis_value
-                    elif config['vjoy_axis'] == "SL0":
-                        self.vjoy_dev.data.wSlider = axis_value
-                    elif config['vjoy_axis'] == "SL1":
-                        self.vjoy_dev.data.wDial = axis_value
-                except Exception as e:
-                    print(f"Error setting vJoy axis {config['vjoy_axis']}: {str(e)}")
+                # Set the appropriate axis (names were validated when configured)
+                axis_setters[i](data, axis_value)
             
             # Handle button/switch mapping
-            elif (config['type'] == "Switch" or config['type'] == "Button") and config['button_id'] is not None:
+            elif (type_id == POT_TYPE_SWITCH or type_id == POT_TYPE_BUTTON) and button_ids[i] is not None:
+                config = panel.pot_config[i]
                 try:
                     # Get button ID
-                    button_id = int(config['button_id'])
-                    
-                    # Create a unique key for this pot/button combination
-                    button_key = f"pot_{i}_button_{button_id}"
+                    button_id = button_ids[i]
                     
                     # Get the current threshold state (above or below threshold)
-                    current_threshold_state = processed > config['threshold']
+                    current_threshold_state = processed > thresholds[i]
                     
                     # Get the previous threshold state
-                    previous_threshold_state = self.last_pot_values.get(button_key, False)
+                    previous_threshold_state = self.last_pot_values[i]
                     
                     # Determine button state based on control type
-                    if config['type'] == "Switch":
+                    if type_id == POT_TYPE_SWITCH:
                         # For Switch type, toggle the button state when crossing the threshold
                         if current_threshold_state != previous_threshold_state:
                             if current_threshold_state:  # Only toggle when crossing from below to above threshold
                                 # Toggle the button state
-                                current_button_state = self.button_states.get(button_key, 0)
+                                current_button_state = self.button_states[i]
                                 new_button_state = 1 if current_button_state == 0 else 0
-                                self.button_states[button_key] = new_button_state
+                                self.button_states[i] = new_button_state
                                 
                                 # Print debug info
-                                if hasattr(self, 'control_panel_debug_var') and self.control_panel_debug_var.get():
+                                if debug_on:
                                     print(f"Switch {i} ({config['name']}) toggled to {new_button_state}")
                         
                         # Use the stored button state
-                        button_state = self.button_states.get(button_key, 0)
+                        button_state = self.button_states[i]
                     else:  # Button type
                         # For Button type, directly use the threshold state
                         button_state = 1 if current_threshold_state else 0
                         
                         # Store the button state
-                        self.button_states[button_key] = button_state
+                        self.button_states[i] = button_state
                     
                     # Store the current threshold state for next time
-                    self.last_pot_values[button_key] = current_threshold_state
+                    self.last_pot_values[i] = current_threshold_state
                     
                     # Print debug info occasionally
-                    if int(raw_value) % 500 == 0 and hasattr(self, 'control_panel_debug_var') and self.control_panel_debug_var.get():
+                    if debug_on and int(raw_value) % 500 == 0:
                         print(f"Pot {i} ({config['name']}) as {config['type']} mapped to button {button_id}: {button_state}")
                     
-                    # Try to set the button using direct bit manipulation
-                    try:
-                        # Calculate which bit to set
-                        bit_position = button_id - 1
-                        button_mask = 1 << bit_position
-                        
-                        # Get current button state
-                        current_buttons = self.vjoy_dev.data.lButtons
-                        
-                        # Set or clear the button bit
-                        if button_state:
-                            self.vjoy_dev.data.lButtons = current_buttons | button_mask
-                        else:
-                            self.vjoy_dev.data.lButtons = current_buttons & ~button_mask
-                    except Exception as bit_error:
-                        if hasattr(self, 'control_panel_debug_var') and self.control_panel_debug_var.get():
-                            print(f"Error setting button bit: {str(bit_error)}")
-                        
-                        # Fall back to standard method
-                        try:
-                            self.vjoy_dev.set_button(button_id, button_state)
-                        except Exception as button_error:
-                            if hasattr(self, 'control_panel_debug_var') and self.control_panel_debug_var.get():
-                                print(f"Error setting button {button_id}: {str(button_error)}")
+                    # Collect the bit; lButtons is written once after the loop
+                    button_mask = button_masks[i]
+                    care_mask |= button_mask
+                    if button_state:
+                        set_mask |= button_mask
                 except Exception as e:
-                    if hasattr(self, 'control_panel_debug_var') and self.control_panel_debug_var.get():
+                    if debug_on:
                         print(f"Error processing button mapping for pot {i}: {str(e)}")
         
+        # Write all mapped button bits lButtons can hold in a single read-modify-write
+        low_mask = care_mask & _LBUTTONS_BITS
+        if low_mask and self.vjoy_bitfield:
+            try:
+                data.lButtons = (data.lButtons & ~low_mask) | (set_mask & low_mask)
+            except Exception as bit_error:
+                if debug_on:
+                    print(f"Error setting button bits: {str(bit_error)}")
+                # Don't try the bitfield again
+                self.vjoy_bitfield = False
+        
+        # Standard method, one button at a time, for ids above 32 and for
+        # everything once the bitfield has failed
+        remaining = care_mask if not self.vjoy_bitfield else care_mask & ~_LBUTTONS_BITS
+        if remaining:
+            for i in range(dispatch_count):
+                button_mask = button_masks[i]
+                if button_mask & remaining:
+                    # Clear it so a button shared by several pots is only sent once
+                    remaining &= ~button_mask
+                    try:
+                        self.vjoy_dev.set_button(button_ids[i], 1 if set_mask & button_mask else 0)
+                    except Exception as button_error:
+                        if debug_on:
+                            print(f"Error setting button {button_ids[i]}: {str(button_error)}")
+        
         # Update vJoy device with all changes at once
         try:
             self.vjoy_dev.update()
@@ -615,7 +894,145 @@ class FlightControls:
         
         return processed_values
 
+@lru_cache(maxsize=1)
+def _vjoy_dll_paths():
+    """Places to look for vJoyInterface.dll, worked out once per run"""
+    paths = [
+        "vJoyInterface.dll",  # Normal DLL search path
+        os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), "vJoy", "x64", "vJoyInterface.dll"),
+        os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), "vJoy", "x86", "vJoyInterface.dll")
+    ]
+    
+    # The copy bundled next to pyvjoy, if its location is known
+    pyvjoy_file = getattr(pyvjoy, '__file__', None)
+    if pyvjoy_file:
+        paths.append(os.path.join(os.path.dirname(pyvjoy_file), "vJoyInterface.dll"))
+    return tuple(paths)
+
+# type -> (dir() names, button-related names, axis-related names), see _introspect
+_INTROSPECTION_CACHE = {}
+
+def _introspect(obj):
+    """Return obj's dir() listing and its button/axis related names, cached per type"""
+    key = type(obj)
+    cached = _INTROSPECTION_CACHE.get(key)
+    if cached is None:
+        names = tuple(dir(obj))
+        lowered = [name.lower() for name in names]
+        cached = _INTROSPECTION_CACHE[key] = (
+            names,
+            tuple(name for name, low in zip(names, lowered) if 'button' in low),
+            tuple(name for name, low in zip(names, lowered) if 'axis' in low)
+        )
+    return cached
+
+def _remaining_ms(delay_ms, started):
+    """Milliseconds left of delay_ms counted from a time.perf_counter() start"""
+    return max(0, round(delay_ms - (time.perf_counter() - started) * 1000))
+
+def _needs_vjoy(method):
+    """Decorator for GUI tools that only make sense with a vJoy device"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if getattr(self.controls, 'vjoy_dev', None) is None:
+            self.log_debug("vJoy device not available")
+            return
+        return method(self, *args, **kwargs)
+    return wrapper
+
+@lru_cache(maxsize=4)
+def _cached_source(func):
+    """Return the source of a function, read and parsed only once"""
+    import inspect
+    return inspect.getsource(func)
+
+@lru_cache(maxsize=32)
+def _build_mapping_text(controller_type, profile, prop_as_speedbrake):
+    """Return the mapping description for a controller type, profile and prop mode"""
+    # Define mappings for all profiles
+    prop_text = "Speedbrake/Spoilers" if prop_as_speedbrake else "Prop"
+    
+    # Different mappings based on controller type
+    if controller_type == ControllerType.VJOY:
+        # vJoy mappings are the same for all profiles
+        mapping = f"""vJoy Device Mapping:
+Forward Thrust: vJoy X-Axis
+Reverse Thrust: vJoy XRot-Axis
+{prop_text}: vJoy Y-Axis
+Mixture: vJoy Z-Axis
+
+Note: In your simulator's controls:
+1. Select 'vJoy Device' in controller options
+2. Bind axes as follows:
+   - Forward Throttle -> X Axis
+   - Reverse Throttle -> XRot Axis
+   - {prop_text} -> Y Axis
+   - Mixture -> Z Axis"""
+    else:
+        # Xbox controller mappings vary by profile
+        mappings = {
+            ControlProfile.MSFS: f"""Throttle: Right/Left Triggers
+{prop_text}: Right Stick Y
+Mixture: Left Stick Y""",
+            
+            ControlProfile.DCS: f"""Throttle: Left Stick Y
+{prop_text}: Left Stick X
+Mixture: Right Stick Y""",
+            
+            ControlProfile.XPLANE: f"""Throttle: Right/Left Triggers
+{prop_text}: Right Stick Y
+Mixture: Right Stick X""",
+            
+            ControlProfile.IL2: f"""Throttle: Left Stick Y
+{prop_text}: Right Trigger
+Mixture: Left Trigger""",
+            
+            ControlProfile.WAR_THUNDER: f"""War Thunder Setup (Xbox):
+Throttle: Right/Left Triggers
+{prop_text}: Right Stick Y
+Mixture: Left Stick Y"""
+        }
+        
+        # Get mapping for current profile, or use default text if not found
+        mapping = mappings.get(
+            profile,
+            "Profile mapping not defined"
+        )
+    
+    return mapping
+
 class FlightControlGUI:
+    # Slot of each control in last_raw_values
+    _RAW_IDX = {'throttle': 0, 'reverse': 1, 'prop': 2, 'mixture': 3}
+    # Flags saved to the settings file: (json key, FlightControls attribute or
+    # (dict attribute, key), GUI variable to refresh or None)
+    _SETTINGS_MAP = (
+        ("throttle_inversion", ("invert_axis", "throttle"), "throttle_invert_var"),
+        ("prop_inversion", ("invert_axis", "prop"), "prop_invert_var"),
+        ("mixture_inversion", ("invert_axis", "mixture"), "mixture_invert_var"),
+        ("reverse_inversion", ("invert_axis", "reverse"), "reverse_invert_var"),
+        ("speedbrake_mode", "prop_as_speedbrake", "speedbrake_mode_var"),
+        ("controls_active", "controls_active", None)
+    )
+    # Controls whose calibration is saved as "<control>_calibration"
+    _CALIBRATION_SETTINGS = ('throttle', 'reverse', 'prop', 'mixture')
+    # Per-pot settings: (json key, pot_config key, PotUIState variable or None,
+    # value shown in the UI for None)
+    _POT_SETTINGS_MAP = (
+        ("name", "name", "name", ""),
+        ("type", "type", "type", ""),
+        ("threshold", "threshold", "threshold", 0),
+        ("inversion", "invert", "invert", False),
+        ("min", "calibrated_min", None, None),
+        ("max", "calibrated_max", None, None),
+        ("vjoy_axis", "vjoy_axis", "axis", "None"),
+        ("button_id", "button_id", "button", "")
+    )
+    # Lines kept in the debug window
+    _DEBUG_MAX_LINES = 2000
+    # Button styles used by the UI
+    BTN_STYLES = {'primary': 'primary.TButton', 'secondary': 'secondary.Outline.TButton'}
+    
     def __init__(self):
         # Use ttkbootstrap instead of regular tk
         self.root = ttk.Window(
@@ -624,32 +1041,78 @@ class FlightControlGUI:
         self.root.title("Flight Control Panel")
         self.root.geometry("800x600")
         
-        # Add a style configuration
+        # Add a style configuration, building the button styles once up front
+        # rather than on first use during widget creation
         self.style = ttk.Style()
+        for style_name in self.BTN_STYLES.values():
+            self.style.configure(style_name)
         
         self.controls = FlightControls()
         self.running = True
-        self.values_queue = queue.Queue()
+        # Latest-sample-only handoff from the serial threads to the GUI;
+        # deque append/popleft are atomic, and older samples just drop off
+        self.values_queue = deque(maxlen=1)
+        self.panel_queue = deque(maxlen=1)
+        self._last_displayed = None  # Last sample drawn by update_gui
+        self._update_pending = False  # An update_gui call is already scheduled
+        self._label_cache = {}  # Last text/value pushed to each hot widget
+        self._cal_status_built = False  # Calibration status labels exist
+        self._last_err_log = 0.0  # Last time a serial loop traceback was printed
+        self._debug_queue = deque(maxlen=1000)  # Debug lines waiting to be written
+        self._debug_flush_scheduled = False
+        self._pending_status = {}  # Status variable name -> (variable, text) waiting for _flush_status
+        self._status_flush_scheduled = False
+        # Swapped for _real_log_debug by toggle_debug
+        self.log_debug = self._noop_log_debug
+        self.debug_mode = False
+        self.debug_window = None
+        self.debug_text = None
+        self._last_mapping_text = None  # Text currently in the mapping box
+        self._status_reset_after_id = None  # Pending status label reset
+        self._save_settings_after_id = None  # Pending debounced settings save
+        self._last_axis_mapping = {}  # Pot index -> (axis, pot value) last applied
+        self._vjoy_methods_cache = None  # (device, dir() names, button methods) for the button test
+        self._vjoy_report_cache = {}  # (report, device type, data type) -> vJoy inspection results
+        # vJoyInterface.dll and its functions, loaded on first use by _ensure_vjoy_dll
+        self._vjoy_dll_lock = threading.Lock()
+        self._vjoy_dll = None
+        self._vjoy_set_btn = None
+        self._vjoy_get_btn = None
+        self._vjoy_enabled = None
+        self._vjoy_get_version = None
+        self.calibration_window = None
+        # Test windows are hidden on close and shown again on the next open
+        self._cp_mapping_window = None
+        self._toggle_test_window = None
+        self._calibration_open = False  # Cleared by the window's <Destroy> binding
+        self._calib_dirty = False  # New control panel values since the last redraw
+        self._calib_pending = False  # A calibration redraw is already scheduled
+        self._last_rendered_values = None  # Values currently drawn on the calibration canvas
+        # Set to stop the serial reader threads
+        self._serial_stop = threading.Event()
+        self._control_panel_stop = threading.Event()
+        self._serial_thread = None
+        self._control_panel_thread = None
         self.controls_active = True
         
         # Default COM port
         self.com_port = "COM11"
         
-        # Store last raw values for calibration
-        self.last_raw_values = {
-            'throttle': 0,
-            'reverse': 0,  # Same as throttle but used for reverse calibration
-            'prop': 0,
-            'mixture': 0
-        }
+        # Store last raw values for calibration, indexed through _RAW_IDX
+        # (reverse is the same as throttle but used for reverse calibration)
+        self.last_raw_values = array('d', [0.0] * 4)
         
-        # Store last raw values for control panel
-        self.last_control_panel_values = [0] * 7
+        # Store last raw values for control panel as unboxed C floats
+        self.last_control_panel_values = array('f', [0.0] * 7)
         
         # Add a second COM port for control panel
         self.control_panel_com_port = "COM12"  # Default, can be changed by user
+        self.control_panel_baud_rate = 115200
         
-        # Create system tray icon
+        # Create system tray icon (imported here so headless use of the
+        # controller classes doesn't pay for PIL/pystray)
+        import pystray
+        from PIL import Image
         self.icon = Image.new('RGB', (64, 64), color='red')
         self.tray_icon = pystray.Icon("flight_controls", self.icon, "Flight Controls", self.create_tray_menu())
         
@@ -661,17 +1124,20 @@ class FlightControlGUI:
         self.pot_frames = []
         
         # Initialize other control panel variables
-        self.pot_name_vars = []
-        self.pot_type_vars = []
-        self.pot_inversion_vars = []
-        self.pot_threshold_vars = []
-        self.pot_axis_vars = []
-        self.pot_button_vars = []
+        self.pot_ui_states = []  # One PotUIState per pot
+        self._threshold_pending = {}  # Pot index -> threshold dragged to since the last flush
+        self._threshold_flush_pending = False
         
         self.create_widgets()
         self.start_serial_thread()
+        self.update_gui()
+        
+        # Also start the control panel thread
+        self.start_control_panel_thread()
         
     def create_widgets(self):
+        controls = self.controls
+        
         # Update the notebook style
         self.style.configure('TNotebook', tabposition='nw')
         self.style.configure('TNotebook.Tab', padding=[10, 5])
@@ -716,14 +1182,14 @@ class FlightControlGUI:
             port_frame, 
             text="Refresh", 
             command=refresh_ports,
-            style='secondary.Outline.TButton'
+            style=self.BTN_STYLES['secondary']
         ).pack(side=LEFT, padx=5)
         
         ttk.Button(
             port_frame, 
             text="Connect",
             command=self.reconnect_serial,
-            style='primary.TButton'
+            style=self.BTN_STYLES['primary']
         ).pack(side=LEFT, padx=5)
         
         # Initialize port list
@@ -733,7 +1199,7 @@ class FlightControlGUI:
         profile_frame = ttk.LabelFrame(main_tab.scrolled_frame, text="Profile", padding=10)
         profile_frame.pack(fill='x', padx=5, pady=5)
         
-        self.profile_label = ttk.Label(profile_frame, text=self.controls.current_profile.value)
+        self.profile_label = ttk.Label(profile_frame, text=controls.current_profile.value)
         self.profile_label.pack(side='left', padx=5)
         
         ttk.Button(profile_frame, text="Change Profile", command=self.next_profile).pack(side='right', padx=5)
@@ -742,14 +1208,14 @@ class FlightControlGUI:
         controller_frame = ttk.LabelFrame(main_tab.scrolled_frame, text="Controller Type", padding=10)
         controller_frame.pack(fill='x', padx=5, pady=5)
         
-        self.controller_var = tk.StringVar(value=self.controls.controller_type.value)
+        self.controller_var = tk.StringVar(value=controls.controller_type.value)
         
         # Create radio buttons for controller selection
         ttk.Radiobutton(
             controller_frame,
             text="Xbox Controller",
             variable=self.controller_var,
-            value=ControllerType.XBOX.value,
+            value=_XBOX_V,
             command=self.set_controller_type
         ).pack(side='left', padx=20)
         
@@ -757,7 +1223,7 @@ class FlightControlGUI:
             controller_frame,
             text="vJoy Device",
             variable=self.controller_var,
-            value=ControllerType.VJOY.value,
+            value=_VJOY_V,
             command=self.set_controller_type
         ).pack(side='right', padx=20)
         
@@ -765,32 +1231,25 @@ class FlightControlGUI:
         values_frame = ttk.LabelFrame(main_tab.scrolled_frame, text="Control Values", padding=10)
         values_frame.pack(fill='both', expand=True, padx=5, pady=5)
         
-        # Throttle (now split into forward and reverse)
-        ttk.Label(values_frame, text="Forward Thrust:").grid(row=0, column=0, padx=5, pady=5)
-        self.forward_bar = ttk.Progressbar(values_frame, length=200, mode='determinate')
-        self.forward_bar.grid(row=0, column=1, padx=5, pady=5)
-        self.forward_label = ttk.Label(values_frame, text="0%")
-        self.forward_label.grid(row=0, column=2, padx=5, pady=5)
-        
-        ttk.Label(values_frame, text="Reverse Thrust:").grid(row=1, column=0, padx=5, pady=5)
-        self.reverse_bar = ttk.Progressbar(values_frame, length=200, mode='determinate')
-        self.reverse_bar.grid(row=1, column=1, padx=5, pady=5)
-        self.reverse_label = ttk.Label(values_frame, text="0%")
-        self.reverse_label.grid(row=1, column=2, padx=5, pady=5)
-        
-        # Prop
-        ttk.Label(values_frame, text="Prop:").grid(row=2, column=0, padx=5, pady=5)
-        self.prop_bar = ttk.Progressbar(values_frame, length=200, mode='determinate')
-        self.prop_bar.grid(row=2, column=1, padx=5, pady=5)
-        self.prop_label = ttk.Label(values_frame, text="0%")
-        self.prop_label.grid(row=2, column=2, padx=5, pady=5)
-        
-        # Mixture
-        ttk.Label(values_frame, text="Mixture:").grid(row=3, column=0, padx=5, pady=5)
-        self.mixture_bar = ttk.Progressbar(values_frame, length=200, mode='determinate')
-        self.mixture_bar.grid(row=3, column=1, padx=5, pady=5)
-        self.mixture_label = ttk.Label(values_frame, text="0%")
-        self.mixture_label.grid(row=3, column=2, padx=5, pady=5)
+        # One row per control: label, progress bar and percentage label.
+        # Throttle is split into forward and reverse.
+        value_rows = [
+            ("Forward Thrust:", 'forward'),
+            ("Reverse Thrust:", 'reverse'),
+            ("Prop:", 'prop'),
+            ("Mixture:", 'mixture')
+        ]
+        for row, (text, name) in enumerate(value_rows):
+            ttk.Label(values_frame, text=text).grid(row=row, column=0, padx=5, pady=5)
+            # The bar follows a DoubleVar so updates are a plain variable set
+            bar_var = tk.DoubleVar(value=0)
+            bar = ttk.Progressbar(values_frame, length=200, mode='determinate', variable=bar_var)
+            bar.grid(row=row, column=1, padx=5, pady=5)
+            label = ttk.Label(values_frame, text="0%")
+            label.grid(row=row, column=2, padx=5, pady=5)
+            setattr(self, f"{name}_var", bar_var)
+            setattr(self, f"{name}_bar", bar)
+            setattr(self, f"{name}_label", label)
         
         # Add calibration frame with better layout and instructions
         cal_frame = ttk.LabelFrame(main_tab.scrolled_frame, text="Calibration", padding=10)
@@ -813,34 +1272,19 @@ class FlightControlGUI:
         instruction_label = ttk.Label(cal_frame, text=instructions, justify='left')
         instruction_label.grid(row=0, column=0, columnspan=4, padx=5, pady=5, sticky='w')
         
-        # Throttle calibration
-        ttk.Label(cal_frame, text="Throttle:").grid(row=1, column=0, padx=5, pady=2, sticky='e')
-        ttk.Button(cal_frame, text="Set Idle Point", 
-                  command=lambda: self.set_idle_point('throttle')).grid(row=1, column=1, padx=5, pady=2)
-        ttk.Button(cal_frame, text="Set Max Forward", 
-                  command=lambda: self.set_max_forward()).grid(row=1, column=2, padx=5, pady=2)
-        
-        # Reverse calibration
-        ttk.Label(cal_frame, text="Reverse:").grid(row=2, column=0, padx=5, pady=2, sticky='e')
-        ttk.Button(cal_frame, text="Set Idle Point", 
-                  command=lambda: self.set_idle_point('reverse')).grid(row=2, column=1, padx=5, pady=2)
-        ttk.Button(cal_frame, text="Set Max Reverse", 
-                  command=lambda: self.set_max_reverse()).grid(row=2, column=2, padx=5, pady=2)
-        
-        # Prop calibration
-        prop_label_text = "Prop/Speedbrake:"
-        ttk.Label(cal_frame, text=prop_label_text).grid(row=3, column=0, padx=5, pady=2, sticky='e')
-        ttk.Button(cal_frame, text="Set Idle Point", 
-                  command=lambda: self.set_idle_point('prop')).grid(row=3, column=1, padx=5, pady=2)
-        ttk.Button(cal_frame, text="Set Max Position", 
-                  command=lambda: self.set_max_position('prop')).grid(row=3, column=2, padx=5, pady=2)
-        
-        # Mixture calibration
-        ttk.Label(cal_frame, text="Mixture:").grid(row=4, column=0, padx=5, pady=2, sticky='e')
-        ttk.Button(cal_frame, text="Set Idle Point", 
-                  command=lambda: self.set_idle_point('mixture')).grid(row=4, column=1, padx=5, pady=2)
-        ttk.Button(cal_frame, text="Set Max Position", 
-                  command=lambda: self.set_max_position('mixture')).grid(row=4, column=2, padx=5, pady=2)
+        # Calibration buttons per control: (label, control, max button text, max command)
+        cal_rows = [
+            ("Throttle:", 'throttle', "Set Max Forward", self.set_max_forward),
+            ("Reverse:", 'reverse', "Set Max Reverse", self.set_max_reverse),
+            ("Prop/Speedbrake:", 'prop', "Set Max Position", partial(self.set_max_position, 'prop')),
+            ("Mixture:", 'mixture', "Set Max Position", partial(self.set_max_position, 'mixture'))
+        ]
+        for row, (text, control_type, max_text, max_command) in enumerate(cal_rows, start=1):
+            ttk.Label(cal_frame, text=text).grid(row=row, column=0, padx=5, pady=2, sticky='e')
+            ttk.Button(cal_frame, text="Set Idle Point", 
+                      command=partial(self.set_idle_point, control_type)).grid(row=row, column=1, padx=5, pady=2)
+            ttk.Button(cal_frame, text=max_text, 
+                      command=max_command).grid(row=row, column=2, padx=5, pady=2)
         
         # Reset button
         ttk.Button(cal_frame, text="Reset All Calibration", 
@@ -850,41 +1294,9 @@ class FlightControlGUI:
         self.cal_status_frame = ttk.LabelFrame(main_tab.scrolled_frame, text="Calibration Status", padding=10)
         self.cal_status_frame.pack(fill='x', padx=5, pady=5)
         
-        # Create labels to show current calibration values
-        ttk.Label(self.cal_status_frame, text="Throttle Idle:").grid(row=0, column=0, padx=5, pady=2, sticky='e')
-        self.throttle_idle_label = ttk.Label(self.cal_status_frame, text="0")
-        self.throttle_idle_label.grid(row=0, column=1, padx=5, pady=2, sticky='w')
-        
-        ttk.Label(self.cal_status_frame, text="Throttle Max:").grid(row=0, column=2, padx=5, pady=2, sticky='e')
-        self.throttle_max_label = ttk.Label(self.cal_status_frame, text="100")
-        self.throttle_max_label.grid(row=0, column=3, padx=5, pady=2, sticky='w')
-        
-        ttk.Label(self.cal_status_frame, text="Reverse Idle:").grid(row=1, column=0, padx=5, pady=2, sticky='e')
-        self.reverse_idle_label = ttk.Label(self.cal_status_frame, text="0")
-        self.reverse_idle_label.grid(row=1, column=1, padx=5, pady=2, sticky='w')
-        
-        ttk.Label(self.cal_status_frame, text="Reverse Max:").grid(row=1, column=2, padx=5, pady=2, sticky='e')
-        self.reverse_max_label = ttk.Label(self.cal_status_frame, text="0")
-        self.reverse_max_label.grid(row=1, column=3, padx=5, pady=2, sticky='w')
-        
-        ttk.Label(self.cal_status_frame, text="Prop Idle:").grid(row=2, column=0, padx=5, pady=2, sticky='e')
-        self.prop_idle_label = ttk.Label(self.cal_status_frame, text="0")
-        self.prop_idle_label.grid(row=2, column=1, padx=5, pady=2, sticky='w')
-        
-        ttk.Label(self.cal_status_frame, text="Prop Max:").grid(row=2, column=2, padx=5, pady=2, sticky='e')
-        self.prop_max_label = ttk.Label(self.cal_status_frame, text="100")
-        self.prop_max_label.grid(row=2, column=3, padx=5, pady=2, sticky='w')
-        
-        ttk.Label(self.cal_status_frame, text="Mixture Idle:").grid(row=3, column=0, padx=5, pady=2, sticky='e')
-        self.mixture_idle_label = ttk.Label(self.cal_status_frame, text="0")
-        self.mixture_idle_label.grid(row=3, column=1, padx=5, pady=2, sticky='w')
-        
-        ttk.Label(self.cal_status_frame, text="Mixture Max:").grid(row=3, column=2, padx=5, pady=2, sticky='e')
-        self.mixture_max_label = ttk.Label(self.cal_status_frame, text="100")
-        self.mixture_max_label.grid(row=3, column=3, padx=5, pady=2, sticky='w')
-        
-        # Update calibration status display
-        self.update_calibration_status()
+        # The status labels are only built once the Main tab is actually shown
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.root.after_idle(self._on_tab_changed)
         
         # Status label should be in main_container (outside notebook)
         self.status_label = ttk.Label(main_container, text="Connected", foreground="green")
@@ -903,7 +1315,7 @@ class FlightControlGUI:
         
         self.toggle_button = ttk.Button(
             control_frame, 
-            text="Pause Controls", 
+            text="Pause Controls" if self.controls_active else "Resume Controls", 
             command=self.toggle_controls
         )
         self.toggle_button.pack(side='left', padx=5)
@@ -921,41 +1333,25 @@ class FlightControlGUI:
         invert_frame = ttk.LabelFrame(main_tab.scrolled_frame, text="Control Settings", padding=10)
         invert_frame.pack(fill='x', padx=5, pady=5)
         
-        # Create variables for checkboxes
-        self.throttle_invert_var = tk.BooleanVar(value=self.controls.invert_axis['throttle'])
-        self.prop_invert_var = tk.BooleanVar(value=self.controls.invert_axis['prop'])
-        self.mixture_invert_var = tk.BooleanVar(value=self.controls.invert_axis['mixture'])
-        self.reverse_invert_var = tk.BooleanVar(value=self.controls.invert_axis['reverse'])
-        self.speedbrake_mode_var = tk.BooleanVar(value=self.controls.prop_as_speedbrake)
-        
-        # Create checkboxes for each axis
-        ttk.Checkbutton(
-            invert_frame, 
-            text="Invert Throttle", 
-            variable=self.throttle_invert_var,
-            command=lambda: self.toggle_inversion('throttle')
-        ).grid(row=0, column=0, padx=5, pady=2, sticky='w')
-        
-        ttk.Checkbutton(
-            invert_frame, 
-            text="Invert Prop", 
-            variable=self.prop_invert_var,
-            command=lambda: self.toggle_inversion('prop')
-        ).grid(row=0, column=1, padx=5, pady=2, sticky='w')
-        
-        ttk.Checkbutton(
-            invert_frame, 
-            text="Invert Mixture", 
-            variable=self.mixture_invert_var,
-            command=lambda: self.toggle_inversion('mixture')
-        ).grid(row=1, column=0, padx=5, pady=2, sticky='w')
-        
-        ttk.Checkbutton(
-            invert_frame, 
-            text="Invert Reverse", 
-            variable=self.reverse_invert_var,
-            command=lambda: self.toggle_inversion('reverse')
-        ).grid(row=1, column=1, padx=5, pady=2, sticky='w')
+        # Create a variable and checkbox for each axis, two per row
+        invert_checks = [
+            ("Invert Throttle", 'throttle'),
+            ("Invert Prop", 'prop'),
+            ("Invert Mixture", 'mixture'),
+            ("Invert Reverse", 'reverse')
+        ]
+        invert_axis = controls.invert_axis
+        for i, (text, axis) in enumerate(invert_checks):
+            invert_var = tk.BooleanVar(value=invert_axis[axis])
+            setattr(self, f"{axis}_invert_var", invert_var)
+            ttk.Checkbutton(
+                invert_frame, 
+                text=text, 
+                variable=invert_var,
+                command=partial(self.toggle_inversion, axis)
+            ).grid(row=i // 2, column=i % 2, padx=5, pady=2, sticky='w')
+        
+        self.speedbrake_mode_var = tk.BooleanVar(value=controls.prop_as_speedbrake)
         
         # Add speedbrake mode checkbox
         ttk.Checkbutton(
@@ -990,11 +1386,11 @@ class FlightControlGUI:
                 self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.canvas.yview)
                 self.scrolled_frame = ttk.Frame(self.canvas)
                 
-                # Configure scrolling
-                self.scrolled_frame.bind(
-                    "<Configure>",
-                    lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-                )
+                # Configure scrolling. Resizes fire bursts of <Configure> events, so
+                # recompute the scrollregion once the burst has settled.
+                self._scroll_job = None
+                self._width_job = None
+                self.scrolled_frame.bind("<Configure>", self.on_scrolled_configure)
                 
                 # Create window in canvas
                 self.canvas.create_window((0, 0), window=self.scrolled_frame, anchor="nw")
@@ -1007,24 +1403,122 @@ class FlightControlGUI:
                 # Configure canvas size
                 self.frame.bind("<Configure>", self.on_frame_configure)
                 
-                # Add mouse wheel scrolling
-                self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
+                # Add mouse wheel scrolling, only while the pointer is over this canvas
+                # so other tabs' canvases don't scroll along with it
+                self.canvas.bind("<Enter>", self.bind_mousewheel)
+                self.canvas.bind("<Leave>", self.unbind_mousewheel)
+            
+            def on_scrolled_configure(self, event=None):
+                if self._scroll_job:
+                    self.canvas.after_cancel(self._scroll_job)
+                self._scroll_job = self.canvas.after(30, self.apply_scrollregion)
+            
+            def apply_scrollregion(self):
+                self._scroll_job = None
+                self.canvas.configure(scrollregion=self.canvas.bbox("all"))
             
             def on_frame_configure(self, event=None):
+                if self._width_job:
+                    self.canvas.after_cancel(self._width_job)
+                self._width_job = self.canvas.after(30, self.apply_width)
+            
+            def apply_width(self):
+                self._width_job = None
                 self.canvas.configure(width=self.frame.winfo_width()-20)  # Adjust for scrollbar
             
+            def bind_mousewheel(self, event=None):
+                self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
+                # Linux reports the wheel as buttons 4 and 5
+                self.canvas.bind_all("<Button-4>", self.on_mousewheel)
+                self.canvas.bind_all("<Button-5>", self.on_mousewheel)
+            
+            def unbind_mousewheel(self, event=None):
+                self.canvas.unbind_all("<MouseWheel>")
+                self.canvas.unbind_all("<Button-4>")
+                self.canvas.unbind_all("<Button-5>")
+            
             def on_mousewheel(self, event):
-                self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+                if event.num == 4:
+                    self.canvas.yview_scroll(-1, "units")
+                elif event.num == 5:
+                    self.canvas.yview_scroll(1, "units")
+                else:
+                    # Truncate toward zero like the old int(-delta/120), so small
+                    # touchpad deltas are dropped the same way in both directions
+                    self.canvas.yview_scroll(int(-event.delta / _WHEEL_DIV), "units")
         
         return ScrollableFrame()
     
+    def _set_text(self, widget, text):
+        """Configure a label's text only if it differs from what we last set"""
+        if self._label_cache.get(widget) != text:
+            self._label_cache[widget] = text
+            widget.config(text=text)
+    
+    def _set_bar(self, bar_var, value):
+        """Set a progressbar's variable only if it differs from what we last set"""
+        if self._label_cache.get(bar_var) != value:
+            self._label_cache[bar_var] = value
+            bar_var.set(value)
+    
+    def _set_pot_bar(self, frame, value):
+        """Move a pot's value bar, only when the value differs from what it shows"""
+        if frame['bar_value'] != value:
+            frame['bar_value'] = value
+            width = frame['bar_width'] * max(0.0, min(100.0, value)) / 100.0
+            frame['value_canvas'].coords(frame['value_rect'], 0, 0, width, _POT_BAR_HEIGHT)
+    
+    def _set_item_text(self, canvas, item, text):
+        """Configure a canvas text item only if it differs from what we last set"""
+        key = (canvas, item)
+        if self._label_cache.get(key) != text:
+            self._label_cache[key] = text
+            canvas.itemconfigure(item, text=text)
+    
+    def _on_pot_bar_resize(self, index, event):
+        """Rescale a pot's value bar to the canvas's new width"""
+        frame = self.pot_frames[index]
+        frame['bar_width'] = event.width
+        # Keep the trough full width and the value readout right-aligned
+        canvas = frame['value_canvas']
+        canvas.coords(frame['value_trough'], 0, 0, event.width, _POT_BAR_HEIGHT)
+        canvas.coords(frame['value_text'], event.width, _POT_TEXT_Y)
+        value = frame['bar_value']
+        frame['bar_value'] = None
+        self._set_pot_bar(frame, value)
+    
+    def _set_status(self, status_var, text):
+        """Set a test window's status text; bursts within 50 ms collapse into one update"""
+        # Tk variables aren't hashable, so they are keyed by their Tcl name
+        self._pending_status[str(status_var)] = (status_var, text)
+        if not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            self.root.after(50, self._flush_status)
+    
+    def _flush_status(self):
+        """Write the latest pending text of every status variable"""
+        self._status_flush_scheduled = False
+        pending = self._pending_status
+        self._pending_status = {}
+        for status_var, text in pending.values():
+            try:
+                status_var.set(text)
+            except tk.TclError:
+                # The window went away while the text was pending
+                pass
+    
+    def _set_var(self, var, value):
+        """Set a Tk variable only when the value actually changes (avoids firing traces)"""
+        if var.get() != value:
+            var.set(value)
+    
     def set_pot_name(self, index, name):
         """Set the name for a potentiometer"""
         try:
             self.controls.control_panel.set_pot_name(index, name)
-            self.pot_name_vars[index].set(name)
+            self._set_var(self.pot_ui_states[index].name, name)
             # Save settings after changing pot name
-            self.save_settings()
+            self._schedule_save_settings()
             return True
         except Exception as e:
             self.log_debug(f"Error setting pot name: {str(e)}")
@@ -1034,9 +1528,9 @@ class FlightControlGUI:
         """Set the type for a potentiometer"""
         try:
             self.controls.control_panel.set_pot_type(index, type_name)
-            self.pot_type_vars[index].set(type_name)
+            self._set_var(self.pot_ui_states[index].type, type_name)
             # Save settings after changing pot type
-            self.save_settings()
+            self._schedule_save_settings()
             return True
         except Exception as e:
             self.log_debug(f"Error setting pot type: {str(e)}")
@@ -1046,38 +1540,63 @@ class FlightControlGUI:
         """Toggle inversion for a potentiometer"""
         try:
             self.controls.control_panel.toggle_pot_inversion(index)
-            self.pot_inversion_vars[index].set(self.controls.control_panel.pot_config[index]["inversion"])
+            self._set_var(self.pot_ui_states[index].invert, self.controls.control_panel.pot_config[index]["invert"])
             # Save settings after toggling pot inversion
-            self.save_settings()
+            self._schedule_save_settings()
             return True
         except Exception as e:
             self.log_debug(f"Error toggling pot inversion: {str(e)}")
             return False
     
+    def _on_threshold_change(self, index, value):
+        """Threshold scale command; dragging calls it on every pixel, so the work waits for idle"""
+        self._threshold_pending[index] = int(float(value))
+        if not self._threshold_flush_pending:
+            self._threshold_flush_pending = True
+            self.root.after_idle(self._flush_thresholds)
+    
+    def _flush_thresholds(self):
+        """Apply the latest dragged threshold of every pot moved since the last flush"""
+        self._threshold_flush_pending = False
+        pending = self._threshold_pending
+        self._threshold_pending = {}
+        for index, threshold in pending.items():
+            self.set_pot_threshold(index, threshold)
+    
     def set_pot_threshold(self, index, threshold):
         """Set threshold for a potentiometer"""
         try:
             self.controls.control_panel.set_pot_threshold(index, threshold)
-            self.pot_threshold_vars[index].set(threshold)
+            pot_ui = self.pot_ui_states[index]
+            self._set_var(pot_ui.threshold, threshold)
+            self._set_text(pot_ui.threshold_label, f"{threshold}%")
             # Save settings after changing pot threshold
-            self.save_settings()
+            self._schedule_save_settings()
             return True
         except Exception as e:
             self.log_debug(f"Error setting pot threshold: {str(e)}")
             return False
     
+    def _show_pot_calibration(self, index):
+        """Show a pot's calibrated min/max in the control panel tab"""
+        if index < len(self.pot_ui_states):
+            pot_ui = self.pot_ui_states[index]
+            config = self.controls.control_panel.pot_config[index]
+            self._set_var(pot_ui.cal_min, f"Min: {config['calibrated_min']}")
+            self._set_var(pot_ui.cal_max, f"Max: {config['calibrated_max']}")
+    
     def calibrate_pot_min(self, index):
         """Calibrate the minimum value for a potentiometer"""
         try:
-            # Get the current value
-            if index < len(self.pot_values):
-                value = self.pot_values[index]
-                if value is not None:
-                    self.controls.control_panel.calibrate_pot_min(index, value)
-                    self.log_debug(f"Pot {index} min calibrated to {value}")
-                    # Save settings after calibration
-                    self.save_settings()
-                    return True
+            # Get the current raw value
+            if index < len(self.last_control_panel_values):
+                value = round(self.last_control_panel_values[index])
+                self.controls.control_panel.calibrate_pot_min(index, value)
+                self._show_pot_calibration(index)
+                self.log_debug(f"Pot {index} min calibrated to {value}")
+                # Save settings after calibration
+                self._schedule_save_settings()
+                return True
             return False
         except Exception as e:
             self.log_debug(f"Error calibrating pot min: {str(e)}")
@@ -1086,15 +1605,15 @@ class FlightControlGUI:
     def calibrate_pot_max(self, index):
         """Calibrate the maximum value for a potentiometer"""
         try:
-            # Get the current value
-            if index < len(self.pot_values):
-                value = self.pot_values[index]
-                if value is not None:
-                    self.controls.control_panel.calibrate_pot_max(index, value)
-                    self.log_debug(f"Pot {index} max calibrated to {value}")
-                    # Save settings after calibration
-                    self.save_settings()
-                    return True
+            # Get the current raw value
+            if index < len(self.last_control_panel_values):
+                value = round(self.last_control_panel_values[index])
+                self.controls.control_panel.calibrate_pot_max(index, value)
+                self._show_pot_calibration(index)
+                self.log_debug(f"Pot {index} max calibrated to {value}")
+                # Save settings after calibration
+                self._schedule_save_settings()
+                return True
             return False
         except Exception as e:
             self.log_debug(f"Error calibrating pot max: {str(e)}")
@@ -1109,197 +1628,298 @@ class FlightControlGUI:
         except ValueError:
             self.control_panel_baud_rate = 115200  # Default if invalid
         
-        # Restart control panel thread
-        if hasattr(self, 'control_panel_running'):
-            self.control_panel_running = False
-            time.sleep(0.5)  # Give time for thread to stop
-        
-        self.control_panel_running = True
-        self.start_control_panel_thread()
+        # Restart control panel thread once the old one has let go of the port
+        self._restart_reader('_control_panel_thread', self._control_panel_stop,
+                             self.start_control_panel_thread)
         
         self.status_label.config(text=f"Connecting to control panel on {self.control_panel_com_port} at {self.control_panel_baud_rate} baud...", foreground="blue")
     
     def start_control_panel_thread(self):
         """Start thread for reading from control panel"""
-        def control_panel_loop():
-            try:
-                ser = serial.Serial(self.control_panel_com_port, self.control_panel_baud_rate, timeout=1)
-                self.status_label.config(text=f"Connected to control panel on {self.control_panel_com_port}", foreground="green")
+        port = self.control_panel_com_port
+        self._control_panel_thread = threading.Thread(
+            target=self._run_serial_reader,
+            args=(port, self.control_panel_baud_rate,
+                  self._control_panel_stop,
+                  self._handle_control_panel_line,
+                  f"Connected to control panel on {port}",
+                  "Control panel disconnected",
+                  "Control panel connection error",
+                  "Error processing control panel data"),
+            daemon=True
+        )
+        self._control_panel_thread.start()
+    
+    def start_serial_thread(self):
+        port = self.com_port
+        self._serial_thread = threading.Thread(
+            target=self._run_serial_reader,
+            args=(port, 115200,
+                  self._serial_stop,
+                  self._dispatch_line,
+                  f"Connected to {port}",
+                  "Disconnected",
+                  "Serial connection error",
+                  "Error processing serial data"),
+            daemon=True
+        )
+        self._serial_thread.start()
+    
+    def _restart_reader(self, thread_attr, stop_event, start):
+        """Stop a reader thread and call start once it has exited, without blocking Tk"""
+        stop_event.set()
+        thread = getattr(self, thread_attr, None)
+        if thread is not None and thread.is_alive():
+            # It notices the stop within one read timeout; check again shortly
+            self.root.after(20, self._restart_reader, thread_attr, stop_event, start)
+            return
+        stop_event.clear()
+        start()
+    
+    def _run_serial_reader(self, port, baud_rate, stop_event, handle_line,
+                           connected_text, disconnected_text, connection_error, line_error):
+        """Read lines from a serial port and pass each to handle_line until stop_event is set.
+        
+        Both the throttle and the control panel threads run this. Each port keeps
+        its own thread because pyserial can't wait on several ports at once on
+        Windows, but both share the one read/dispatch path.
+        """
+        try:
+            # Closing the port on exit lets a restarted reader open it again
+            with serial.Serial(port, baud_rate, timeout=_SERIAL_TIMEOUT) as ser:
+                self._ui(self.status_label.config, text=connected_text, foreground="green")
                 
                 # Clear any old data in the buffer
                 ser.reset_input_buffer()
+                buffer = bytearray()
                 
-                while hasattr(self, 'control_panel_running') and self.control_panel_running:
-                    if ser.in_waiting:
+                while not stop_event.is_set():
+                    # Blocks until the OS has bytes for us (or timeout) instead of
+                    # polling in_waiting and sleeping
+                    for line in _read_serial_lines(ser, buffer):
                         try:
-                            line = ser.readline().decode('utf-8', errors='replace').strip()
-                            
-                            # Skip empty lines
-                            if not line:
-                                continue
-                            
-                            # Check if this is from the control panel
-                            if not line.startswith("CTRLPANEL"):
-                                continue
-                            
-                            # Remove the device identifier
-                            line = line.replace("CTRLPANEL,", "")
-                            
-                            # Split the line into parts and filter out empty strings
-                            parts = [p for p in line.split(',') if p.strip()]
-                            
-                            # Extract raw values (every other value)
-                            raw_values = []
-                            for i in range(0, min(14, len(parts)), 2):
-                                try:
-                                    raw_values.append(float(parts[i]))
-                                except ValueError:
-                                    raw_values.append(0)
-                            
-                            # Ensure we have 7 values
-                            while len(raw_values) < 7:
-                                raw_values.append(0)
-                            
-                            # Store raw values for calibration
-                            self.last_control_panel_values = raw_values[:7]
-                            
-                            # Process values if controls are active
-                            processed_values = self.controls.process_control_panel(raw_values[:7])
-                            
-                            # Update UI
-                            for i, value in enumerate(processed_values):
-                                if i < len(self.pot_frames):
-                                    # Access dictionary values correctly
-                                    self.pot_frames[i]['value_bar']['value'] = value
-                                    self.pot_frames[i]['value_label'].config(text=f"{value:.0f}%")
-                                    self.pot_frames[i]['raw_label'].config(text=f"Raw: {raw_values[i]:.0f}")
-                    
+                            handle_line(line)
                         except Exception as e:
-                            print(f"Error processing control panel data: {str(e)}")
-                            import traceback
-                            traceback.print_exc()
+                            self._log_loop_error(line_error, e)
                             
-                    # Small sleep to prevent CPU hogging
-                    time.sleep(0.01)
-                            
-            except serial.SerialException as e:
-                print(f"Control panel connection error: {str(e)}")
-                self.status_label.config(text=f"Control panel disconnected", foreground="red")
-                
-        threading.Thread(target=control_panel_loop, daemon=True).start()
+        except serial.SerialException as e:
+            print(f"{connection_error}: {str(e)}")
+            self._ui(self.status_label.config, text=disconnected_text, foreground="red")
     
-    def start_serial_thread(self):
-        def serial_loop():
+    def _dispatch_line(self, line):
+        """Route a line from the throttle port by its prefix, so a control panel
+        sharing the port is still handled"""
+        if line.startswith(b"CTRLPANEL"):
+            self._handle_control_panel_line(line)
+        else:
+            self._handle_throttle_line(line)
+    
+    def _handle_control_panel_line(self, line):
+        """Process one line from the control panel and hand the result to the GUI"""
+        # Skip anything that isn't a control panel frame
+        raw_values = _parse_control_panel_line(line)
+        if raw_values is None:
+            return
+        
+        # Store raw values for calibration, in place
+        last_values = self.last_control_panel_values
+        for i in range(7):
+            last_values[i] = raw_values[i]
+        
+        # Process values if controls are active
+        processed_values = self.controls.process_control_panel(raw_values)
+        
+        # Hand a copy to the GUI thread (the processed list is reused)
+        self.panel_queue.append((tuple(processed_values), raw_values))
+        self._request_gui_update()
+        self._request_calib_redraw()
+    
+    def _handle_throttle_line(self, line):
+        """Process one line from the throttle and hand the result to the GUI"""
+        # Work on the raw bytes; float() parses them directly
+        line = line.strip()
+        
+        # Skip empty lines
+        if not line:
+            return
+        
+        # Log raw data for debugging (only decoded when shown)
+        if self.debug_mode:
+            self._ui(self.log_debug, f"Raw data: '{line.decode('utf-8', errors='replace')}'")
+        
+        # Split the line into parts; only filter out empty ones when there are
+        # any, which keeps the usual case to a single C-level split
+        parts = line.split(b',')
+        if not all(parts):
+            parts = [p for p in parts if p.strip()]
+        
+        # Handle different data formats more robustly
+        if len(parts) >= 6:
+            # Full format with raw and percentage values; only the
+            # percentages are used, so the raw fields aren't parsed
             try:
-                ser = serial.Serial(self.com_port, 115200, timeout=1)
-                self.status_label.config(text=f"Connected to {self.com_port}", foreground="green")
-                
-                while self.running:
-                    if ser.in_waiting:
-                        try:
-                            # Use errors='replace' to handle invalid UTF-8 bytes
-                            line = ser.readline().decode('utf-8', errors='replace').strip()
-                            
-                            # Skip empty lines
-                            if not line:
-                                continue
-                            
-                            # Log raw data for debugging
-                            self.log_debug(f"Raw data: '{line}'")
-                            
-                            # Split the line into parts and filter out empty strings
-                            parts = [p for p in line.split(',') if p.strip()]
-                            
-                            # Handle different data formats more robustly
-                            if len(parts) >= 6:
-                                # Full format with raw and percentage values
-                                try:
-                                    t_raw, t_pct, p_raw, p_pct, m_raw, m_pct = map(float, parts[:6])
-                                except ValueError:
-                                    self.log_debug(f"Error parsing 6-value format: {parts[:6]}")
-                                    continue
-                            elif len(parts) >= 3:
-                                # Only percentage values
-                                try:
-                                    t_pct, p_pct, m_pct = map(float, parts[:3])
-                                except ValueError:
-                                    self.log_debug(f"Error parsing 3-value format: {parts[:3]}")
-                                    continue
-                            else:
-                                # Not enough data
-                                self.log_debug(f"Unexpected data format: {line} (parts: {len(parts)})")
-                                continue
-                            
-                            # Store raw values for calibration
-                            self.last_raw_values['throttle'] = t_pct
-                            self.last_raw_values['reverse'] = t_pct  # Same as throttle
-                            self.last_raw_values['prop'] = p_pct
-                            self.last_raw_values['mixture'] = m_pct
-                            
-                            # Only apply mapping if controls are active
-                            if self.controls_active:
-                                # Apply calibration and mapping - now returns 4 values
-                                forward, reverse, p_cal, m_cal = self.controls.apply_mapping(t_pct, p_pct, m_pct)
-                                self.values_queue.put((forward, reverse, p_cal, m_cal))
-                            else:
-                                # Still update the UI with raw values
-                                # For raw values, we'll show forward if positive, reverse if negative
-                                if t_pct >= 0:
-                                    self.values_queue.put((t_pct, 0, p_pct, m_pct))
-                                else:
-                                    self.values_queue.put((0, -t_pct, p_pct, m_pct))
-                        
-                        except Exception as e:
-                            print(f"Error processing serial data: {str(e)}")
-                            # Add more detailed error information
-                            import traceback
-                            traceback.print_exc()
-                            
-                    # Small sleep to prevent CPU hogging
-                    time.sleep(0.01)
-                            
-            except serial.SerialException as e:
-                print(f"Serial connection error: {str(e)}")
-                self.status_label.config(text="Disconnected", foreground="red")
-                
-        threading.Thread(target=serial_loop, daemon=True).start()
-        self.update_gui()
+                t_pct = float(parts[1])
+                p_pct = float(parts[3])
+                m_pct = float(parts[5])
+            except ValueError:
+                if self.debug_mode:
+                    self._ui(self.log_debug, f"Error parsing 6-value format: {parts[:6]}")
+                return
+        elif len(parts) >= 3:
+            # Only percentage values
+            try:
+                t_pct, p_pct, m_pct = map(float, parts[:3])
+            except ValueError:
+                if self.debug_mode:
+                    self._ui(self.log_debug, f"Error parsing 3-value format: {parts[:3]}")
+                return
+        else:
+            # Not enough data
+            if self.debug_mode:
+                self._ui(self.log_debug, f"Unexpected data format: {line} (parts: {len(parts)})")
+            return
         
-        # Also start the control panel thread
-        self.control_panel_running = True
-        self.start_control_panel_thread()
+        # Store raw values for calibration
+        last_raw = self.last_raw_values
+        last_raw[0] = t_pct  # Throttle
+        last_raw[1] = t_pct  # Reverse, same as throttle
+        last_raw[2] = p_pct  # Prop
+        last_raw[3] = m_pct  # Mixture
+        
+        # Only apply mapping if controls are active
+        if self.controls_active:
+            # Apply calibration and mapping - now returns 4 values
+            forward, reverse, p_cal, m_cal = self.controls.apply_mapping(t_pct, p_pct, m_pct)
+            self.values_queue.append((forward, reverse, p_cal, m_cal))
+        else:
+            # Still update the UI with raw values
+            # For raw values, we'll show forward if positive, reverse if negative
+            if t_pct >= 0:
+                self.values_queue.append((t_pct, 0, p_pct, m_pct))
+            else:
+                self.values_queue.append((0, -t_pct, p_pct, m_pct))
+        
+        # Wake the GUI only because there is something new to draw
+        self._request_gui_update()
+    
+    def _log_loop_error(self, message, error):
+        """Print a serial loop error, with a full traceback at most once a second"""
+        print(f"{message}: {str(error)}")
+        # A burst of bad lines would otherwise flood stderr with tracebacks
+        now = time.monotonic()
+        if now - self._last_err_log > 1.0:
+            self._last_err_log = now
+            traceback.print_exc()
+    
+    def _schedule_status_reset(self):
+        """Reset the status label in 2 seconds, replacing any reset already pending"""
+        # Rapid status flashes then cost one timer and one redraw, not one each
+        if self._status_reset_after_id is not None:
+            self.root.after_cancel(self._status_reset_after_id)
+        self._status_reset_after_id = self.root.after(2000, self._reset_status_connected)
+    
+    def _schedule_save_settings(self):
+        """Save settings in half a second, replacing any save already pending"""
+        # A burst of mapping changes then writes the file once
+        if self._save_settings_after_id is not None:
+            self.root.after_cancel(self._save_settings_after_id)
+        self._save_settings_after_id = self.root.after(500, self._flush_settings)
+    
+    def _flush_settings(self):
+        """Run the pending debounced settings save"""
+        self._save_settings_after_id = None
+        self.save_settings()
+    
+    def _reset_status_connected(self):
+        """Put the status label back to its normal connected state"""
+        self._status_reset_after_id = None
+        self.status_label.config(text="Connected", foreground="green")
+    
+    def _ui(self, fn, *args, **kwargs):
+        """Run a Tk call on the GUI thread; worker threads must not touch widgets directly"""
+        self.root.after(0, partial(fn, *args, **kwargs))
+    
+    def _request_gui_update(self):
+        """Schedule one update_gui call; called from the serial thread after queuing a sample"""
+        if not self._update_pending and self.running:
+            self._update_pending = True
+            # ~60 Hz cap: samples arriving before it fires are coalesced
+            self.root.after(16, self.update_gui)
+    
+    def _request_calib_redraw(self):
+        """Schedule one calibration redraw; called from the serial thread after new values arrive"""
+        self._calib_dirty = True
+        if not self._calib_pending and self._calibration_open and self.running:
+            self._calib_pending = True
+            # ~30 Hz cap: values arriving before it fires are coalesced
+            self.root.after(33, self._do_calib_redraw)
+    
+    def _do_calib_redraw(self):
+        """Redraw the calibration display if new values came in"""
+        self._calib_pending = False
+        if self._calib_dirty:
+            self._calib_dirty = False
+            self.update_calibration_display()
     
     def update_gui(self):
+        # Clear first so a sample queued while we drain schedules another pass
+        self._update_pending = False
         try:
-            while not self.values_queue.empty():
+            # Only the newest sample is kept, so one pop drains the queue
+            try:
+                last = self.values_queue.popleft()
+            except IndexError:
+                last = None
+            
+            # Skip the Tk calls entirely when nothing changed
+            if last is not None and last != self._last_displayed:
+                self._last_displayed = last
+                
                 # Now we get four values: forward, reverse, prop, mixture
-                forward, reverse, p_pct, m_pct = self.values_queue.get_nowait()
+                forward, reverse, p_pct, m_pct = last
                 
                 # Update progress bars - ensure values are within range
-                self.forward_bar['value'] = min(100, float(forward))
-                self.reverse_bar['value'] = min(100, float(reverse))
-                self.prop_bar['value'] = min(100, float(p_pct))
-                self.mixture_bar['value'] = min(100, float(m_pct))
+                self._set_bar(self.forward_var, min(100, float(forward)))
+                self._set_bar(self.reverse_var, min(100, float(reverse)))
+                self._set_bar(self.prop_var, min(100, float(p_pct)))
+                self._set_bar(self.mixture_var, min(100, float(m_pct)))
                 
                 # Update labels
-                self.forward_label['text'] = f"{forward:.1f}%"
-                self.reverse_label['text'] = f"{reverse:.1f}%"
-                self.prop_label['text'] = f"{p_pct:.1f}%"
-                self.mixture_label['text'] = f"{m_pct:.1f}%"
+                self._set_text(self.forward_label, f"{forward:.1f}%")
+                self._set_text(self.reverse_label, f"{reverse:.1f}%")
+                self._set_text(self.prop_label, f"{p_pct:.1f}%")
+                self._set_text(self.mixture_label, f"{m_pct:.1f}%")
+            
+            # Control panel pots
+            try:
+                processed_values, raw_values = self.panel_queue.popleft()
+            except IndexError:
+                processed_values = ()
+            pot_frames = self.pot_frames
+            set_pot_bar = self._set_pot_bar
+            set_item_text = self._set_item_text
+            for i in range(min(len(pot_frames), len(processed_values))):
+                value = processed_values[i]
+                frame = pot_frames[i]
+                set_pot_bar(frame, value)
+                canvas = frame['value_canvas']
+                # round() gives the same text as :.0f without float formatting
+                set_item_text(canvas, frame['value_text'], f"{round(value)}%")
+                set_item_text(canvas, frame['raw_text'], f"Raw: {round(raw_values[i])}")
                 
-        except queue.Empty:
-            pass
         except Exception as e:
             print(f"GUI update error: {str(e)}")
             
-        if self.running:
-            self.root.after(50, self.update_gui)
-            
     def quit_application(self):
-        # Save settings before quitting
+        # Save settings before quitting (this covers any debounced save still pending)
+        if self._save_settings_after_id is not None:
+            self.root.after_cancel(self._save_settings_after_id)
+            self._save_settings_after_id = None
         self.save_settings()
         
         self.running = False
+        self._serial_stop.set()
+        self._control_panel_stop.set()
         if self.tray_icon:
             self.tray_icon.stop()
         self.root.quit()
@@ -1309,12 +1929,18 @@ class FlightControlGUI:
 
     def toggle_debug(self):
         """Toggle debug mode to show raw serial data"""
-        if hasattr(self, 'debug_mode') and self.debug_mode:
+        if self.debug_mode:
             self.debug_mode = False
             self.debug_window.destroy()
         else:
             self.debug_mode = True
             self.create_debug_window()
+        
+        # Let the mapping code print its rate-limited values while debugging
+        self.controls._debug = self.debug_mode
+        
+        # Only pay for logging while the debug window is open
+        self.log_debug = self._real_log_debug if self.debug_mode else self._noop_log_debug
 
     def create_debug_window(self):
         """Create a debug window to show raw serial data"""
@@ -1341,7 +1967,7 @@ class FlightControlGUI:
         
         # Add a clear button
         ttk.Button(button_frame, text="Clear", 
-                  command=lambda: self.debug_text.delete(1.0, tk.END)).pack(side='left', padx=5)
+                  command=partial(self.debug_text.delete, 1.0, tk.END)).pack(side='left', padx=5)
         
         # Add a "Parse Test" button to help diagnose data format
         ttk.Button(button_frame, text="Parse Test", 
@@ -1356,13 +1982,13 @@ class FlightControlGUI:
             # Get the last line from the debug text
             last_line = self.debug_text.get("end-2l", "end-1l").strip()
             
-            # Extract the raw data part
-            if "Raw data:" in last_line:
-                raw_data = last_line.split("Raw data: '")[1].rstrip("'")
-                self._test_parse_throttle_data(raw_data)
-            elif "Control Panel data:" in last_line:
-                raw_data = last_line.split("Control Panel data: '")[1].rstrip("'")
-                self._test_parse_control_panel_data(raw_data)
+            # Extract the raw data part; debug lines start with their label
+            if last_line.startswith("Raw data:"):
+                raw_data = last_line.partition("Raw data: '")[2]
+                self._test_parse_throttle_data(raw_data[:-1] if raw_data.endswith("'") else raw_data)
+            elif last_line.startswith("Control Panel data:"):
+                raw_data = last_line.partition("Control Panel data: '")[2]
+                self._test_parse_control_panel_data(raw_data[:-1] if raw_data.endswith("'") else raw_data)
             else:
                 self.log_debug("No raw data found in the last line.")
         except Exception as e:
@@ -1403,66 +2029,100 @@ class FlightControlGUI:
 
     def _test_parse_control_panel_data(self, raw_data):
         """Test parsing control panel data"""
-        result = "Parsing Test Results (Control Panel):\n"
-        result += f"Raw data: '{raw_data}'\n"
+        # Collect the report lines and join them once at the end
+        result = [
+            "Parsing Test Results (Control Panel):",
+            f"Raw data: '{raw_data}'"
+        ]
         
         # Check if it starts with CTRLPANEL
         if not raw_data.startswith("CTRLPANEL"):
-            result += "Error: Data does not start with CTRLPANEL prefix\n"
-            self.log_debug(result)
+            result.append("Error: Data does not start with CTRLPANEL prefix")
+            self.log_debug("\n".join(result) + "\n")
             return
         
-        # Remove the device identifier
-        data = raw_data.replace("CTRLPANEL,", "")
+        # Remove the device identifier; it is always at the start, so slice
+        # it off rather than searching the whole line for it
+        data = raw_data[len("CTRLPANEL,"):] if raw_data.startswith("CTRLPANEL,") else raw_data[len("CTRLPANEL"):]
         
         # Split and filter parts
         parts = [p for p in data.split(',') if p.strip()]
-        result += f"Filtered parts ({len(parts)}): {parts}\n\n"
+        result.append(f"Filtered parts ({len(parts)}): {parts}\n")
         
-        # Try to parse as raw and percentage values
-        if len(parts) >= 14:
+        # Convert the tokens once, stopping at the first bad one; both
+        # interpretations below index into this
+        values = []
+        parse_error = None
+        for part in parts[:14]:
             try:
-                result += "14-value parse (raw and percentage):\n"
-                for i in range(0, 14, 2):
-                    if i+1 < len(parts):
-                        pot_num = i//2 + 1
-                        raw = float(parts[i])
-                        pct = float(parts[i+1])
-                        result += f"Pot {pot_num}: raw={raw}, pct={pct}%\n"
+                values.append(float(part))
             except ValueError as e:
-                result += f"14-value parse failed: {str(e)}\n"
+                parse_error = e
+                break
+        
+        # Try to parse as raw and percentage values
+        if len(parts) >= 14:
+            result.append("14-value parse (raw and percentage):")
+            if len(values) >= 14:
+                result.extend(
+                    f"Pot {pot_num}: raw={raw}, pct={pct}%"
+                    for pot_num, raw, pct in zip(range(1, 8), values[0:14:2], values[1:14:2])
+                )
+            else:
+                result.append(f"14-value parse failed: {str(parse_error)}")
         
         # Try to parse as just raw values
         if len(parts) >= 7:
-            try:
-                result += "7-value parse (raw values only):\n"
-                for i in range(7):
-                    if i < len(parts):
-                        pot_num = i + 1
-                        raw = float(parts[i])
-                        result += f"Pot {pot_num}: raw={raw}\n"
-            except ValueError as e:
-                result += f"7-value parse failed: {str(e)}\n"
+            result.append("7-value parse (raw values only):")
+            if len(values) >= 7:
+                result.extend(f"Pot {pot_num}: raw={raw}" for pot_num, raw in zip(range(1, 8), values))
+            else:
+                result.append(f"7-value parse failed: {str(parse_error)}")
         
         # Display the results
-        self.log_debug(result)
+        self.log_debug("\n".join(result) + "\n")
 
-    def log_debug(self, message):
-        """Log a debug message if debug mode is on"""
-        if hasattr(self, 'debug_mode') and self.debug_mode:
-            self.debug_text.insert(tk.END, f"{message}\n")
-            self.debug_text.see(tk.END)  # Scroll to end
+    def _noop_log_debug(self, message, *args):
+        """log_debug while debug mode is off"""
+    
+    def _real_log_debug(self, message, *args):
+        """Log a debug message if debug mode is on.
+        
+        With args, message is a %-format string that is only filled in here,
+        so callers don't pay for formatting while debug mode is off.
+        """
+        if self.debug_mode:
+            if args:
+                message = message % args
+            # Queue the line and write everything queued in one insert once
+            # Tk is idle, so a burst of messages costs a single redraw
+            self._debug_queue.append(message)
+            if not self._debug_flush_scheduled:
+                self._debug_flush_scheduled = True
+                self.root.after_idle(self._flush_debug)
+    
+    def _flush_debug(self):
+        """Write queued debug lines to the debug window"""
+        self._debug_flush_scheduled = False
+        if not self._debug_queue:
+            return
+        lines = "\n".join(self._debug_queue)
+        self._debug_queue.clear()
+        if not self.debug_mode:
+            return
+        
+        self.debug_text.insert(tk.END, f"{lines}\n")
+        # Keep the widget from growing without bound
+        line_count = int(self.debug_text.index('end-1c').split('.')[0])
+        if line_count > self._DEBUG_MAX_LINES:
+            self.debug_text.delete('1.0', f"{line_count - self._DEBUG_MAX_LINES}.0")
+        self.debug_text.see(tk.END)  # Scroll to end
 
     def toggle_inversion(self, axis):
         """Toggle inversion for the specified axis"""
-        if axis == 'throttle':
-            self.controls.invert_axis['throttle'] = self.throttle_invert_var.get()
-        elif axis == 'prop':
-            self.controls.invert_axis['prop'] = self.prop_invert_var.get()
-        elif axis == 'mixture':
-            self.controls.invert_axis['mixture'] = self.mixture_invert_var.get()
-        elif axis == 'reverse':
-            self.controls.invert_axis['reverse'] = self.reverse_invert_var.get()
+        # Each axis has a matching <axis>_invert_var checkbox variable
+        self.controls.invert_axis[axis] = getattr(self, f"{axis}_invert_var").get()
+        self.controls.refresh_calibration()
             
         # Show confirmation message
         self.status_label.config(
@@ -1471,19 +2131,16 @@ class FlightControlGUI:
         )
         
         # Reset status after 2 seconds
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Connected", foreground="green"
-        ))
+        self._schedule_status_reset()
 
     def set_controller_type(self):
         """Set the controller type based on radio button selection"""
         selected_value = self.controller_var.get()
         
         # Find the enum value that matches the selected string
-        for controller_type in ControllerType:
-            if controller_type.value == selected_value:
-                self.controls.controller_type = controller_type
-                break
+        controller_type = _CONTROLLER_BY_VALUE.get(selected_value)
+        if controller_type is not None:
+            self.controls.set_controller_type(controller_type)
         
         # Update the mapping text to reflect the change
         self.update_mapping_text()
@@ -1495,9 +2152,7 @@ class FlightControlGUI:
         )
         
         # Reset status after 2 seconds
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Connected", foreground="green"
-        ))
+        self._schedule_status_reset()
 
     def load_settings(self):
         """Load settings from a JSON file"""
@@ -1508,137 +2163,85 @@ class FlightControlGUI:
                 return
             
             # Load settings from file
-            with open('settings/flight_controls.json', 'r') as f:
-                settings = json.load(f)
+            with open('settings/flight_controls.json', 'rb') as f:
+                settings = _loads(f.read())
+            get = settings.get
+            controls = self.controls
             
             # Set profile
-            if "profile" in settings and settings["profile"]:
-                try:
-                    self.controls.profile = ControlProfile[settings["profile"]]
+            if get("profile"):
+                profile = _PROFILE_BY_NAME.get(settings["profile"])
+                if profile is not None:
+                    controls.set_profile(profile)
                     self.update_mapping_text()
-                except (KeyError, ValueError):
+                else:
                     self.log_debug(f"Invalid profile: {settings['profile']}")
             
             # Set controller type
-            if "controller_type" in settings and settings["controller_type"]:
-                try:
-                    self.controls.controller_type = ControllerType[settings["controller_type"]]
-                    self.controller_type_var.set(self.controls.controller_type.value)
-                except (KeyError, ValueError):
+            if get("controller_type"):
+                controller_type = _CONTROLLER_BY_NAME.get(settings["controller_type"])
+                if controller_type is not None:
+                    controls.set_controller_type(controller_type)
+                    if hasattr(self, 'controller_var'):
+                        self.controller_var.set(controller_type.value)
+                else:
                     self.log_debug(f"Invalid controller type: {settings['controller_type']}")
             
-            # Set inversions
-            if "throttle_inversion" in settings:
-                self.controls.throttle_inversion = settings["throttle_inversion"]
-                self.throttle_inversion_var.set(self.controls.throttle_inversion)
-            
-            if "prop_inversion" in settings:
-                self.controls.prop_inversion = settings["prop_inversion"]
-                self.prop_inversion_var.set(self.controls.prop_inversion)
-            
-            if "mixture_inversion" in settings:
-                self.controls.mixture_inversion = settings["mixture_inversion"]
-                self.mixture_inversion_var.set(self.controls.mixture_inversion)
-            
-            # Set throttle calibration
-            if "throttle_calibration" in settings:
-                if "min" in settings["throttle_calibration"]:
-                    self.controls.throttle_min = settings["throttle_calibration"]["min"]
-                if "max" in settings["throttle_calibration"]:
-                    self.controls.throttle_max = settings["throttle_calibration"]["max"]
-                if "idle" in settings["throttle_calibration"]:
-                    self.controls.throttle_idle = settings["throttle_calibration"]["idle"]
-            
-            # Set prop calibration
-            if "prop_calibration" in settings:
-                if "min" in settings["prop_calibration"]:
-                    self.controls.prop_min = settings["prop_calibration"]["min"]
-                if "max" in settings["prop_calibration"]:
-                    self.controls.prop_max = settings["prop_calibration"]["max"]
-            
-            # Set mixture calibration
-            if "mixture_calibration" in settings:
-                if "min" in settings["mixture_calibration"]:
-                    self.controls.mixture_min = settings["mixture_calibration"]["min"]
-                if "max" in settings["mixture_calibration"]:
-                    self.controls.mixture_max = settings["mixture_calibration"]["max"]
-            
-            # Set reverse calibration
-            if "reverse_calibration" in settings:
-                if "min" in settings["reverse_calibration"]:
-                    self.controls.reverse_min = settings["reverse_calibration"]["min"]
-                if "max" in settings["reverse_calibration"]:
-                    self.controls.reverse_max = settings["reverse_calibration"]["max"]
-            
-            # Set speedbrake mode
-            if "speedbrake_mode" in settings:
-                self.controls.speedbrake_mode = settings["speedbrake_mode"]
-                self.speedbrake_mode_var.set(self.controls.speedbrake_mode)
-            
-            # Set controls active
-            if "controls_active" in settings:
-                self.controls.controls_active = settings["controls_active"]
-                self.controls_active_var.set(self.controls.controls_active)
+            # Simple flags: inversions, speedbrake mode, controls active
+            for key, target, var_name in self._SETTINGS_MAP:
+                value = get(key)
+                if value is None:
+                    continue
+                if isinstance(target, str):
+                    setattr(controls, target, value)
+                else:
+                    getattr(controls, target[0])[target[1]] = value
+                # The Tk variables only exist once the widgets have been built
+                var = getattr(self, var_name, None) if var_name else None
+                if var is not None:
+                    var.set(value)
+            self.controls_active = controls.controls_active
+            
+            # Calibration for each control
+            for control_type in self._CALIBRATION_SETTINGS:
+                saved = get(f"{control_type}_calibration")
+                if saved:
+                    calibration = getattr(controls.calibration, control_type)
+                    for field_name, value in saved.items():
+                        if field_name in _CAL_FIELDS:
+                            setattr(calibration, field_name, value)
             
             # Load control panel configuration
-            if "control_panel" in settings and "pot_config" in settings["control_panel"]:
-                for i, pot_settings in enumerate(settings["control_panel"]["pot_config"]):
-                    if i >= len(self.controls.control_panel.pot_config):
-                        break
-                    
-                    # Update pot configuration
-                    if "name" in pot_settings:
-                        self.controls.control_panel.set_pot_name(i, pot_settings["name"])
-                        # Update UI
-                        if hasattr(self, 'pot_name_vars') and i < len(self.pot_name_vars):
-                            self.pot_name_vars[i].set(pot_settings["name"])
-                    
-                    if "type" in pot_settings:
-                        self.controls.control_panel.set_pot_type(i, pot_settings["type"])
-                        # Update UI
-                        if hasattr(self, 'pot_type_vars') and i < len(self.pot_type_vars):
-                            self.pot_type_vars[i].set(pot_settings["type"])
-                    
-                    if "threshold" in pot_settings:
-                        self.controls.control_panel.set_pot_threshold(i, pot_settings["threshold"])
-                        # Update UI
-                        if hasattr(self, 'pot_threshold_vars') and i < len(self.pot_threshold_vars):
-                            self.pot_threshold_vars[i].set(pot_settings["threshold"])
-                    
-                    if "inversion" in pot_settings:
-                        # Set inversion to match saved value
-                        if self.controls.control_panel.pot_config[i]["inversion"] != pot_settings["inversion"]:
-                            self.controls.control_panel.toggle_pot_inversion(i)
-                        # Update UI
-                        if hasattr(self, 'pot_inversion_vars') and i < len(self.pot_inversion_vars):
-                            self.pot_inversion_vars[i].set(pot_settings["inversion"])
-                    
-                    if "min" in pot_settings:
-                        self.controls.control_panel.calibrate_pot_min(i, pot_settings["min"])
-                    
-                    if "max" in pot_settings:
-                        self.controls.control_panel.calibrate_pot_max(i, pot_settings["max"])
-                    
-                    if "vjoy_axis" in pot_settings:
-                        # Update pot configuration directly
-                        self.controls.control_panel.pot_config[i]["vjoy_axis"] = pot_settings["vjoy_axis"]
-                        # Update UI
-                        if hasattr(self, 'pot_axis_vars') and i < len(self.pot_axis_vars):
-                            self.pot_axis_vars[i].set(pot_settings["vjoy_axis"] if pot_settings["vjoy_axis"] else "None")
-                    
-                    if "button_id" in pot_settings:
-                        # Update pot configuration directly
-                        self.controls.control_panel.pot_config[i]["button_id"] = pot_settings["button_id"]
-                        # Update UI
-                        if hasattr(self, 'pot_button_vars') and i < len(self.pot_button_vars):
-                            self.pot_button_vars[i].set(pot_settings["button_id"] if pot_settings["button_id"] else "")
+            control_panel = controls.control_panel
+            pot_count = len(control_panel.pot_config)
+            pot_map = self._POT_SETTINGS_MAP
+            for i, pot_settings in enumerate(get("control_panel", {}).get("pot_config", [])[:pot_count]):
+                # Apply everything saved for this pot in one go
+                control_panel.update_pot(i, {
+                    config_key: pot_settings[key]
+                    for key, config_key, _, _ in pot_map if key in pot_settings
+                })
+                
+                # Update UI from the (validated) config
+                pot_ui_states = getattr(self, 'pot_ui_states', ())
+                if i < len(pot_ui_states):
+                    pot_ui = pot_ui_states[i]
+                    config = control_panel.pot_config[i]
+                    for key, config_key, var_name, blank in pot_map:
+                        if var_name:
+                            value = config[config_key]
+                            getattr(pot_ui, var_name).set(value if value is not None else blank)
+                    self._show_pot_calibration(i)
             
             # Load button states for toggle switches
             if "button_states" in settings:
-                self.controls.button_states = settings["button_states"]
+                controls.load_button_states(settings["button_states"])
             else:
-                # Initialize empty button states dictionary if not present
-                self.controls.button_states = {}
+                # Start with all toggles off if not present
+                controls.reset_button_states()
+            
+            # Pick up any calibration changes in the kernel parameters
+            controls.refresh_calibration()
             
             # Update UI
             self.update_calibration_status()
@@ -1651,61 +2254,44 @@ class FlightControlGUI:
     def save_settings(self):
         """Save all settings to a JSON file"""
         try:
+            controls = self.controls
             settings = {
-                "profile": self.controls.current_profile.name if self.controls.current_profile else None,
-                "controller_type": self.controls.controller_type.name if self.controls.controller_type else None,
-                "throttle_inversion": self.controls.invert_axis['throttle'],
-                "prop_inversion": self.controls.invert_axis['prop'],
-                "mixture_inversion": self.controls.invert_axis['mixture'],
-                "throttle_calibration": {
-                    "min": self.controls.calibration['throttle']['min'],
-                    "max": self.controls.calibration['throttle']['max'],
-                    "idle": self.controls.calibration['throttle']['idle']
-                },
-                "prop_calibration": {
-                    "min": self.controls.calibration['prop']['min'],
-                    "max": self.controls.calibration['prop']['max']
-                },
-                "mixture_calibration": {
-                    "min": self.controls.calibration['mixture']['min'],
-                    "max": self.controls.calibration['mixture']['max']
-                },
-                "reverse_calibration": {
-                    "min": self.controls.calibration['reverse']['min'],
-                    "max": self.controls.calibration['reverse']['max']
-                },
-                "speedbrake_mode": self.controls.prop_as_speedbrake,
-                "controls_active": self.controls_active if hasattr(self.controls, 'controls_active') else True,
-                # Save control panel configuration
-                "control_panel": {
-                    "pot_config": []
-                }
+                "profile": controls.current_profile.name if controls.current_profile else None,
+                "controller_type": controls.controller_type.name if controls.controller_type else None
             }
             
+            # Simple flags, from the same table load_settings uses
+            for key, target, var_name in self._SETTINGS_MAP:
+                if isinstance(target, str):
+                    settings[key] = getattr(controls, target)
+                else:
+                    settings[key] = getattr(controls, target[0])[target[1]]
+            
+            # Calibration for each control
+            for control_type in self._CALIBRATION_SETTINGS:
+                settings[f"{control_type}_calibration"] = asdict(getattr(controls.calibration, control_type))
+            
             # Save each potentiometer configuration
-            for i, config in enumerate(self.controls.control_panel.pot_config):
-                pot_settings = {
-                    "name": config["name"],
-                    "type": config["type"],
-                    "threshold": config["threshold"],
-                    "inversion": config["inversion"],
-                    "min": config["min"],
-                    "max": config["max"],
-                    "vjoy_axis": config["vjoy_axis"],
-                    "button_id": config["button_id"]
-                }
-                settings["control_panel"]["pot_config"].append(pot_settings)
+            settings["control_panel"] = {
+                "pot_config": [
+                    {key: config[config_key] for key, config_key, _, _ in self._POT_SETTINGS_MAP}
+                    for config in controls.control_panel.pot_config
+                ]
+            }
             
             # Save button states for toggle switches
-            if hasattr(self.controls, 'button_states'):
-                settings["button_states"] = self.controls.button_states
+            if hasattr(controls, 'button_states'):
+                settings["button_states"] = list(controls.button_states)
             
             # Create settings directory if it doesn't exist
             os.makedirs('settings', exist_ok=True)
             
-            # Save to file
-            with open('settings/flight_controls.json', 'w') as f:
-                json.dump(settings, f, indent=4)
+            # Save to a temporary file and swap it in, so a crash mid-write
+            # can't leave a truncated settings file behind
+            tmp_path = 'settings/flight_controls.json.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(settings))
+            os.replace(tmp_path, 'settings/flight_controls.json')
                 
             self.log_debug("Settings saved successfully")
         except Exception as e:
@@ -1723,6 +2309,7 @@ class FlightControlGUI:
     
     def create_tray_menu(self):
         """Create the system tray menu"""
+        import pystray
         return pystray.Menu(
             pystray.MenuItem("Show", self.show_window),
             pystray.MenuItem("Exit", self.quit_application)
@@ -1738,16 +2325,17 @@ class FlightControlGUI:
     def reset_calibration(self):
         """Reset all calibration to defaults"""
         # Get the current raw values to set as the idle points
-        throttle_value = self.last_raw_values['throttle']
-        prop_value = self.last_raw_values['prop']
-        mixture_value = self.last_raw_values['mixture']
-        
-        self.controls.calibration = {
-            'throttle': {'min': 0, 'max': 100, 'idle': throttle_value},
-            'reverse': {'min': 0, 'max': 100, 'idle': throttle_value},
-            'prop': {'min': 0, 'max': 100, 'idle': prop_value},
-            'mixture': {'min': 0, 'max': 100, 'idle': mixture_value}
-        }
+        throttle_value = self.last_raw_values[self._RAW_IDX['throttle']]
+        prop_value = self.last_raw_values[self._RAW_IDX['prop']]
+        mixture_value = self.last_raw_values[self._RAW_IDX['mixture']]
+        
+        self.controls.calibration = SimpleNamespace(
+            throttle=CalEntry(idle=throttle_value),
+            reverse=CalEntry(idle=throttle_value),
+            prop=CalEntry(idle=prop_value),
+            mixture=CalEntry(idle=mixture_value)
+        )
+        self.controls.refresh_calibration()
         
         # Update calibration status display
         self.update_calibration_status()
@@ -1758,95 +2346,91 @@ class FlightControlGUI:
         )
         
         # Reset status after 2 seconds
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Connected", foreground="green"
-        ))
+        self._schedule_status_reset()
 
     def update_mapping_text(self):
         """Update the mapping text based on current profile and controller type"""
-        self.mapping_text.delete(1.0, tk.END)
+        # Settings can be loaded before the widgets exist
+        if not hasattr(self, 'mapping_text'):
+            return
         
-        # Define mappings for all profiles
-        prop_text = "Speedbrake/Spoilers" if self.controls.prop_as_speedbrake else "Prop"
+        controls = self.controls
+        mapping = _build_mapping_text(controls.controller_type, controls.current_profile,
+                                      controls.prop_as_speedbrake)
         
-        # Different mappings based on controller type
-        if self.controls.controller_type == ControllerType.VJOY:
-            # vJoy mappings are the same for all profiles
-            mapping = f"""vJoy Device Mapping:
-Forward Thrust: vJoy X-Axis
-Reverse Thrust: vJoy XRot-Axis
-{prop_text}: vJoy Y-Axis
-Mixture: vJoy Z-Axis
-
-Note: In your simulator's controls:
-1. Select 'vJoy Device' in controller options
-2. Bind axes as follows:
-   - Forward Throttle -> X Axis
-   - Reverse Throttle -> XRot Axis
-   - {prop_text} -> Y Axis
-   - Mixture -> Z Axis"""
-        else:
-            # Xbox controller mappings vary by profile
-            mappings = {
-                ControlProfile.MSFS: f"""Throttle: Right/Left Triggers
-{prop_text}: Right Stick Y
-Mixture: Left Stick Y""",
-                
-                ControlProfile.DCS: f"""Throttle: Left Stick Y
-{prop_text}: Left Stick X
-Mixture: Right Stick Y""",
-                
-                ControlProfile.XPLANE: f"""Throttle: Right/Left Triggers
-{prop_text}: Right Stick Y
-Mixture: Right Stick X""",
-                
-                ControlProfile.IL2: f"""Throttle: Left Stick Y
-{prop_text}: Right Trigger
-Mixture: Left Trigger""",
-                
-                ControlProfile.WAR_THUNDER: f"""War Thunder Setup (Xbox):
-Throttle: Right/Left Triggers
-{prop_text}: Right Stick Y
-Mixture: Left Stick Y"""
-            }
-            
-            # Get mapping for current profile, or use default text if not found
-            mapping = mappings.get(
-                self.controls.current_profile,
-                "Profile mapping not defined"
-            )
+        # Leave the widget alone if the text hasn't changed
+        if mapping == self._last_mapping_text:
+            return
+        self._last_mapping_text = mapping
         
+        self.mapping_text.delete(1.0, tk.END)
         self.mapping_text.insert(1.0, mapping)
 
+    def _on_tab_changed(self, event=None):
+        """Build tab contents that are created on first view"""
+        if self.notebook.index('current') == 0:
+            self._build_cal_status()
+    
+    def _build_cal_status(self):
+        """Create the calibration status labels the first time they are needed"""
+        if self._cal_status_built:
+            return
+        self._cal_status_built = True
+        
+        # Create labels to show current calibration values: (name, control)
+        status_rows = [
+            ("Throttle", 'throttle'),
+            ("Reverse", 'reverse'),
+            ("Prop", 'prop'),
+            ("Mixture", 'mixture')
+        ]
+        for row, (text, control_type) in enumerate(status_rows):
+            ttk.Label(self.cal_status_frame, text=f"{text} Idle:").grid(row=row, column=0, padx=5, pady=2, sticky='e')
+            idle_label = ttk.Label(self.cal_status_frame)
+            idle_label.grid(row=row, column=1, padx=5, pady=2, sticky='w')
+            
+            ttk.Label(self.cal_status_frame, text=f"{text} Max:").grid(row=row, column=2, padx=5, pady=2, sticky='e')
+            max_label = ttk.Label(self.cal_status_frame)
+            max_label.grid(row=row, column=3, padx=5, pady=2, sticky='w')
+            
+            setattr(self, f"{control_type}_idle_label", idle_label)
+            setattr(self, f"{control_type}_max_label", max_label)
+        
+        # Fill in the current calibration values
+        self.update_calibration_status()
+    
     def update_calibration_status(self):
         """Update the calibration status display"""
+        # Nothing to update until the labels exist
+        if not self._cal_status_built:
+            return
+        
         # Update throttle calibration labels
-        self.throttle_idle_label.config(text=str(self.controls.calibration['throttle']['idle']))
-        self.throttle_max_label.config(text=str(self.controls.calibration['throttle']['max']))
+        self.throttle_idle_label.config(text=str(self.controls.calibration.throttle.idle))
+        self.throttle_max_label.config(text=str(self.controls.calibration.throttle.max))
         
         # Update reverse calibration labels
-        self.reverse_idle_label.config(text=str(self.controls.calibration['reverse']['idle']))
-        self.reverse_max_label.config(text=str(self.controls.calibration['reverse']['min']))
+        self.reverse_idle_label.config(text=str(self.controls.calibration.reverse.idle))
+        self.reverse_max_label.config(text=str(self.controls.calibration.reverse.min))
         
         # Update prop calibration labels
-        self.prop_idle_label.config(text=str(self.controls.calibration['prop']['idle']))
-        self.prop_max_label.config(text=str(self.controls.calibration['prop']['max']))
+        self.prop_idle_label.config(text=str(self.controls.calibration.prop.idle))
+        self.prop_max_label.config(text=str(self.controls.calibration.prop.max))
         
         # Update mixture calibration labels
-        self.mixture_idle_label.config(text=str(self.controls.calibration['mixture']['idle']))
-        self.mixture_max_label.config(text=str(self.controls.calibration['mixture']['max']))
+        self.mixture_idle_label.config(text=str(self.controls.calibration.mixture.idle))
+        self.mixture_max_label.config(text=str(self.controls.calibration.mixture.max))
 
-    def set_idle_point(self, control_type):
-        """Set the idle point for a control"""
-        raw_value = self.last_raw_values[control_type]
+    def _set_calibration_point(self, control_type, field, label):
+        """Store the control's current raw value as one of its calibration points"""
+        raw_value = self.last_raw_values[self._RAW_IDX[control_type]]
         
-        # Set the idle point
-        self.controls.calibration[control_type]['idle'] = raw_value
+        setattr(getattr(self.controls.calibration, control_type), field, raw_value)
+        self.controls.refresh_calibration()
         
         # Show confirmation message
-        control_name = control_type.capitalize()
         self.status_label.config(
-            text=f"{control_name} idle point set to {raw_value}", 
+            text=f"{label} set to {raw_value}", 
             foreground="blue"
         )
         
@@ -1854,73 +2438,25 @@ Mixture: Left Stick Y"""
         self.update_calibration_status()
         
         # Reset status after 2 seconds
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Connected", foreground="green"
-        ))
+        self._schedule_status_reset()
+
+    def set_idle_point(self, control_type):
+        """Set the idle point for a control"""
+        self._set_calibration_point(control_type, 'idle', f"{control_type.capitalize()} idle point")
 
     def set_max_forward(self):
         """Set the maximum forward throttle point"""
-        raw_value = self.last_raw_values['throttle']
-        
-        # Set the max point for throttle
-        self.controls.calibration['throttle']['max'] = raw_value
-        
-        # Show confirmation message
-        self.status_label.config(
-            text=f"Maximum forward throttle set to {raw_value}", 
-            foreground="blue"
-        )
-        
-        # Update calibration status display
-        self.update_calibration_status()
-        
-        # Reset status after 2 seconds
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Connected", foreground="green"
-        ))
+        self._set_calibration_point('throttle', 'max', "Maximum forward throttle")
 
     def set_max_reverse(self):
-        """Set the maximum reverse throttle point"""
-        raw_value = self.last_raw_values['throttle']
-        
-        # Set the min point for reverse
-        self.controls.calibration['reverse']['min'] = raw_value
-        
-        # Show confirmation message
-        self.status_label.config(
-            text=f"Maximum reverse throttle set to {raw_value}", 
-            foreground="blue"
-        )
-        
-        # Update calibration status display
-        self.update_calibration_status()
-        
-        # Reset status after 2 seconds
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Connected", foreground="green"
-        ))
+        """Set the maximum reverse throttle point (the reverse minimum)"""
+        # Reverse reads the same raw throttle value
+        self._set_calibration_point('reverse', 'min', "Maximum reverse throttle")
 
     def set_max_position(self, control_type):
         """Set the maximum position for prop or mixture"""
-        raw_value = self.last_raw_values[control_type]
-        
-        # Set the max point
-        self.controls.calibration[control_type]['max'] = raw_value
-        
-        # Show confirmation message
         control_name = "Speedbrake" if control_type == 'prop' and self.controls.prop_as_speedbrake else control_type.capitalize()
-        self.status_label.config(
-            text=f"Maximum {control_name} position set to {raw_value}", 
-            foreground="blue"
-        )
-        
-        # Update calibration status display
-        self.update_calibration_status()
-        
-        # Reset status after 2 seconds
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Connected", foreground="green"
-        ))
+        self._set_calibration_point(control_type, 'max', f"Maximum {control_name} position")
 
     def toggle_speedbrake_mode(self):
         """Toggle between prop and speedbrake mode"""
@@ -1936,13 +2472,12 @@ Mixture: Left Stick Y"""
         self.update_mapping_text()
         
         # Reset status after 2 seconds
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Connected", foreground="green"
-        ))
+        self._schedule_status_reset()
 
     def toggle_controls(self):
         """Toggle controls active/inactive"""
         self.controls_active = not self.controls_active
+        self.controls.controls_active = self.controls_active
         if self.controls_active:
             self.toggle_button.config(text="Pause Controls")
             self.status_label.config(text="Controls Active", foreground="green")
@@ -1960,36 +2495,33 @@ Mixture: Left Stick Y"""
         # Update COM port
         self.com_port = self.com_var.get()
         
-        # Restart serial thread
-        self.running = False
-        time.sleep(0.5)  # Give time for thread to stop
-        self.running = True
-        self.start_serial_thread()
+        # Restart serial thread once the old one has let go of the port
+        self._restart_reader('_serial_thread', self._serial_stop, self.start_serial_thread)
         
         self.status_label.config(text=f"Connecting to {self.com_port}...", foreground="blue")
 
     def reset_control_panel_connection(self):
         """Reset the control panel connection"""
-        if hasattr(self, 'control_panel_running'):
-            self.control_panel_running = False
-            time.sleep(0.5)  # Give time for thread to stop
-        
-        # Clear any stored values
-        self.last_control_panel_values = [0] * 7
+        # Clear any stored values, in place
+        last_values = self.last_control_panel_values
+        for i in range(7):
+            last_values[i] = 0.0
         
-        # Restart the thread
-        self.control_panel_running = True
-        self.start_control_panel_thread()
+        # Restart the thread once the old one has stopped
+        self._restart_reader('_control_panel_thread', self._control_panel_stop,
+                             self.start_control_panel_thread)
         
         self.status_label.config(text=f"Resetting control panel connection...", foreground="blue")
 
     def open_pot_calibration_tool(self):
         """Open a tool to help calibrate the potentiometers"""
-        if hasattr(self, 'calibration_window') and self.calibration_window.winfo_exists():
+        if self._calibration_open:
             self.calibration_window.lift()
             return
             
         self.calibration_window = tk.Toplevel(self.root)
+        self.calibration_window.bind("<Destroy>", self._on_calibration_destroy)
+        self._calibration_open = True
         self.calibration_window.title("Potentiometer Calibration Tool")
         self.calibration_window.geometry("800x600")
         
@@ -2027,6 +2559,7 @@ Mixture: Left Stick Y"""
         # Create a canvas for the potentiometer values
         self.pot_canvas = tk.Canvas(pots_frame, bg='white')
         self.pot_canvas.pack(fill='both', expand=True)
+        self._build_calibration_items()
         
         # Create labels for each potentiometer
         self.pot_labels = []
@@ -2043,14 +2576,25 @@ Mixture: Left Stick Y"""
         self.pot_min_values = [1023] * 7
         self.pot_max_values = [0] * 7
         
-        # Start updating the display
+        # Draw the current values; later redraws are driven by incoming data
+        self._last_rendered_values = None
         self.update_calibration_display()
 
+    def _on_calibration_destroy(self, event):
+        """Note that the calibration window is gone"""
+        # <Destroy> is also delivered for each child widget; only the window itself counts
+        if event.widget is self.calibration_window:
+            self._calibration_open = False
+
     def toggle_capture_minmax(self):
         """Toggle capturing min/max values"""
         self.capturing_minmax = not self.capturing_minmax
         if self.capturing_minmax:
             self.capture_button.config(text="Stop Capturing Min/Max")
+            
+            # Start from the current position even if the pots aren't moving
+            self._last_rendered_values = None
+            self.update_calibration_display()
         else:
             self.capture_button.config(text="Start Capturing Min/Max")
             
@@ -2065,64 +2609,111 @@ Mixture: Left Stick Y"""
         self.pot_min_values = [1023] * 7
         self.pot_max_values = [0] * 7
         self.log_debug("Reset min/max values for all potentiometers")
+        
+        # Show the cleared values right away
+        self._last_rendered_values = None
+        self.update_calibration_display()
 
     def apply_pot_calibration(self):
         """Apply the captured min/max values to the potentiometer calibration"""
-        for i in range(7):
-            self.controls.control_panel.pot_config[i]['calibrated_min'] = self.pot_min_values[i]
-            self.controls.control_panel.pot_config[i]['calibrated_max'] = self.pot_max_values[i]
+        # Both bounds go in with one update per pot, so its arrays are synced once
+        control_panel = self.controls.control_panel
+        for i, (cal_min, cal_max) in enumerate(zip(self.pot_min_values, self.pot_max_values)):
+            control_panel.update_pot(i, {'calibrated_min': cal_min, 'calibrated_max': cal_max})
+            self._show_pot_calibration(i)
         
         self.log_debug("Applied calibration to all potentiometers")
         
         # Update the status
         self.status_label.config(text="Potentiometer calibration applied", foreground="blue")
-        self.root.after(2000, lambda: self.status_label.config(text="Connected", foreground="green"))
+        self._schedule_status_reset()
+
+    def _build_calibration_items(self):
+        """Create the canvas items for each pot once so updates only move and relabel them"""
+        canvas = self.pot_canvas
+        # One parallel list per item kind, indexed by pot, like the SoA arrays
+        # in ControlPanelConfig; the redraw indexes them without dict probes
+        self._pot_needles = []
+        self._pot_value_items = []
+        self._pot_min_items = []
+        self._pot_max_items = []
+        self._last_pot_shown = [None] * 7
+        for i in range(7):
+            # Calculate position
+            x_pos = 50 + (i * 100)
+            y_pos = 300
+            
+            # Draw the potentiometer
+            canvas.create_oval(x_pos-40, y_pos-40, x_pos+40, y_pos+40, fill='lightgray')
+            
+            # The indicator line, value and min/max texts are filled in by
+            # update_calibration_display; the shared tags address a whole group at once
+            self._pot_needles.append(canvas.create_line(x_pos, y_pos, x_pos, y_pos, width=3, fill='red',
+                                                        tags=("needle", f"needle_{i}")))
+            self._pot_value_items.append(canvas.create_text(x_pos, y_pos+50, font=('Arial', 10),
+                                                            tags=("pot_val", f"pot_val_{i}")))
+            self._pot_min_items.append(canvas.create_text(x_pos, y_pos+70, font=('Arial', 8),
+                                                          tags=("pot_min", f"pot_min_{i}")))
+            self._pot_max_items.append(canvas.create_text(x_pos, y_pos+85, font=('Arial', 8),
+                                                          tags=("pot_max", f"pot_max_{i}")))
 
     def update_calibration_display(self):
         """Update the calibration display"""
-        if hasattr(self, 'calibration_window') and self.calibration_window.winfo_exists():
-            # Clear the canvas
-            self.pot_canvas.delete("all")
-            
-            # Draw the potentiometer values
-            for i, value in enumerate(self.last_control_panel_values):
-                # Update min/max if capturing
-                if self.capturing_minmax:
-                    if value < self.pot_min_values[i]:
-                        self.pot_min_values[i] = value
-                    if value > self.pot_max_values[i]:
-                        self.pot_max_values[i] = value
+        if self._calibration_open:
+            # Nothing to do if the pots haven't moved since the last redraw
+            values = tuple(self.last_control_panel_values)
+            previous = self._last_rendered_values
+            if values == previous:
+                return
+            self._last_rendered_values = values
+            
+            # Update min/max if capturing, all pots in one pass each
+            if self.capturing_minmax:
+                int_values = [int(value) for value in values]
+                self.pot_min_values = list(map(min, self.pot_min_values, int_values))
+                self.pot_max_values = list(map(max, self.pot_max_values, int_values))
+            min_values = self.pot_min_values
+            max_values = self.pot_max_values
+            
+            # What each pot currently shows, as ints; a forced redraw starts over
+            if previous is None:
+                self._last_pot_shown = [None] * 7
+            last_shown = self._last_pot_shown
+            
+            canvas = self.pot_canvas
+            needles = self._pot_needles
+            value_items = self._pot_value_items
+            min_items = self._pot_min_items
+            max_items = self._pot_max_items
+            
+            # Update the potentiometer items in place
+            for i, value in enumerate(values):
+                # Pots whose needle position and texts come out the same keep
+                # their items as drawn, so no strings are formatted for them
+                # (round() matches the :.0f formatting used before)
+                iv = min(max(int(value), 0), 1023)
+                shown = (iv, round(value), min_values[i], max_values[i])
+                if last_shown[i] == shown:
+                    continue
+                last_shown[i] = shown
+                _, value_shown, min_shown, max_shown = shown
                 
                 # Calculate position
                 x_pos = 50 + (i * 100)
                 y_pos = 300
                 
-                # Draw the potentiometer
-                self.pot_canvas.create_oval(x_pos-40, y_pos-40, x_pos+40, y_pos+40, fill='lightgray')
-                
-                # Draw the indicator line
-                angle = (value / 1023) * 270 - 135  # -135 to 135 degrees
-                rad_angle = math.radians(angle)
-                end_x = x_pos + 35 * math.cos(rad_angle)
-                end_y = y_pos + 35 * math.sin(rad_angle)
-                self.pot_canvas.create_line(x_pos, y_pos, end_x, end_y, width=3, fill='red')
+                # Move the indicator line (clamped into the lookup table's range)
+                end_x = x_pos + _NEEDLE_DX[iv]
+                end_y = y_pos + _NEEDLE_DY[iv]
+                canvas.coords(needles[i], x_pos, y_pos, end_x, end_y)
                 
-                # Draw the value
-                self.pot_canvas.create_text(x_pos, y_pos+50, text=f"{value:.0f}", font=('Arial', 10))
-                
-                # Draw the min/max values
-                self.pot_canvas.create_text(x_pos, y_pos+70, 
-                                           text=f"Min: {self.pot_min_values[i]:.0f}", 
-                                           font=('Arial', 8))
-                self.pot_canvas.create_text(x_pos, y_pos+85, 
-                                           text=f"Max: {self.pot_max_values[i]:.0f}", 
-                                           font=('Arial', 8))
+                # Update the value and min/max values
+                canvas.itemconfigure(value_items[i], text=f"{value_shown}")
+                canvas.itemconfigure(min_items[i], text=f"Min: {min_shown}")
+                canvas.itemconfigure(max_items[i], text=f"Max: {max_shown}")
                 
                 # Update the label
-                self.pot_labels[i].config(text=f"Pot {i+1}: {value:.0f} (Min: {self.pot_min_values[i]:.0f}, Max: {self.pot_max_values[i]:.0f})")
-            
-            # Schedule the next update
-            self.calibration_window.after(50, self.update_calibration_display)
+                self.pot_labels[i].config(text=f"Pot {i+1}: {value_shown} (Min: {min_shown}, Max: {max_shown})")
 
     def set_pot_vjoy_axis(self, index, axis_name):
         """Set the vJoy axis for a potentiometer"""
@@ -2131,11 +2722,19 @@ Mixture: Left Stick Y"""
             if axis_name == "None":
                 axis_name = None
             
+            # Nothing to do if this mapping was just applied with the same pot
+            # value and the config still holds it (other code can remap pots)
+            pot = self.controls.control_panel.pot_config[index]
+            mapping = (axis_name, pot["last_value"])
+            if self._last_axis_mapping.get(index) == mapping and pot["vjoy_axis"] == axis_name:
+                return True
+            self._last_axis_mapping[index] = mapping
+            
             # Update the pot configuration
-            self.controls.control_panel.pot_config[index]["vjoy_axis"] = axis_name
+            self.controls.control_panel.set_pot_vjoy_axis(index, axis_name)
             
             # Update the UI
-            self.pot_axis_vars[index].set(axis_name if axis_name else "None")
+            self.pot_ui_states[index].axis.set(axis_name if axis_name else "None")
             
             # Test the axis if a valid axis is selected
             if axis_name and self.controls.vjoy_dev:
@@ -2147,36 +2746,25 @@ Mixture: Left Stick Y"""
                         processed = self.controls.control_panel.process_pot_value(index, pot_value)
                         
                         # Map 0-100 to 0-32768
-                        axis_value = int(processed * 327.68)
+                        axis_value = _to_axis(processed)
                         
                         # Set the appropriate axis
-                        if axis_name == "X":
-                            self.controls.vjoy_dev.data.wAxisX = axis_value
-                        elif axis_name == "Y":
-                            self.controls.vjoy_dev.data.wAxisY = axis_value
-                        elif axis_name == "Z":
-                            self.controls.vjoy_dev.data.wAxisZ = axis_value
-                        elif axis_name == "RX":
-                            self.controls.vjoy_dev.data.wAxisXRot = axis_value
-                        elif axis_name == "RY":
-                            self.controls.vjoy_dev.data.wAxisYRot = axis_value
-                        elif axis_name == "RZ":
-                            self.controls.vjoy_dev.data.wAxisZRot = axis_value
-                        elif axis_name == "SL0":
-                            self.controls.vjoy_dev.data.wSlider = axis_value
-                        elif axis_name == "SL1":
-                            self.controls.vjoy_dev.data.wDial = axis_value
+                        vjoy_dev = self.controls.vjoy_dev
+                        field = VJOY_AXIS_FIELDS.get(axis_name)
+                        if field:
+                            setattr(vjoy_dev.data, field, axis_value)
                         
                         # Update vJoy
-                        self.controls.vjoy_dev.update()
+                        vjoy_dev.update()
                         
                         # Show confirmation
-                        self.log_debug(f"Pot {index} mapped to vJoy {axis_name} axis with value {axis_value}")
+                        if self.debug_mode:
+                            self.log_debug(f"Pot {index} mapped to vJoy {axis_name} axis with value {axis_value}")
                 except Exception as e:
                     self.log_debug(f"Error testing axis: {str(e)}")
             
             # Save settings after changing axis mapping
-            self.save_settings()
+            self._schedule_save_settings()
             
             return True
         except Exception as e:
@@ -2187,22 +2775,9 @@ Mixture: Left Stick Y"""
         """Reset a vJoy axis to 0"""
         if hasattr(self.controls, 'vjoy_dev') and self.controls.vjoy_dev is not None:
             try:
-                if axis_name == "X":
-                    self.controls.vjoy_dev.data.wAxisX = 0
-                elif axis_name == "Y":
-                    self.controls.vjoy_dev.data.wAxisY = 0
-                elif axis_name == "Z":
-                    self.controls.vjoy_dev.data.wAxisZ = 0
-                elif axis_name == "RX":
-                    self.controls.vjoy_dev.data.wAxisXRot = 0
-                elif axis_name == "RY":
-                    self.controls.vjoy_dev.data.wAxisYRot = 0
-                elif axis_name == "RZ":
-                    self.controls.vjoy_dev.data.wAxisZRot = 0
-                elif axis_name == "SL0":
-                    self.controls.vjoy_dev.data.wSlider = 0
-                elif axis_name == "SL1":
-                    self.controls.vjoy_dev.data.wDial = 0
+                field = VJOY_AXIS_FIELDS.get(axis_name)
+                if field:
+                    setattr(self.controls.vjoy_dev.data, field, 0)
                 
                 self.controls.vjoy_dev.update()
             except Exception as e:
@@ -2216,10 +2791,10 @@ Mixture: Left Stick Y"""
                 button_id = None
             
             # Update the pot configuration
-            self.controls.control_panel.pot_config[index]["button_id"] = button_id
+            self.controls.control_panel.set_pot_button_id(index, button_id)
             
             # Update the UI
-            self.pot_button_vars[index].set(button_id if button_id else "")
+            self.pot_ui_states[index].button.set(button_id if button_id else "")
             
             # Test the button if a valid button ID is provided
             if button_id and self.controls.vjoy_dev:
@@ -2227,36 +2802,31 @@ Mixture: Left Stick Y"""
                     # Convert button ID to integer
                     button_id_int = int(button_id)
                     
+                    vjoy_dev = self.controls.vjoy_dev
+                    
                     # Try to press the button using bit manipulation
                     try:
-                        # Calculate which bit to set
-                        bit_position = button_id_int - 1
-                        button_mask = 1 << bit_position
-                        
-                        # Get current button state
-                        current_buttons = self.controls.vjoy_dev.data.lButtons
-                        
-                        # Set the button bit
-                        self.controls.vjoy_dev.data.lButtons = current_buttons | button_mask
-                        self.controls.vjoy_dev.update()
+                        self._set_button_bit(button_id_int, True)
                         
                         # Schedule to release the button after 500ms
-                        self.root.after(500, lambda: self.release_button_bit(button_id_int))
+                        self.root.after(500, partial(self.release_button_bit, button_id_int))
                         
                         # Show confirmation
-                        self.log_debug(f"Pot {index} mapped to button {button_id_int} (using bit manipulation)")
+                        if self.debug_mode:
+                            self.log_debug(f"Pot {index} mapped to button {button_id_int} (using bit manipulation)")
                     except Exception as bit_error:
                         self.log_debug(f"Bit manipulation failed: {str(bit_error)}")
                         
                         # Try standard method as fallback
-                        self.controls.vjoy_dev.set_button(button_id_int, 1)
-                        self.controls.vjoy_dev.update()
+                        vjoy_dev.set_button(button_id_int, 1)
+                        vjoy_dev.update()
                         
                         # Schedule to release the button after 500ms
-                        self.root.after(500, lambda: self.release_test_button(button_id_int))
+                        self.root.after(500, partial(self.release_test_button, button_id_int))
                         
                         # Show confirmation
-                        self.log_debug(f"Pot {index} mapped to button {button_id_int} (using standard method)")
+                        if self.debug_mode:
+                            self.log_debug(f"Pot {index} mapped to button {button_id_int} (using standard method)")
                 except ValueError:
                     self.log_debug(f"Invalid button ID: {button_id}")
                     return False
@@ -2265,7 +2835,7 @@ Mixture: Left Stick Y"""
                     return False
             
             # Save settings after changing button mapping
-            self.save_settings()
+            self._schedule_save_settings()
             
             return True
         
@@ -2273,20 +2843,48 @@ Mixture: Left Stick Y"""
             self.log_debug(f"Error setting button ID: {str(e)}")
             return False
 
+    def _set_button_bit(self, button_id, pressed):
+        """Set or clear one button's bit in lButtons and send the state to vJoy"""
+        button_mask = _button_mask(button_id)
+        vjoy_dev = self.controls.vjoy_dev
+        data = vjoy_dev.data
+        current_buttons = data.lButtons
+        if pressed:
+            new_buttons = current_buttons | button_mask
+        else:
+            new_buttons = current_buttons & ~button_mask
+        
+        # Every lButtons writer calls update() afterwards, so an unchanged value
+        # is already what the driver has and the update can be skipped
+        if new_buttons == current_buttons:
+            return
+        data.lButtons = new_buttons
+        vjoy_dev.update()
+
+    def _set_button_state(self, button_id, pressed):
+        """Set a button through lButtons, falling back to set_button; returns the method used"""
+        # Uses the controls' one-shot lButtons probe; once bit manipulation has
+        # failed it is not tried again
+        if self.controls.vjoy_bitfield:
+            try:
+                self._set_button_bit(button_id, pressed)
+                return "bit manipulation"
+            except ValueError as bit_error:
+                # A bad button id says nothing about whether lButtons works
+                print(f"Bit manipulation failed: {str(bit_error)}")
+            except Exception as bit_error:
+                print(f"Bit manipulation failed: {str(bit_error)}")
+                self.controls.vjoy_bitfield = False
+        
+        self.controls.vjoy_dev.set_button(button_id, 1 if pressed else 0)
+        self.controls.vjoy_dev.update()
+        return "standard method"
+
     def release_button_bit(self, button_id):
         """Release a button using bit manipulation"""
         try:
-            # Calculate which bit to clear
-            bit_position = button_id - 1
-            button_mask = 1 << bit_position
-            
-            # Get current button state
-            current_buttons = self.controls.vjoy_dev.data.lButtons
-            
-            # Clear the button bit
-            self.controls.vjoy_dev.data.lButtons = current_buttons & ~button_mask
-            self.controls.vjoy_dev.update()
-            print(f"Button {button_id} released using bit manipulation")
+            self._set_button_bit(button_id, False)
+            self.log_debug("Button %d released using bit manipulation", button_id)
         except Exception as e:
             print(f"Error releasing button bit: {str(e)}")
 
@@ -2309,22 +2907,15 @@ Mixture: Left Stick Y"""
             # Show testing message
             self.status_label.config(text=f"Testing button {button_id}...", foreground="blue")
             
+            vjoy_dev = self.controls.vjoy_dev
+            
             # Try to press the button using bit manipulation
             try:
-                # Calculate which bit to set
-                bit_position = button_id - 1
-                button_mask = 1 << bit_position
-                
-                # Get current button state
-                current_buttons = self.controls.vjoy_dev.data.lButtons
-                
-                # Press the button
-                self.controls.vjoy_dev.data.lButtons = current_buttons | button_mask
-                self.controls.vjoy_dev.update()
-                print(f"Button {button_id} pressed using bit manipulation")
+                self._set_button_bit(button_id, True)
+                self.log_debug("Button %d pressed using bit manipulation", button_id)
                 
                 # Schedule to release the button after 500ms
-                self.root.after(500, lambda: self.release_button_bit(button_id))
+                self.root.after(500, partial(self.release_button_bit, button_id))
                 
                 # Show success message
                 self.status_label.config(text=f"Button {button_id} pressed (bit manipulation)", foreground="blue")
@@ -2333,12 +2924,12 @@ Mixture: Left Stick Y"""
                 
                 # Try standard method as fallback
                 try:
-                    self.controls.vjoy_dev.set_button(button_id, 1)
-                    self.controls.vjoy_dev.update()
-                    print(f"Button {button_id} pressed using standard method")
+                    vjoy_dev.set_button(button_id, 1)
+                    vjoy_dev.update()
+                    self.log_debug("Button %d pressed using standard method", button_id)
                     
                     # Schedule to release the button after 500ms
-                    self.root.after(500, lambda: self.release_test_button(button_id))
+                    self.root.after(500, partial(self.release_test_button, button_id))
                     
                     # Show success message
                     self.status_label.config(text=f"Button {button_id} pressed (standard method)", foreground="blue")
@@ -2369,14 +2960,7 @@ Mixture: Left Stick Y"""
         """Release a test button using alternative method"""
         try:
             if hasattr(self.controls.vjoy_dev.data, 'lButtons'):
-                # Calculate which bit to clear
-                bit_position = button_id - 1
-                button_mask = 1 << bit_position
-                
-                # Clear the button bit
-                current_buttons = self.controls.vjoy_dev.data.lButtons
-                self.controls.vjoy_dev.data.lButtons = current_buttons & ~button_mask
-                self.controls.vjoy_dev.update()
+                self._set_button_bit(button_id, False)
                 self.status_label.config(text=f"Button {button_id} released (alt method)", foreground="green")
             else:
                 self.status_label.config(text="lButtons not available for release", foreground="red")
@@ -2393,36 +2977,46 @@ Mixture: Left Stick Y"""
         try:
             # Test axes
             self.log_debug("Testing vJoy axes...")
-            self.controls.vjoy_dev.data.wAxisX = 16384  # 50%
-            self.controls.vjoy_dev.data.wAxisY = 8192   # 25% 
-            self.controls.vjoy_dev.data.wAxisZ = 24576  # 75%
-            self.controls.vjoy_dev.update()
+            vjoy_dev = self.controls.vjoy_dev
+            data = vjoy_dev.data
+            data.wAxisX = 16384  # 50%
+            data.wAxisY = 8192   # 25% 
+            data.wAxisZ = 24576  # 75%
+            vjoy_dev.update()
             self.log_debug("Axes set to: X=50%, Y=25%, Z=75%")
             
-            # Test buttons
+            # Test buttons 1-4; the presses and releases are spaced out
+            # with after() so the GUI isn't frozen while the test runs
             self.log_debug("Testing vJoy buttons...")
-            for i in range(1, 5):  # Test buttons 1-4
-                self.log_debug(f"Pressing button {i}")
-                self.controls.vjoy_dev.set_button(i, 1)
-                self.controls.vjoy_dev.update()
-                time.sleep(0.5)
-                
-                self.log_debug(f"Releasing button {i}")
-                self.controls.vjoy_dev.set_button(i, 0)
-                self.controls.vjoy_dev.update()
-                time.sleep(0.5)
-                
+            self._test_vjoy_button_step(1, True)
+        except Exception as e:
+            self.log_debug(f"vJoy test error: {str(e)}")
+            print(f"vJoy test error: {str(e)}")
+
+    def _test_vjoy_button_step(self, i, press):
+        """Press or release one button of the vJoy test, then schedule the next step"""
+        if i > 4:
             self.log_debug("vJoy test complete")
+            return
+        
+        try:
+            # Flip the button's bit in lButtons; update() sends the whole state in one call
+            self.log_debug(f"{'Pressing' if press else 'Releasing'} button {i}")
+            self._set_button_bit(i, press)
         except Exception as e:
             self.log_debug(f"vJoy test error: {str(e)}")
             print(f"vJoy test error: {str(e)}")
+            return
+        
+        # Release this button next, or move on to the following one
+        if press:
+            self.root.after(500, partial(self._test_vjoy_button_step, i, False))
+        else:
+            self.root.after(500, partial(self._test_vjoy_button_step, i + 1, True))
 
+    @_needs_vjoy
     def test_vjoy_direct(self):
         """Test vJoy functionality directly"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         try:
             # Test basic axis functionality
             self.log_debug("Setting X axis to 50%")
@@ -2453,43 +3047,37 @@ Mixture: Left Stick Y"""
         except Exception as e:
             self.log_debug(f"vJoy test error: {str(e)}")
 
+    @_needs_vjoy
     def reset_vjoy(self):
         """Reset all vJoy controls to default state"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         try:
             # Reset all axes to center
-            self.controls.vjoy_dev.data.wAxisX = 0
-            self.controls.vjoy_dev.data.wAxisY = 0
-            self.controls.vjoy_dev.data.wAxisZ = 0
-            self.controls.vjoy_dev.data.wAxisXRot = 0
-            self.controls.vjoy_dev.data.wAxisYRot = 0
-            self.controls.vjoy_dev.data.wAxisZRot = 0
-            self.controls.vjoy_dev.data.wSlider = 0
-            self.controls.vjoy_dev.data.wDial = 0
-            
-            # Reset all buttons (first 32 buttons)
-            for i in range(1, 33):
-                try:
-                    self.controls.vjoy_dev.set_button(i, 0)
-                except:
-                    pass  # Ignore errors for buttons that don't exist
+            vjoy_dev = self.controls.vjoy_dev
+            data = vjoy_dev.data
+            for field in VJOY_AXIS_FIELDS.values():
+                setattr(data, field, 0)
+            
+            # Reset all buttons (first 32 buttons) in a single write
+            try:
+                data.lButtons = 0
+            except Exception:
+                # Fall back to standard method, one button at a time
+                for i in range(1, 33):
+                    try:
+                        vjoy_dev.set_button(i, 0)
+                    except:
+                        pass  # Ignore errors for buttons that don't exist
             
             # Update the device
-            self.controls.vjoy_dev.update()
+            vjoy_dev.update()
             
             self.log_debug("vJoy reset complete")
         except Exception as e:
             self.log_debug(f"vJoy reset error: {str(e)}")
 
+    @_needs_vjoy
     def scan_vjoy_buttons(self):
         """Scan for available vJoy buttons"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         self.log_debug("Scanning for available vJoy buttons...")
         
         # Create a new window for the results
@@ -2511,65 +3099,85 @@ Mixture: Left Stick Y"""
         def add_result(text):
             result_text.insert(tk.END, text + "\n")
             result_text.see(tk.END)
-            # Update the window to show progress
-            scan_window.update()
         
-        # Test buttons in a separate thread to keep UI responsive
-        def test_buttons():
+        vjoy_dev = self.controls.vjoy_dev
+        num_buttons = 32  # Default to testing 32 buttons
+        
+        # The scan runs as a chain of after() steps on the Tk thread, so the
+        # window stays responsive without touching Tk from another thread
+        def press_button(i, working_buttons):
+            # Stop if the window was closed mid-scan
+            if not scan_window.winfo_exists():
+                return
+            if i > num_buttons:
+                finish(working_buttons)
+                return
+            
+            # Try to press the button
+            try:
+                vjoy_dev.set_button(i, 1)
+                vjoy_dev.update()
+            except Exception as e:
+                add_result(f"Button {i}: Not available ({str(e)})")
+                scan_window.after(100, partial(press_button, i + 1, working_buttons))
+                return
+            
+            scan_window.after(100, partial(release_button, i, working_buttons))
+        
+        def release_button(i, working_buttons):
+            # Release the button even if the window was closed
+            try:
+                vjoy_dev.set_button(i, 0)
+                vjoy_dev.update()
+                available = True
+            except Exception as e:
+                available = False
+                error = e
+            
+            if not scan_window.winfo_exists():
+                return
+            if available:
+                add_result(f"Button {i}: Available")
+                working_buttons.append(i)
+            else:
+                add_result(f"Button {i}: Not available ({str(error)})")
+            
+            # Small delay between tests
+            scan_window.after(100, partial(press_button, i + 1, working_buttons))
+        
+        def finish(working_buttons):
             try:
-                # Get the number of buttons from vJoy
-                num_buttons = 32  # Default to testing 32 buttons
-                
-                add_result(f"Testing up to {num_buttons} buttons...")
-                
-                # Test each button
-                working_buttons = []
-                for i in range(1, num_buttons + 1):
-                    try:
-                        # Try to press and release the button
-                        self.controls.vjoy_dev.set_button(i, 1)
-                        self.controls.vjoy_dev.update()
-                        time.sleep(0.1)
-                        
-                        self.controls.vjoy_dev.set_button(i, 0)
-                        self.controls.vjoy_dev.update()
-                        
-                        add_result(f"Button {i}: Available")
-                        working_buttons.append(i)
-                    except Exception as e:
-                        add_result(f"Button {i}: Not available ({str(e)})")
-                    
-                    # Small delay between tests
-                    time.sleep(0.1)
-                
                 # Summary
                 if working_buttons:
-                    add_result("\nWorking buttons found: " + ", ".join(map(str, working_buttons)))
+                    lines = ["\nWorking buttons found: " + ", ".join(map(str, working_buttons))]
                 else:
-                    add_result("\nNo working buttons found!")
+                    lines = ["\nNo working buttons found!"]
                     
                 # Add instructions for mapping
-                add_result("\nTo map a button to a potentiometer:")
-                add_result("1. Go to the Control Panel tab")
-                add_result("2. Set a pot's type to 'Button' or 'Switch'")
-                add_result("3. Enter one of the working button IDs in the 'Button ID' field")
-                add_result("4. Click 'Set' to save the mapping")
+                lines += [
+                    "\nTo map a button to a potentiometer:",
+                    "1. Go to the Control Panel tab",
+                    "2. Set a pot's type to 'Button' or 'Switch'",
+                    "3. Enter one of the working button IDs in the 'Button ID' field",
+                    "4. Click 'Set' to save the mapping"
+                ]
+                
+                # One insert for the whole block
+                add_result("\n".join(lines))
                 
             except Exception as e:
                 add_result(f"Error during button scan: {str(e)}")
         
-        # Start the test in a separate thread
-        threading.Thread(target=test_buttons, daemon=True).start()
+        # Start the scan
+        add_result(f"Testing up to {num_buttons} buttons...")
+        scan_window.after(0, partial(press_button, 1, []))
         
         # Add a close button
         ttk.Button(scan_window, text="Close", command=scan_window.destroy).pack(pady=10)
 
+    @_needs_vjoy
     def test_specific_button(self):
         """Test a specific vJoy button"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         # Ask for button ID
         button_id = simpledialog.askinteger("Test Button", "Enter button ID to test:", 
                                            minvalue=1, maxvalue=128)
@@ -2594,12 +3202,22 @@ Mixture: Left Stick Y"""
         except Exception as e:
             self.log_debug(f"Button test error: {str(e)}")
 
+    def _get_vjoy_methods(self):
+        """Return the vJoy device's dir() listing and its bound button methods, cached per device"""
+        vjoy_dev = self.controls.vjoy_dev
+        cache = self._vjoy_methods_cache
+        if cache is None or cache[0] is not vjoy_dev:
+            all_methods, button_names, _ = _introspect(vjoy_dev)
+            all_methods = list(all_methods)
+            
+            # Bind any button-related methods
+            button_methods = [(name, getattr(vjoy_dev, name)) for name in button_names]
+            cache = self._vjoy_methods_cache = (vjoy_dev, all_methods, button_methods)
+        return cache[1], cache[2]
+
+    @_needs_vjoy
     def test_button_all_methods(self):
         """Test a button using all available methods"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         # Ask for button ID
         button_id = simpledialog.askinteger("Test Button", "Enter button ID to test:", 
                                            minvalue=1, maxvalue=128)
@@ -2608,105 +3226,139 @@ Mixture: Left Stick Y"""
         
         self.log_debug(f"Testing button {button_id} with all available methods...")
         
-        # Method 1: Standard set_button method
+        # Each step presses the button and schedules its release and the next
+        # step with root.after, so the GUI keeps running through the test
+        self._all_methods_set_button(button_id)
+
+    def _all_methods_set_button(self, button_id):
+        """Method 1 of test_button_all_methods: press with set_button, release a second later"""
         try:
             self.log_debug("Method 1: Using set_button method")
             self.controls.vjoy_dev.set_button(button_id, 1)
             self.controls.vjoy_dev.update()
             self.log_debug("Button pressed with Method 1")
-            time.sleep(1)
-            
+        except Exception as e:
+            self.log_debug(f"Method 1 failed: {str(e)}")
+            self._all_methods_bits(button_id)
+            return
+        self.root.after(1000, partial(self._all_methods_set_button_release, button_id))
+
+    def _all_methods_set_button_release(self, button_id):
+        """Release Method 1's press, then start Method 2 half a second later"""
+        try:
             self.controls.vjoy_dev.set_button(button_id, 0)
             self.controls.vjoy_dev.update()
             self.log_debug("Button released with Method 1")
-            time.sleep(0.5)
         except Exception as e:
             self.log_debug(f"Method 1 failed: {str(e)}")
-        
-        # Method 2: Direct bit manipulation
+            self._all_methods_bits(button_id)
+            return
+        self.root.after(500, partial(self._all_methods_bits, button_id))
+
+    def _all_methods_bits(self, button_id):
+        """Method 2 of test_button_all_methods: direct bit manipulation"""
         try:
             self.log_debug("Method 2: Direct bit manipulation")
             
             # Calculate which button array and bit to set
             array_index = (button_id - 1) // 32
             bit_index = (button_id - 1) % 32
-            button_mask = 1 << bit_index
+            button_mask = _button_mask(button_id)
             
             self.log_debug(f"Button {button_id} is in array {array_index}, bit {bit_index}, mask {button_mask}")
             
             # Get the current button array
-            if array_index == 0 and hasattr(self.controls.vjoy_dev.data, 'lButtons'):
-                current_buttons = self.controls.vjoy_dev.data.lButtons
-                self.log_debug(f"Current lButtons: {current_buttons}")
-                
-                # Press button
-                self.controls.vjoy_dev.data.lButtons = current_buttons | button_mask
-                self.controls.vjoy_dev.update()
-                self.log_debug(f"New lButtons: {self.controls.vjoy_dev.data.lButtons}")
-                time.sleep(1)
+            data = self.controls.vjoy_dev.data
+            if array_index == 0 and hasattr(data, 'lButtons'):
+                self.log_debug(f"Current lButtons: {data.lButtons}")
                 
-                # Release button
-                self.controls.vjoy_dev.data.lButtons = current_buttons & ~button_mask
-                self.controls.vjoy_dev.update()
-                self.log_debug(f"Released lButtons: {self.controls.vjoy_dev.data.lButtons}")
+                # Press button; it is released a second later
+                self._set_button_bit(button_id, True)
+                self.log_debug(f"New lButtons: {data.lButtons}")
+                self.root.after(1000, partial(self._all_methods_bits_release, button_id))
+                return
             else:
                 self.log_debug(f"Button array {array_index} not available")
         except Exception as e:
             self.log_debug(f"Method 2 failed: {str(e)}")
-        
-        # Method 3: Try using the pyvjoy API directly
+        self._all_methods_api(button_id)
+
+    def _all_methods_bits_release(self, button_id):
+        """Release Method 2's press, then go on to Method 3"""
+        try:
+            self._set_button_bit(button_id, False)
+            self.log_debug(f"Released lButtons: {self.controls.vjoy_dev.data.lButtons}")
+        except Exception as e:
+            self.log_debug(f"Method 2 failed: {str(e)}")
+        self._all_methods_api(button_id)
+
+    def _all_methods_api(self, button_id):
+        """Method 3 of test_button_all_methods: each button-related pyvjoy method in turn"""
         try:
             self.log_debug("Method 3: Using pyvjoy API directly")
             
             # Inspect the vjoy_dev object
-            self.log_debug(f"vJoy device type: {type(self.controls.vjoy_dev)}")
-            self.log_debug(f"Available methods: {dir(self.controls.vjoy_dev)}")
-            
-            # Try to find any button-related methods
-            button_methods = [method for method in dir(self.controls.vjoy_dev) if 'button' in method.lower()]
-            self.log_debug(f"Button-related methods: {button_methods}")
-            
-            # Try each method if available
-            for method_name in button_methods:
-                try:
-                    method = getattr(self.controls.vjoy_dev, method_name)
-                    if callable(method):
-                        self.log_debug(f"Trying method: {method_name}")
-                        if method_name == 'set_button':
-                            method(button_id, 1)
-                            self.controls.vjoy_dev.update()
-                            time.sleep(0.5)
-                            method(button_id, 0)
-                            self.controls.vjoy_dev.update()
-                        else:
-                            # Try with just the button ID
-                            try:
-                                method(button_id)
-                                self.controls.vjoy_dev.update()
-                                time.sleep(0.5)
-                            except:
-                                # Try with button ID and state
-                                try:
-                                    method(button_id, 1)
-                                    self.controls.vjoy_dev.update()
-                                    time.sleep(0.5)
-                                    method(button_id, 0)
-                                    self.controls.vjoy_dev.update()
-                                except:
-                                    self.log_debug(f"Could not call {method_name} with standard arguments")
-                except Exception as method_error:
-                    self.log_debug(f"Method {method_name} failed: {str(method_error)}")
+            all_methods, button_methods = self._get_vjoy_methods()
+            # Only build these (the method listing is several KB) when the debug window is open
+            if self.debug_mode:
+                self.log_debug(f"vJoy device type: {type(self.controls.vjoy_dev)}")
+                self.log_debug(f"Available methods: {all_methods}")
+                self.log_debug(f"Button-related methods: {[name for name, _ in button_methods]}")
         except Exception as e:
             self.log_debug(f"Method 3 failed: {str(e)}")
+            self.log_debug("Button test complete")
+            return
+        self._all_methods_next(button_id, iter(button_methods))
+
+    def _all_methods_next(self, button_id, methods):
+        """Call the next pyvjoy button method; its release and the one after follow in 500 ms"""
+        for method_name, method in methods:
+            if not callable(method):
+                continue
+            # Second call (button up), if this method takes a state
+            release = None
+            try:
+                self.log_debug(f"Trying method: {method_name}")
+                if method_name == 'set_button':
+                    method(button_id, 1)
+                    self.controls.vjoy_dev.update()
+                    release = partial(method, button_id, 0)
+                else:
+                    # Try with just the button ID
+                    try:
+                        method(button_id)
+                        self.controls.vjoy_dev.update()
+                    except Exception:
+                        # Try with button ID and state
+                        try:
+                            method(button_id, 1)
+                            self.controls.vjoy_dev.update()
+                            release = partial(method, button_id, 0)
+                        except Exception:
+                            self.log_debug(f"Could not call {method_name} with standard arguments")
+                            continue
+            except Exception as method_error:
+                self.log_debug(f"Method {method_name} failed: {str(method_error)}")
+                continue
+            self.root.after(500, partial(self._all_methods_release, button_id, methods,
+                                         method_name, release))
+            return
         
         self.log_debug("Button test complete")
 
+    def _all_methods_release(self, button_id, methods, method_name, release):
+        """Release the button a Method 3 call pressed, then try the next method"""
+        if release is not None:
+            try:
+                release()
+                self.controls.vjoy_dev.update()
+            except Exception as method_error:
+                self.log_debug(f"Method {method_name} failed: {str(method_error)}")
+        self._all_methods_next(button_id, methods)
+
+    @_needs_vjoy
     def inspect_vjoy_library(self):
         """Inspect the pyvjoy library to understand its capabilities"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         # Create a new window for the results
         inspect_window = tk.Toplevel(self.root)
         inspect_window.title("vJoy Library Inspection")
@@ -2717,67 +3369,80 @@ Mixture: Left Stick Y"""
         result_text.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Add a scrollbar
-        scrollbar = ttk.Scrollbar(result_text)
-        scrollbar.pack(side='right', fill='y')
-        result_text.config(yscrollcommand=scrollbar.set)
-        scrollbar.config(command=result_text.yview)
-        
-        # Function to add text to the result
-        def add_result(text):
-            result_text.insert(tk.END, text + "\n")
-            result_text.see(tk.END)
+        scrollbar = ttk.Scrollbar(result_text)
+        scrollbar.pack(side='right', fill='y')
+        result_text.config(yscrollcommand=scrollbar.set)
+        scrollbar.config(command=result_text.yview)
         
-        try:
-            # Get information about the vJoy device
-            add_result("vJoy Device Information:")
-            add_result(f"Type: {type(self.controls.vjoy_dev)}")
-            add_result(f"Module: {self.controls.vjoy_dev.__module__}")
-            add_result(f"Dir: {dir(self.controls.vjoy_dev)}")
-            
-            # Get information about the data structure
-            add_result("\nvJoy Data Structure:")
-            add_result(f"Type: {type(self.controls.vjoy_dev.data)}")
-            add_result(f"Dir: {dir(self.controls.vjoy_dev.data)}")
+        # The report only depends on the device and data types, so it is built
+        # once per type pair and reused on later opens
+        vjoy_dev = self.controls.vjoy_dev
+        cache_key = ('inspect', type(vjoy_dev), type(vjoy_dev.data))
+        report = self._vjoy_report_cache.get(cache_key)
+        if report is None:
+            # Results are collected here and written to the text widget in one insert
+            lines = []
+            add_result = lines.append
+            failed = False
             
-            # Check for button-related attributes and methods
-            add_result("\nButton-related attributes and methods:")
-            for item in dir(self.controls.vjoy_dev):
-                if 'button' in item.lower():
-                    add_result(f"- {item}")
-            
-            # Check for axis-related attributes and methods
-            add_result("\nAxis-related attributes and methods:")
-            for item in dir(self.controls.vjoy_dev.data):
-                if 'axis' in item.lower():
-                    add_result(f"- {item}")
-            
-            # Try to get more information about the set_button method
-            if hasattr(self.controls.vjoy_dev, 'set_button'):
-                add_result("\nset_button method:")
-                add_result(f"Type: {type(self.controls.vjoy_dev.set_button)}")
-                add_result(f"Doc: {self.controls.vjoy_dev.set_button.__doc__}")
-            
-            # Try to get the source code if possible
             try:
+                dev_names, dev_button_names, _ = _introspect(self.controls.vjoy_dev)
+                data_names, _, data_axis_names = _introspect(self.controls.vjoy_dev.data)
+            
+                # Get information about the vJoy device
+                add_result("vJoy Device Information:")
+                add_result(f"Type: {type(self.controls.vjoy_dev)}")
+                add_result(f"Module: {self.controls.vjoy_dev.__module__}")
+                add_result(f"Dir: {list(dev_names)}")
+            
+                # Get information about the data structure
+                add_result("\nvJoy Data Structure:")
+                add_result(f"Type: {type(self.controls.vjoy_dev.data)}")
+                add_result(f"Dir: {list(data_names)}")
+            
+                # Check for button-related attributes and methods
+                add_result("\nButton-related attributes and methods:")
+                lines.extend(f"- {item}" for item in dev_button_names)
+            
+                # Check for axis-related attributes and methods
+                add_result("\nAxis-related attributes and methods:")
+                lines.extend(f"- {item}" for item in data_axis_names)
+            
+                # Try to get more information about the set_button method
                 if hasattr(self.controls.vjoy_dev, 'set_button'):
-                    source = inspect.getsource(self.controls.vjoy_dev.set_button)
-                    add_result("\nset_button source code:")
-                    add_result(source)
-            except Exception as source_error:
-                add_result(f"Could not get source code: {str(source_error)}")
+                    add_result("\nset_button method:")
+                    add_result(f"Type: {type(self.controls.vjoy_dev.set_button)}")
+                    add_result(f"Doc: {self.controls.vjoy_dev.set_button.__doc__}")
             
-        except Exception as e:
-            add_result(f"Error during inspection: {str(e)}")
+                # Try to get the source code if possible
+                try:
+                    if hasattr(self.controls.vjoy_dev, 'set_button'):
+                        # Bound methods are new objects on every access, so key on the function
+                        set_button = self.controls.vjoy_dev.set_button
+                        source = _cached_source(getattr(set_button, '__func__', set_button))
+                        add_result("\nset_button source code:")
+                        add_result(source)
+                except Exception as source_error:
+                    add_result(f"Could not get source code: {str(source_error)}")
+            
+            except Exception as e:
+                add_result(f"Error during inspection: {str(e)}")
+                failed = True
+            
+            report = "\n".join(lines) + "\n"
+            # Don't keep a report that stopped part way
+            if not failed:
+                self._vjoy_report_cache[cache_key] = report
+        
+        result_text.insert(tk.END, report)
+        result_text.see(tk.END)
         
         # Add a close button
         ttk.Button(inspect_window, text="Close", command=inspect_window.destroy).pack(pady=10)
 
+    @_needs_vjoy
     def try_alternative_button_method(self):
         """Try an alternative method for setting vJoy buttons"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         # Ask for button ID
         button_id = simpledialog.askinteger("Test Button", "Enter button ID to test:", 
                                            minvalue=1, maxvalue=128)
@@ -2788,39 +3453,15 @@ Mixture: Left Stick Y"""
         
         try:
             # Try to access the underlying vJoy SDK directly
-            import ctypes
-            
-            # Try to find the vJoy DLL
-            try:
-                vjoy_dll = ctypes.WinDLL("vJoyInterface.dll")
-                self.log_debug("Found vJoyInterface.dll")
-            except:
-                try:
-                    # Try to find it in the pyvjoy package
-                    import pyvjoy
-                    import os
-                    pyvjoy_path = os.path.dirname(pyvjoy.__file__)
-                    vjoy_dll_path = os.path.join(pyvjoy_path, "vJoyInterface.dll")
-                    self.log_debug(f"Looking for DLL at: {vjoy_dll_path}")
-                    
-                    if os.path.exists(vjoy_dll_path):
-                        vjoy_dll = ctypes.WinDLL(vjoy_dll_path)
-                        self.log_debug("Found vJoyInterface.dll in pyvjoy package")
-                    else:
-                        self.log_debug("Could not find vJoyInterface.dll")
-                        return
-                except Exception as dll_error:
-                    self.log_debug(f"Error finding vJoyInterface.dll: {str(dll_error)}")
-                    return
+            if self._ensure_vjoy_dll() is None:
+                return
             
             # Try to get the SetBtn function
             try:
-                set_btn = vjoy_dll.SetBtn
-                self.log_debug("Found SetBtn function")
-                
-                # Set the argument types
-                set_btn.argtypes = [ctypes.c_bool, ctypes.c_uint, ctypes.c_uint]
-                set_btn.restype = ctypes.c_bool
+                set_btn = self._vjoy_set_btn
+                if set_btn is None:
+                    self.log_debug("SetBtn function not found in vJoy DLL")
+                    return
                 
                 # Try to press the button
                 self.log_debug(f"Pressing button {button_id}")
@@ -2833,12 +3474,9 @@ Mixture: Left Stick Y"""
         except Exception as e:
             self.log_debug(f"Alternative button method failed: {str(e)}")
 
+    @_needs_vjoy
     def test_direct_button_access(self):
         """Test button using direct memory access to vJoy data structure"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         # Ask for button ID
         button_id = simpledialog.askinteger("Test Button", "Enter button ID to test:", 
                                            minvalue=1, maxvalue=32)
@@ -2853,15 +3491,19 @@ Mixture: Left Stick Y"""
                 self.log_debug("lButtons not available in vJoy data structure")
                 return
             
-            # Get current button state
-            current_buttons = self.controls.vjoy_dev.data.lButtons
-            self.log_debug(f"Current lButtons value: {current_buttons} (hex: {hex(current_buttons)})")
+            vjoy_dev = self.controls.vjoy_dev
+            data = vjoy_dev.data
+            
+            # Get current button state; from here on the bits are worked out
+            # on a plain int and the struct field is only written, once per step
+            current_buttons = data.lButtons
+            self.log_debug("Current lButtons value: %d (hex: %#x)", current_buttons, current_buttons)
             
             # Calculate which bit to set
             bit_position = button_id - 1
-            button_mask = 1 << bit_position
+            button_mask = _button_mask(button_id)
             self.log_debug(f"Button {button_id} corresponds to bit position {bit_position}")
-            self.log_debug(f"Button mask: {button_mask} (hex: {hex(button_mask)})")
+            self.log_debug("Button mask: %d (hex: %#x)", button_mask, button_mask)
             
             # Check if button is currently pressed
             is_pressed = (current_buttons & button_mask) != 0
@@ -2869,53 +3511,56 @@ Mixture: Left Stick Y"""
             
             # Press the button
             self.log_debug(f"Pressing button {button_id}...")
-            self.controls.vjoy_dev.data.lButtons = current_buttons | button_mask
-            self.controls.vjoy_dev.update()
-            
-            # Get updated button state
-            updated_buttons = self.controls.vjoy_dev.data.lButtons
-            self.log_debug(f"Updated lButtons value: {updated_buttons} (hex: {hex(updated_buttons)})")
-            
-            # Wait a moment
-            time.sleep(1)
-            
-            # Release the button
-            self.log_debug(f"Releasing button {button_id}...")
-            self.controls.vjoy_dev.data.lButtons = updated_buttons & ~button_mask
-            self.controls.vjoy_dev.update()
-            
-            # Get final button state
-            final_buttons = self.controls.vjoy_dev.data.lButtons
-            self.log_debug(f"Final lButtons value: {final_buttons} (hex: {hex(final_buttons)})")
-            
-            self.log_debug(f"Button {button_id} test complete")
+            updated_buttons = current_buttons | button_mask
+            data.lButtons = updated_buttons
+            vjoy_dev.update()
+            self.log_debug("Updated lButtons value: %d (hex: %#x)", updated_buttons, updated_buttons)
+            
+            # Release the button after a moment, without blocking the GUI
+            self.root.after(1000, partial(self._release_lbuttons_test, button_id,
+                                          "Final lButtons value", "Direct button access error"))
         except Exception as e:
             self.log_debug(f"Direct button access error: {str(e)}")
 
+    @_needs_vjoy
     def check_vjoy_capabilities(self):
         """Check what capabilities are available in the vJoy installation"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         self.log_debug("Checking vJoy capabilities...")
         
-        # Check for button-related attributes and methods
-        button_capabilities = []
+        vjoy_dev = self.controls.vjoy_dev
+        data = vjoy_dev.data
         
-        # Check for set_button method
-        if hasattr(self.controls.vjoy_dev, 'set_button'):
-            button_capabilities.append("set_button method")
-        
-        # Check for lButtons attribute
-        if hasattr(self.controls.vjoy_dev.data, 'lButtons'):
-            button_capabilities.append("lButtons attribute")
-            self.log_debug(f"lButtons current value: {self.controls.vjoy_dev.data.lButtons}")
+        # Which capabilities exist only depends on the device and data types,
+        # so the checks run once per type pair
+        cache_key = ('capabilities', type(vjoy_dev), type(data))
+        cached = self._vjoy_report_cache.get(cache_key)
+        if cached is None:
+            # Check for button-related attributes and methods
+            button_capabilities = []
+            
+            # Check for set_button method
+            if hasattr(vjoy_dev, 'set_button'):
+                button_capabilities.append("set_button method")
+            
+            # Check for lButtons attribute
+            if hasattr(data, 'lButtons'):
+                button_capabilities.append("lButtons attribute")
+            
+            # Check for other button arrays
+            for attr in ['lButtonsEx1', 'lButtonsEx2', 'lButtonsEx3']:
+                if hasattr(data, attr):
+                    button_capabilities.append(f"{attr} attribute")
+            
+            # Check for axis-related attributes
+            data_names = _introspect(data)[0]
+            axis_capabilities = [attr for attr in data_names if 'Axis' in attr or attr in ('wSlider', 'wDial')]
+            
+            cached = self._vjoy_report_cache[cache_key] = (button_capabilities, axis_capabilities)
+        button_capabilities, axis_capabilities = cached
         
-        # Check for other button arrays
-        for attr in ['lButtonsEx1', 'lButtonsEx2', 'lButtonsEx3']:
-            if hasattr(self.controls.vjoy_dev.data, attr):
-                button_capabilities.append(f"{attr} attribute")
+        # The current value is live, so it is always read
+        if "lButtons attribute" in button_capabilities:
+            self.log_debug(f"lButtons current value: {data.lButtons}")
         
         # Report findings
         if button_capabilities:
@@ -2923,12 +3568,6 @@ Mixture: Left Stick Y"""
         else:
             self.log_debug("No button capabilities found!")
         
-        # Check for axis-related attributes
-        axis_capabilities = []
-        for attr in dir(self.controls.vjoy_dev.data):
-            if 'Axis' in attr or attr in ['wSlider', 'wDial']:
-                axis_capabilities.append(attr)
-        
         if axis_capabilities:
             self.log_debug(f"Found axis capabilities: {', '.join(axis_capabilities)}")
         else:
@@ -2943,66 +3582,74 @@ Mixture: Left Stick Y"""
         except:
             self.log_debug("Could not determine vJoy version")
 
-    def try_vjoy_ctypes(self):
-        """Try to use ctypes to directly access vJoy DLL"""
-        self.log_debug("Trying to access vJoy DLL directly using ctypes...")
-        
-        try:
-            import ctypes
-            import os
+    def _ensure_vjoy_dll(self):
+        """Load vJoyInterface.dll and bind its functions once; returns the DLL or None"""
+        with self._vjoy_dll_lock:
+            if self._vjoy_dll is not None:
+                return self._vjoy_dll
             
-            # Try to find the vJoy DLL
-            vjoy_dll_paths = [
-                "vJoyInterface.dll",  # Current directory
-                os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), "vJoy", "x64", "vJoyInterface.dll"),
-                os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), "vJoy", "x86", "vJoyInterface.dll")
-            ]
-            
-            # Try to import pyvjoy to find its location
-            try:
-                import pyvjoy
-                pyvjoy_path = os.path.dirname(pyvjoy.__file__)
-                vjoy_dll_paths.append(os.path.join(pyvjoy_path, "vJoyInterface.dll"))
-            except:
-                self.log_debug("Could not import pyvjoy to find DLL location")
+            import ctypes
             
             # Try each path
             vjoy_dll = None
-            for path in vjoy_dll_paths:
+            for path in _vjoy_dll_paths():
                 try:
                     self.log_debug(f"Trying to load DLL from: {path}")
-                    if os.path.exists(path):
+                    # The bare name is left to the system's DLL search
+                    if path == "vJoyInterface.dll" or os.path.exists(path):
                         vjoy_dll = ctypes.WinDLL(path)
                         self.log_debug(f"Successfully loaded vJoy DLL from {path}")
                         break
                 except Exception as dll_error:
                     self.log_debug(f"Failed to load DLL from {path}: {str(dll_error)}")
             
+            # Not cached on failure, so a later try can pick up a fresh vJoy install
             if vjoy_dll is None:
                 self.log_debug("Could not load vJoy DLL from any location")
+                return None
+            
+            # Resolve the functions and set their signatures a single time
+            set_btn = getattr(vjoy_dll, 'SetBtn', None)
+            if set_btn is not None:
+                set_btn.argtypes = [ctypes.c_bool, ctypes.c_uint, ctypes.c_uint]
+                set_btn.restype = ctypes.c_bool
+            enabled_func = getattr(vjoy_dll, 'vJoyEnabled', None)
+            if enabled_func is not None:
+                enabled_func.restype = ctypes.c_bool
+            version_func = getattr(vjoy_dll, 'GetvJoyVersion', None)
+            if version_func is not None:
+                version_func.restype = ctypes.c_short
+            
+            self._vjoy_set_btn = set_btn
+            self._vjoy_get_btn = getattr(vjoy_dll, 'GetBtn', None)
+            self._vjoy_enabled = enabled_func
+            self._vjoy_get_version = version_func
+            self._vjoy_dll = vjoy_dll
+            return vjoy_dll
+
+    def try_vjoy_ctypes(self):
+        """Try to use ctypes to directly access vJoy DLL"""
+        self.log_debug("Trying to access vJoy DLL directly using ctypes...")
+        
+        try:
+            if self._ensure_vjoy_dll() is None:
                 return
             
             # Try to get vJoy version
             try:
-                if hasattr(vjoy_dll, 'vJoyEnabled'):
-                    enabled_func = vjoy_dll.vJoyEnabled
-                    enabled_func.restype = ctypes.c_bool
-                    is_enabled = enabled_func()
+                if self._vjoy_enabled is not None:
+                    is_enabled = self._vjoy_enabled()
                     self.log_debug(f"vJoy enabled: {is_enabled}")
                 
-                if hasattr(vjoy_dll, 'GetvJoyVersion'):
-                    version_func = vjoy_dll.GetvJoyVersion
-                    version_func.restype = ctypes.c_short
-                    version = version_func()
+                if self._vjoy_get_version is not None:
+                    version = self._vjoy_get_version()
                     self.log_debug(f"vJoy version: {version}")
             except Exception as version_error:
                 self.log_debug(f"Error getting vJoy version: {str(version_error)}")
             
             # Try to find button-related functions
-            button_functions = []
-            for func_name in ['SetBtn', 'GetBtn']:
-                if hasattr(vjoy_dll, func_name):
-                    button_functions.append(func_name)
+            button_functions = [name for name, func in (('SetBtn', self._vjoy_set_btn), ('GetBtn', self._vjoy_get_btn))
+                                if func is not None]
             
             if button_functions:
                 self.log_debug(f"Found button functions: {', '.join(button_functions)}")
@@ -3010,7 +3657,7 @@ Mixture: Left Stick Y"""
                 self.log_debug("No button functions found in vJoy DLL")
             
             # Try to use SetBtn function if available
-            if 'SetBtn' in button_functions:
+            if self._vjoy_set_btn is not None:
                 try:
                     # Ask for button ID
                     button_id = simpledialog.askinteger("Test Button", "Enter button ID to test:", 
@@ -3018,40 +3665,50 @@ Mixture: Left Stick Y"""
                     if button_id is None:
                         return
                     
-                    # Get the SetBtn function
-                    set_btn = vjoy_dll.SetBtn
-                    
-                    # Set argument types and return type
-                    set_btn.argtypes = [ctypes.c_bool, ctypes.c_uint, ctypes.c_uint]
-                    set_btn.restype = ctypes.c_bool
+                    set_btn = self._vjoy_set_btn
                     
                     # Try to press the button
                     self.log_debug(f"Pressing button {button_id} using SetBtn...")
                     result = set_btn(True, 1, button_id)  # True = pressed, 1 = device ID, button_id = button number
                     self.log_debug(f"SetBtn result: {result}")
                     
-                    time.sleep(1)
-                    
-                    # Release the button
-                    self.log_debug(f"Releasing button {button_id} using SetBtn...")
-                    result = set_btn(False, 1, button_id)  # False = released
-                    self.log_debug(f"SetBtn result: {result}")
+                    # Release the button after a moment, without blocking the GUI
+                    self.root.after(1000, partial(self._release_ctypes_button, button_id))
                 except Exception as btn_error:
                     self.log_debug(f"Error using SetBtn: {str(btn_error)}")
         
         except Exception as e:
             self.log_debug(f"Error accessing vJoy DLL: {str(e)}")
 
+    @staticmethod
+    def _show_scale_value(label, suffix, value):
+        """Scale command: show the slider's new value (passed as a float string) as an int"""
+        label.config(text=f"{int(float(value))}{suffix}")
+
+    def _release_ctypes_button(self, button_id):
+        """Second half of try_vjoy_ctypes: release the button through SetBtn"""
+        try:
+            self.log_debug(f"Releasing button {button_id} using SetBtn...")
+            result = self._vjoy_set_btn(False, 1, button_id)  # False = released
+            self.log_debug(f"SetBtn result: {result}")
+        except Exception as btn_error:
+            self.log_debug(f"Error using SetBtn: {str(btn_error)}")
+
+    @_needs_vjoy
     def test_control_panel_mapping(self):
         """Test control panel mapping directly"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         self.log_debug("Testing control panel mapping...")
         
+        # Reuse the window from an earlier open instead of rebuilding every widget
+        test_window = self._cp_mapping_window
+        if test_window is not None and test_window.winfo_exists():
+            test_window.reset_test()
+            test_window.deiconify()
+            test_window.lift()
+            return
+        
         # Create a test window
-        test_window = tk.Toplevel(self.root)
+        test_window = self._cp_mapping_window = tk.Toplevel(self.root)
         test_window.title("Control Panel Mapping Test")
         test_window.geometry("600x400")
         
@@ -3061,42 +3718,46 @@ Mixture: Left Stick Y"""
         
         # Create sliders for each pot
         sliders = []
+        pot_frames = []
+        config_labels = []
+        value_labels = []
         for i in range(7):
-            pot_frame = ttk.LabelFrame(controls_frame, text=f"Pot {i+1}: {self.controls.control_panel.pot_config[i]['name']}")
+            # Frame title and configuration text are filled in by reset_test
+            pot_frame = ttk.LabelFrame(controls_frame)
             pot_frame.pack(fill='x', padx=5, pady=5)
+            pot_frames.append(pot_frame)
             
             # Show current configuration
-            config = self.controls.control_panel.pot_config[i]
-            config_text = f"Type: {config['type']}"
-            if config['type'] == 'Axis' and config['vjoy_axis']:
-                config_text += f", Axis: {config['vjoy_axis']}"
-            elif (config['type'] == 'Switch' or config['type'] == 'Button') and config['button_id']:
-                config_text += f", Button: {config['button_id']}"
+            config_label = ttk.Label(pot_frame)
+            config_label.pack(anchor='w')
+            config_labels.append(config_label)
             
-            ttk.Label(pot_frame, text=config_text).pack(anchor='w')
+            # Create a label to show the value
+            value_label = ttk.Label(pot_frame, text="0")
+            value_labels.append(value_label)
             
-            # Create a slider
+            # Create a slider; its command gets the new value directly, so the
+            # label updates without reading the variable back from Tcl
             slider_var = tk.IntVar(value=0)
-            slider = ttk.Scale(pot_frame, from_=0, to=1023, variable=slider_var, orient='horizontal')
+            slider = ttk.Scale(pot_frame, from_=0, to=1023, variable=slider_var, orient='horizontal',
+                               command=partial(self._show_scale_value, value_label, ""))
             slider.pack(fill='x', padx=5, pady=5)
-            
-            # Create a label to show the value
-            value_label = ttk.Label(pot_frame, text="0")
             value_label.pack(side='right')
             
-            # Update the label when the slider changes
-            def update_label(var, label=value_label):
-                label.config(text=str(var.get()))
-            
-            slider_var.trace_add("write", lambda *args, var=slider_var: update_label(var))
-            
             # Store the slider and variable
             sliders.append((slider, slider_var))
         
+        # One Tcl command that returns every slider variable's value, so the
+        # test reads all sliders in a single call instead of one get() each
+        read_sliders = "list " + " ".join(f"${{{var}}}" for _, var in sliders)
+        # Likewise one command that puts every slider back to 0
+        reset_sliders = "; ".join(f"set {{{var}}} 0" for _, var in sliders)
+        
         # Create a button to test the mapping
         def test_mapping():
-            # Get the values from the sliders
-            values = [var.get() for _, var in sliders]
+            # Get the values from the sliders (ttk.Scale stores floats; truncate like IntVar.get)
+            tk_app = test_window.tk
+            values = [int(float(v)) for v in tk_app.splitlist(tk_app.eval(read_sliders))]
             
             # Process the values
             self.log_debug(f"Testing with values: {values}")
@@ -3117,25 +3778,43 @@ Mixture: Left Stick Y"""
         # Add test button
         ttk.Button(button_frame, text="Test Mapping", command=test_mapping).pack(side='left', padx=5)
         
-        # Add close button
-        ttk.Button(button_frame, text="Close", command=test_window.destroy).pack(side='right', padx=5)
+        # Add close button; closing only hides the window so the next open is instant
+        ttk.Button(button_frame, text="Close", command=test_window.withdraw).pack(side='right', padx=5)
+        test_window.protocol('WM_DELETE_WINDOW', test_window.withdraw)
+        
+        def reset_test():
+            # The pot configuration may have changed since the window was built
+            for i, config in enumerate(self.controls.control_panel.pot_config[:7]):
+                pot_frames[i].config(text=f"Pot {i+1}: {config['name']}")
+                config_text = f"Type: {config['type']}"
+                if config['type'] == 'Axis' and config['vjoy_axis']:
+                    config_text += f", Axis: {config['vjoy_axis']}"
+                elif (config['type'] == 'Switch' or config['type'] == 'Button') and config['button_id']:
+                    config_text += f", Button: {config['button_id']}"
+                config_labels[i].config(text=config_text)
+            
+            # Put the sliders back to their starting values in one Tcl call
+            test_window.tk.eval(reset_sliders)
+            for value_label in value_labels:
+                value_label.config(text="0")
+            status_label.config(text="Ready to test")
+        
+        test_window.reset_test = reset_test
+        reset_test()
 
     def reset_control_panel_mapping(self):
         """Reset all control panel mappings"""
         for i in range(len(self.controls.control_panel.pot_config)):
             # Reset to default settings
-            self.controls.control_panel.pot_config[i]['vjoy_axis'] = None
-            self.controls.control_panel.pot_config[i]['button_id'] = None
+            self.controls.control_panel.set_pot_vjoy_axis(i, None)
+            self.controls.control_panel.set_pot_button_id(i, None)
         
         self.status_label.config(text="Control panel mappings reset", foreground="blue")
-        self.root.after(2000, lambda: self.status_label.config(text="Connected", foreground="green"))
+        self._schedule_status_reset()
 
+    @_needs_vjoy
     def test_button_bit_manipulation(self):
         """Test button using bit manipulation"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         # Ask for button ID
         button_id = simpledialog.askinteger("Test Button", "Enter button ID to test:", 
                                            minvalue=1, maxvalue=32)
@@ -3146,51 +3825,56 @@ Mixture: Left Stick Y"""
         
         try:
             # Calculate which bit to set
-            bit_position = button_id - 1
-            button_mask = 1 << bit_position
+            button_mask = _button_mask(button_id)
             
-            # Get current button state
-            current_buttons = self.controls.vjoy_dev.data.lButtons
-            self.log_debug(f"Current lButtons: {current_buttons} (hex: {hex(current_buttons)})")
+            vjoy_dev = self.controls.vjoy_dev
+            data = vjoy_dev.data
+            
+            # Get current button state; the bits are worked out on a plain int
+            # and the struct field is only written, once per step
+            current_buttons = data.lButtons
+            self.log_debug("Current lButtons: %d (hex: %#x)", current_buttons, current_buttons)
             
             # Press the button
             self.log_debug(f"Pressing button {button_id}...")
-            self.controls.vjoy_dev.data.lButtons = current_buttons | button_mask
-            self.controls.vjoy_dev.update()
-            
-            # Get updated button state
-            updated_buttons = self.controls.vjoy_dev.data.lButtons
-            self.log_debug(f"Updated lButtons: {updated_buttons} (hex: {hex(updated_buttons)})")
-            
-            # Wait a moment
-            time.sleep(1)
-            
-            # Release the button
+            updated_buttons = current_buttons | button_mask
+            data.lButtons = updated_buttons
+            vjoy_dev.update()
+            self.log_debug("Updated lButtons: %d (hex: %#x)", updated_buttons, updated_buttons)
+            
+            # Release the button after a moment, without blocking the GUI
+            self.root.after(1000, partial(self._release_lbuttons_test, button_id,
+                                          "Final lButtons", "Button bit manipulation error"))
+        except Exception as e:
+            self.log_debug(f"Button bit manipulation error: {str(e)}")
+
+    def _release_lbuttons_test(self, button_id, final_label, error_label):
+        """Second half of the lButtons button tests: release the button and log the result"""
+        try:
             self.log_debug(f"Releasing button {button_id}...")
-            self.controls.vjoy_dev.data.lButtons = updated_buttons & ~button_mask
-            self.controls.vjoy_dev.update()
+            vjoy_dev = self.controls.vjoy_dev
+            data = vjoy_dev.data
             
-            # Get final button state
-            final_buttons = self.controls.vjoy_dev.data.lButtons
-            self.log_debug(f"Final lButtons: {final_buttons} (hex: {hex(final_buttons)})")
+            # Re-read lButtons; other buttons may have changed while we waited
+            final_buttons = data.lButtons & ~_button_mask(button_id)
+            data.lButtons = final_buttons
+            vjoy_dev.update()
+            self.log_debug("%s: %d (hex: %#x)", final_label, final_buttons, final_buttons)
             
             self.log_debug(f"Button {button_id} test complete")
         except Exception as e:
-            self.log_debug(f"Button bit manipulation error: {str(e)}")
+            self.log_debug(f"{error_label}: {str(e)}")
 
+    @_needs_vjoy
     def check_lbuttons_availability(self):
         """Check if lButtons attribute is available"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         self.log_debug("Checking lButtons availability...")
         
         try:
             # Check if lButtons is available
             if hasattr(self.controls.vjoy_dev.data, 'lButtons'):
                 current_buttons = self.controls.vjoy_dev.data.lButtons
-                self.log_debug(f"lButtons is available. Current value: {current_buttons} (hex: {hex(current_buttons)})")
+                self.log_debug("lButtons is available. Current value: %d (hex: %#x)", current_buttons, current_buttons)
                 
                 # Try to modify lButtons
                 self.log_debug("Trying to modify lButtons...")
@@ -3216,7 +3900,7 @@ Mixture: Left Stick Y"""
                 self.log_debug("lButtons is NOT available in vJoy data structure")
                 
                 # Check what button-related attributes are available
-                button_attrs = [attr for attr in dir(self.controls.vjoy_dev.data) if 'button' in attr.lower()]
+                button_attrs = list(_introspect(self.controls.vjoy_dev.data)[1])
                 if button_attrs:
                     self.log_debug(f"Button-related attributes found: {button_attrs}")
                 else:
@@ -3226,23 +3910,24 @@ Mixture: Left Stick Y"""
 
     def reset_toggle_states(self):
         """Reset all toggle states"""
-        if hasattr(self.controls, 'button_states'):
-            self.controls.button_states = {}
-        
-        if hasattr(self.controls, 'last_pot_values'):
-            self.controls.last_pot_values = {}
+        self.controls.reset_button_states()
         
         self.status_label.config(text="Toggle states reset", foreground="blue")
-        self.root.after(2000, lambda: self.status_label.config(text="Connected", foreground="green"))
+        self._schedule_status_reset()
 
+    @_needs_vjoy
     def test_toggle_functionality(self):
         """Test toggle functionality"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
+        # Reuse the window from an earlier open instead of rebuilding every widget
+        test_window = self._toggle_test_window
+        if test_window is not None and test_window.winfo_exists():
+            test_window.reset_test()
+            test_window.deiconify()
+            test_window.lift()
             return
         
         # Create a test window
-        test_window = tk.Toplevel(self.root)
+        test_window = self._toggle_test_window = tk.Toplevel(self.root)
         test_window.title("Toggle Functionality Test")
         test_window.geometry("400x300")
         
@@ -3264,14 +3949,13 @@ Mixture: Left Stick Y"""
         
         ttk.Label(slider_frame, text="Pot Value:").pack(side='left')
         pot_value_var = tk.IntVar(value=0)
-        pot_slider = ttk.Scale(slider_frame, from_=0, to=100, variable=pot_value_var, orient='horizontal')
-        pot_slider.pack(side='left', padx=5, fill='x', expand=True)
-        
         pot_value_label = ttk.Label(slider_frame, text="0")
-        pot_value_label.pack(side='right')
         
-        # Update the label when the slider changes
-        pot_value_var.trace_add("write", lambda *args: pot_value_label.config(text=str(pot_value_var.get())))
+        # The slider's command updates the label when the slider changes
+        pot_slider = ttk.Scale(slider_frame, from_=0, to=100, variable=pot_value_var, orient='horizontal',
+                               command=partial(self._show_scale_value, pot_value_label, ""))
+        pot_slider.pack(side='left', padx=5, fill='x', expand=True)
+        pot_value_label.pack(side='right')
         
         # Create a threshold slider
         threshold_frame = ttk.Frame(controls_frame)
@@ -3279,14 +3963,13 @@ Mixture: Left Stick Y"""
         
         ttk.Label(threshold_frame, text="Threshold:").pack(side='left')
         threshold_var = tk.IntVar(value=50)
-        threshold_slider = ttk.Scale(threshold_frame, from_=0, to=100, variable=threshold_var, orient='horizontal')
-        threshold_slider.pack(side='left', padx=5, fill='x', expand=True)
-        
         threshold_label = ttk.Label(threshold_frame, text="50")
-        threshold_label.pack(side='right')
         
-        # Update the label when the slider changes
-        threshold_var.trace_add("write", lambda *args: threshold_label.config(text=str(threshold_var.get())))
+        # The slider's command updates the label when the slider changes
+        threshold_slider = ttk.Scale(threshold_frame, from_=0, to=100, variable=threshold_var, orient='horizontal',
+                                     command=partial(self._show_scale_value, threshold_label, ""))
+        threshold_slider.pack(side='left', padx=5, fill='x', expand=True)
+        threshold_label.pack(side='right')
         
         # Create a toggle state display
         toggle_frame = ttk.Frame(controls_frame)
@@ -3298,58 +3981,52 @@ Mixture: Left Stick Y"""
         toggle_state_label.pack(side='left', padx=5)
         
         # Create a button to test the toggle
-        def test_toggle():
-            button_id = button_id_var.get()
-            pot_value = pot_value_var.get()
-            threshold = threshold_var.get()
-            
-            # Create a unique key for this button
-            button_key = f"test_toggle_button_{button_id}"
-            
-            # Get the current threshold state
-            current_threshold_state = pot_value > threshold
-            
-            # Get the previous threshold state
-            if not hasattr(test_window, 'last_threshold_state'):
-                test_window.last_threshold_state = False
-            
-            # Get the current button state
-            if not hasattr(test_window, 'button_state'):
-                test_window.button_state = 0
+        # Toggle state for this window; the lock is shared with the continuous test thread
+        test_window.last_threshold_state = False
+        test_window.button_state = 0
+        toggle_lock = threading.Lock()
+        
+        # Plain copy of the controls for the continuous test thread, which must not
+        # read Tk variables; kept current by the traces below (button id, pot, threshold)
+        test_params = [1, 0, 50]
+        
+        def sync_params(*args):
+            try:
+                test_params[:] = (button_id_var.get(), pot_value_var.get(), threshold_var.get())
+            except tk.TclError:
+                # The spinbox can be empty while the user is typing
+                pass
+        
+        for var in (button_id_var, pot_value_var, threshold_var):
+            var.trace_add('write', sync_params)
+        
+        # Safe to call from any thread; Tk updates go through self._ui
+        def toggle_step(button_id, pot_value, threshold):
+            with toggle_lock:
+                # Only a crossing from below to above the threshold toggles the button
+                current_threshold_state = pot_value > threshold
+                rising_edge = current_threshold_state and not test_window.last_threshold_state
+                test_window.last_threshold_state = current_threshold_state
+                if not rising_edge:
+                    return
+                
+                # Toggle the button state
+                test_window.button_state ^= 1
+                button_state = test_window.button_state
             
-            # Toggle the button state when crossing the threshold
-            if current_threshold_state != test_window.last_threshold_state:
-                if current_threshold_state:  # Only toggle when crossing from below to above threshold
-                    # Toggle the button state
-                    test_window.button_state = 1 if test_window.button_state == 0 else 0
-                    
-                    # Update the toggle state display
-                    toggle_state_var.set("ON" if test_window.button_state == 1 else "OFF")
-                    toggle_state_label.config(foreground="green" if test_window.button_state == 1 else "red")
-                    
-                    # Try to set the button using direct bit manipulation
-                    try:
-                        # Calculate which bit to set
-                        bit_position = button_id - 1
-                        button_mask = 1 << bit_position
-                        
-                        # Get current button state
-                        current_buttons = self.controls.vjoy_dev.data.lButtons
-                        
-                        # Set or clear the button bit
-                        if test_window.button_state:
-                            self.controls.vjoy_dev.data.lButtons = current_buttons | button_mask
-                        else:
-                            self.controls.vjoy_dev.data.lButtons = current_buttons & ~button_mask
-                            
-                        self.controls.vjoy_dev.update()
-                        
-                        status_var.set(f"Button {button_id} toggled to {test_window.button_state}")
-                    except Exception as e:
-                        status_var.set(f"Error: {str(e)}")
+            # Update the toggle state display
+            self._ui(toggle_state_var.set, ("OFF", "ON")[button_state])
+            self._ui(toggle_state_label.config, foreground=("red", "green")[button_state])
             
-            # Store the current threshold state
-            test_window.last_threshold_state = current_threshold_state
+            # Set or clear the button bit using direct bit manipulation
+            try:
+                self._set_button_bit(button_id, button_state)
+                self._ui(self._set_status, status_var, f"Button {button_id} toggled to {button_state}")
+            except Exception as e:
+                self._ui(self._set_status, status_var, f"Error: {str(e)}")
+        
+        def test_toggle():
+            toggle_step(*test_params)
         
         # Create a button to test the toggle
         ttk.Button(controls_frame, text="Test Toggle", command=test_toggle).pack(pady=10)
@@ -3359,23 +4036,28 @@ Mixture: Left Stick Y"""
         status_label = ttk.Label(controls_frame, textvariable=status_var)
         status_label.pack(pady=5)
         
-        # Create a button to continuously test
-        def continuous_test():
-            test_toggle()
-            if hasattr(test_window, 'continuous_test_id'):
-                test_window.after_cancel(test_window.continuous_test_id)
-            test_window.continuous_test_id = test_window.after(100, continuous_test)
+        # Continuous testing runs on its own thread so its 100 ms period doesn't
+        # queue up behind other Tk events
+        def continuous_test(stop_event):
+            next_time = time.monotonic()
+            while self.running and not stop_event.is_set():
+                toggle_step(*test_params)
+                next_time += 0.1
+                stop_event.wait(max(0.0, next_time - time.monotonic()))
         
         # Create a button to start/stop continuous testing
         continuous_var = tk.BooleanVar(value=False)
+        test_window.continuous_stop = threading.Event()
         
         def toggle_continuous():
             if continuous_var.get():
-                continuous_test()
+                # A fresh event per run, so a thread that is still winding down can't be revived
+                test_window.continuous_stop = threading.Event()
+                threading.Thread(target=continuous_test, args=(test_window.continuous_stop,),
+                                 daemon=True).start()
                 continuous_button.config(text="Stop Continuous Test")
             else:
-                if hasattr(test_window, 'continuous_test_id'):
-                    test_window.after_cancel(test_window.continuous_test_id)
+                test_window.continuous_stop.set()
                 continuous_button.config(text="Start Continuous Test")
         
         continuous_button = ttk.Checkbutton(
@@ -3385,11 +4067,42 @@ Mixture: Left Stick Y"""
             command=toggle_continuous
         )
         continuous_button.pack(pady=5)
+        
+        def reset_test():
+            # Stop any continuous test and put the controls back to their defaults
+            if continuous_var.get():
+                continuous_var.set(False)
+                toggle_continuous()
+            button_id_var.set(1)
+            pot_value_var.set(0)
+            pot_value_label.config(text="0")
+            threshold_var.set(50)
+            threshold_label.config(text="50")
+            with toggle_lock:
+                test_window.last_threshold_state = False
+                test_window.button_state = 0
+            toggle_state_var.set("OFF")
+            toggle_state_label.config(foreground="red")
+            self._set_status(status_var, "Ready to test")
+        
+        def hide_window():
+            # Closing only hides the window so the next open is instant
+            if continuous_var.get():
+                continuous_var.set(False)
+                toggle_continuous()
+            test_window.withdraw()
+        
+        test_window.reset_test = reset_test
+        test_window.protocol('WM_DELETE_WINDOW', hide_window)
 
     def create_binding_helper(self):
         """Create a helper window for binding buttons to simulator functions"""
         binding_window = tk.Toplevel(self.root)
         binding_window.title("Button Binding Helper")
+        # Rapid toggle state
+        binding_window.toggle_state = False
+        binding_window.rapid_toggle_active = False
+        binding_window.rapid_toggle_id = None  # The one pending rapid toggle tick
         binding_window.geometry("500x400")
         
         # Create a frame for the controls
@@ -3440,91 +4153,66 @@ Note: If binding fails, try the "Long Press" option which holds the button longe
                                       foreground="red", font=('Arial', 10, 'bold'))
         button_state_label.pack(side='left', padx=5)
         
+        # The labels change as soon as a button is clicked; the vJoy write waits
+        # for Tk to go idle, so the repaint isn't held up by the driver call.
+        # Clicks that land before the write coalesce into one write.
+        binding_window.pending_write = None  # (button_id, pressed) not yet sent to vJoy
+        
+        def show_button_state(pressed):
+            button_state_var.set(("RELEASED", "PRESSED")[pressed])
+            button_state_label.config(foreground=("red", "green")[pressed])
+        
+        def flush_button_write():
+            if binding_window.pending_write is None:
+                return
+            button_id, pressed = binding_window.pending_write
+            binding_window.pending_write = None
+            
+            # Bit manipulation first, set_button as the fallback
+            try:
+                method = self._set_button_state(button_id, pressed)
+                self.log_debug("Button %d %s using %s", button_id, ("released", "pressed")[pressed], method)
+            except Exception as std_error:
+                # Put the label back to what vJoy actually has
+                self._set_status(status_var, f"Error: {str(std_error)}")
+                show_button_state(1 - pressed)
+        
+        def queue_button_write(button_id, pressed):
+            pending = binding_window.pending_write
+            if pending is not None and pending[0] != button_id:
+                # Only writes to the same button can be merged
+                flush_button_write()
+                pending = None
+            binding_window.pending_write = (button_id, pressed)
+            if pending is None:
+                binding_window.after_idle(flush_button_write)
+        
         # Function to press the button
         def press_button():
             button_id = button_id_var.get()
-            status_var.set(f"Pressing button {button_id}...")
-            button_state_var.set("PRESSED")
-            button_state_label.config(foreground="green")
+            show_button_state(1)
             
-            try:
-                # Try direct bit manipulation first
-                try:
-                    # Calculate which bit to set
-                    bit_position = button_id - 1
-                    button_mask = 1 << bit_position
-                    
-                    # Get current button state
-                    current_buttons = self.controls.vjoy_dev.data.lButtons
-                    
-                    # Set the button bit
-                    self.controls.vjoy_dev.data.lButtons = current_buttons | button_mask
-                    self.controls.vjoy_dev.update()
-                    
-                    print(f"Button {button_id} pressed using bit manipulation")
-                except Exception as bit_error:
-                    print(f"Bit manipulation failed: {str(bit_error)}")
-                    
-                    # Try standard method as fallback
-                    try:
-                        self.controls.vjoy_dev.set_button(button_id, 1)
-                        self.controls.vjoy_dev.update()
-                        print(f"Button {button_id} pressed using standard method")
-                    except Exception as std_error:
-                        status_var.set(f"Error: {str(std_error)}")
-                        return
-                
-                # If long press is selected, automatically release after 3 seconds
-                if long_press_var.get():
-                    binding_window.after(3000, release_button)
-                    status_var.set(f"Button {button_id} pressed (will auto-release in 3 seconds)")
-                else:
-                    status_var.set(f"Button {button_id} pressed - click 'Release Button' when done")
-            except Exception as e:
-                status_var.set(f"Error: {str(e)}")
+            # If long press is selected, automatically release after 3 seconds
+            if long_press_var.get():
+                binding_window.after(3000, release_button)
+                self._set_status(status_var, f"Button {button_id} pressed (will auto-release in 3 seconds)")
+            else:
+                self._set_status(status_var, f"Button {button_id} pressed - click 'Release Button' when done")
+            
+            queue_button_write(button_id, 1)
         
         # Function to release the button
         def release_button():
             button_id = button_id_var.get()
-            status_var.set(f"Releasing button {button_id}...")
-            button_state_var.set("RELEASED")
-            button_state_label.config(foreground="red")
+            show_button_state(0)
+            self._set_status(status_var, f"Button {button_id} released")
             
-            try:
-                # Try direct bit manipulation first
-                try:
-                    # Calculate which bit to clear
-                    bit_position = button_id - 1
-                    button_mask = 1 << bit_position
-                    
-                    # Get current button state
-                    current_buttons = self.controls.vjoy_dev.data.lButtons
-                    
-                    # Clear the button bit
-                    self.controls.vjoy_dev.data.lButtons = current_buttons & ~button_mask
-                    self.controls.vjoy_dev.update()
-                    
-                    print(f"Button {button_id} released using bit manipulation")
-                except Exception as bit_error:
-                    print(f"Bit manipulation failed: {str(bit_error)}")
-                    
-                    # Try standard method as fallback
-                    try:
-                        self.controls.vjoy_dev.set_button(button_id, 0)
-                        self.controls.vjoy_dev.update()
-                        print(f"Button {button_id} released using standard method")
-                    except Exception as std_error:
-                        status_var.set(f"Error: {str(std_error)}")
-                        return
-                
-                status_var.set(f"Button {button_id} released")
-            except Exception as e:
-                status_var.set(f"Error: {str(e)}")
+            queue_button_write(button_id, 0)
         
         # Function to start binding mode
         def start_binding_mode():
             button_id = button_id_var.get()
-            status_var.set(f"Binding mode started for button {button_id}")
+            self._set_status(status_var, f"Binding mode started for button {button_id}")
             
             # Disable the start button and enable the press/release buttons
             start_button.config(state='disabled')
@@ -3534,7 +4222,7 @@ Note: If binding fails, try the "Long Press" option which holds the button longe
         
         # Function to stop binding mode
         def stop_binding_mode():
-            status_var.set("Binding mode stopped")
+            self._set_status(status_var, "Binding mode stopped")
             
             # Make sure the button is released
             release_button()
@@ -3572,9 +4260,6 @@ Note: If binding fails, try the "Long Press" option which holds the button longe
             button_id = button_id_var.get()
             
             # Toggle the button state
-            if not hasattr(binding_window, 'toggle_state'):
-                binding_window.toggle_state = False
-            
             binding_window.toggle_state = not binding_window.toggle_state
             
             if binding_window.toggle_state:
@@ -3583,14 +4268,13 @@ Note: If binding fails, try the "Long Press" option which holds the button longe
                 release_button()
             
             # Schedule the next toggle if rapid toggle is active
-            if hasattr(binding_window, 'rapid_toggle_active') and binding_window.rapid_toggle_active:
-                binding_window.after(200, rapid_toggle)  # Toggle every 200ms
+            if binding_window.rapid_toggle_active:
+                binding_window.rapid_toggle_id = binding_window.after(200, rapid_toggle)  # Toggle every 200ms
+            else:
+                binding_window.rapid_toggle_id = None
         
         # Function to start/stop rapid toggle
         def toggle_rapid_toggle():
-            if not hasattr(binding_window, 'rapid_toggle_active'):
-                binding_window.rapid_toggle_active = False
-            
             binding_window.rapid_toggle_active = not binding_window.rapid_toggle_active
             
             if binding_window.rapid_toggle_active:
@@ -3598,6 +4282,10 @@ Note: If binding fails, try the "Long Press" option which holds the button longe
                 rapid_toggle()
             else:
                 rapid_toggle_btn.config(text="Start Rapid Toggle")
+                # Drop the pending tick, so a quick restart can't leave two chains running
+                if binding_window.rapid_toggle_id is not None:
+                    binding_window.after_cancel(binding_window.rapid_toggle_id)
+                    binding_window.rapid_toggle_id = None
                 # Make sure button is released
                 release_button()
         
@@ -3605,17 +4293,27 @@ Note: If binding fails, try the "Long Press" option which holds the button longe
         rapid_toggle_btn.pack(side='left', padx=5)
         
         # When window is closed, make sure to release any pressed buttons
-        binding_window.protocol('WM_DELETE_WINDOW', lambda: [release_button(), binding_window.destroy()])
+        def close_binding_window():
+            binding_window.rapid_toggle_active = False
+            if binding_window.rapid_toggle_id is not None:
+                binding_window.after_cancel(binding_window.rapid_toggle_id)
+                binding_window.rapid_toggle_id = None
+            release_button()
+            # destroy() drops the window's pending after_idle, so send the release now
+            flush_button_write()
+            binding_window.destroy()
+        
+        binding_window.protocol('WM_DELETE_WINDOW', close_binding_window)
 
+    @_needs_vjoy
     def test_all_buttons_sequentially(self):
         """Test all buttons sequentially"""
-        if not hasattr(self.controls, 'vjoy_dev') or self.controls.vjoy_dev is None:
-            self.log_debug("vJoy device not available")
-            return
-        
         # Create a test window
         test_window = tk.Toplevel(self.root)
         test_window.title("Sequential Button Test")
+        # Test state; current_button is 0 until a test has pressed something
+        test_window.testing = False
+        test_window.current_button = 0
         test_window.geometry("400x300")
         
         # Create a frame for the controls
@@ -3658,10 +4356,10 @@ Watch your simulator to see which buttons are detected."""
             end_button = end_button_var.get()
             
             if start_button > end_button:
-                status_var.set("Error: Start button must be less than or equal to end button")
+                self._set_status(status_var, "Error: Start button must be less than or equal to end button")
                 return
             
-            status_var.set(f"Testing buttons {start_button} to {end_button}")
+            self._set_status(status_var, f"Testing buttons {start_button} to {end_button}")
             
             # Disable the start button
             start_button_btn.config(state='disabled')
@@ -3676,14 +4374,14 @@ Watch your simulator to see which buttons are detected."""
         
         # Function to test the next button
         def test_next_button():
-            if not hasattr(test_window, 'testing') or not test_window.testing:
+            if not test_window.testing:
                 return
             
             end_button = end_button_var.get()
             
             if test_window.current_button > end_button:
                 # All buttons tested
-                status_var.set("Testing complete")
+                self._set_status(status_var, "Testing complete")
                 current_button_var.set("None")
                 
                 # Enable the start button
@@ -3698,108 +4396,57 @@ Watch your simulator to see which buttons are detected."""
             
             # Press the button
             try:
-                # Try direct bit manipulation first
+                # Bit manipulation first, set_button as the fallback
+                started = time.perf_counter()
                 try:
-                    # Calculate which bit to set
-                    bit_position = test_window.current_button - 1
-                    button_mask = 1 << bit_position
-                    
-                    # Get current button state
-                    current_buttons = self.controls.vjoy_dev.data.lButtons
-                    
-                    # Set the button bit
-                    self.controls.vjoy_dev.data.lButtons = current_buttons | button_mask
-                    self.controls.vjoy_dev.update()
-                    
-                    print(f"Button {test_window.current_button} pressed using bit manipulation")
-                except Exception as bit_error:
-                    print(f"Bit manipulation failed: {str(bit_error)}")
-                    
-                    # Try standard method as fallback
-                    try:
-                        self.controls.vjoy_dev.set_button(test_window.current_button, 1)
-                        self.controls.vjoy_dev.update()
-                        print(f"Button {test_window.current_button} pressed using standard method")
-                    except Exception as std_error:
-                        status_var.set(f"Error: {str(std_error)}")
-                        return
+                    method = self._set_button_state(test_window.current_button, 1)
+                    self.log_debug("Button %d pressed using %s", test_window.current_button, method)
+                except Exception as std_error:
+                    self._set_status(status_var, f"Error: {str(std_error)}")
+                    return
                 
-                # Schedule to release the button after 1 second
-                test_window.after(1000, release_current_button)
+                # Schedule to release the button 1 second after the press started;
+                # time spent in the vJoy update comes out of the wait, not on top of it
+                test_window.after(_remaining_ms(1000, started), release_current_button)
             except Exception as e:
-                status_var.set(f"Error: {str(e)}")
+                self._set_status(status_var, f"Error: {str(e)}")
         
         # Function to release the current button
         def release_current_button():
-            if not hasattr(test_window, 'testing') or not test_window.testing:
+            if not test_window.testing:
                 return
             
             try:
-                # Try direct bit manipulation first
+                # Bit manipulation first, set_button as the fallback
+                started = time.perf_counter()
                 try:
-                    # Calculate which bit to clear
-                    bit_position = test_window.current_button - 1
-                    button_mask = 1 << bit_position
-                    
-                    # Get current button state
-                    current_buttons = self.controls.vjoy_dev.data.lButtons
-                    
-                    # Clear the button bit
-                    self.controls.vjoy_dev.data.lButtons = current_buttons & ~button_mask
-                    self.controls.vjoy_dev.update()
-                    
-                    print(f"Button {test_window.current_button} released using bit manipulation")
-                except Exception as bit_error:
-                    print(f"Bit manipulation failed: {str(bit_error)}")
-                    
-                    # Try standard method as fallback
-                    try:
-                        self.controls.vjoy_dev.set_button(test_window.current_button, 0)
-                        self.controls.vjoy_dev.update()
-                        print(f"Button {test_window.current_button} released using standard method")
-                    except Exception as std_error:
-                        status_var.set(f"Error: {str(std_error)}")
-                        return
+                    method = self._set_button_state(test_window.current_button, 0)
+                    self.log_debug("Button %d released using %s", test_window.current_button, method)
+                except Exception as std_error:
+                    self._set_status(status_var, f"Error: {str(std_error)}")
+                    return
                 
                 # Move to the next button
                 test_window.current_button += 1
                 
-                # Schedule to test the next button after a short delay
-                test_window.after(500, test_next_button)
+                # Schedule to test the next button after a short delay, counted from the release
+                test_window.after(_remaining_ms(500, started), test_next_button)
             except Exception as e:
-                status_var.set(f"Error: {str(e)}")
+                self._set_status(status_var, f"Error: {str(e)}")
         
         # Function to stop testing
         def stop_testing():
-            if hasattr(test_window, 'testing'):
-                test_window.testing = False
+            test_window.testing = False
             
             # Release the current button if any
-            if hasattr(test_window, 'current_button'):
+            if test_window.current_button:
                 try:
-                    # Try direct bit manipulation first
-                    try:
-                        # Calculate which bit to clear
-                        bit_position = test_window.current_button - 1
-                        button_mask = 1 << bit_position
-                        
-                        # Get current button state
-                        current_buttons = self.controls.vjoy_dev.data.lButtons
-                        
-                        # Clear the button bit
-                        self.controls.vjoy_dev.data.lButtons = current_buttons & ~button_mask
-                        self.controls.vjoy_dev.update()
-                    except Exception:
-                        # Try standard method as fallback
-                        try:
-                            self.controls.vjoy_dev.set_button(test_window.current_button, 0)
-                            self.controls.vjoy_dev.update()
-                        except Exception:
-                            pass
+                    # Bit manipulation first, set_button as the fallback
+                    self._set_button_state(test_window.current_button, 0)
                 except Exception:
                     pass
             
-            status_var.set("Testing stopped")
+            self._set_status(status_var, "Testing stopped")
             current_button_var.set("None")
             
             # Enable the start button
@@ -3822,12 +4469,8 @@ Watch your simulator to see which buttons are detected."""
     def reset_button_states(self):
         """Reset all button states"""
         try:
-            # Reset button states
-            self.controls.button_states = {}
-            
-            # Reset last pot values
-            if hasattr(self.controls, 'last_pot_values'):
-                self.controls.last_pot_values = {}
+            # Reset button states and last pot values
+            self.controls.reset_button_states()
             
             # Save settings
             self.save_settings()
@@ -3836,39 +4479,29 @@ Watch your simulator to see which buttons are detected."""
         except Exception as e:
             self.log_debug(f"Error resetting button states: {str(e)}")
 
+    def _apply_pot_var(self, setter, index, var, event=None):
+        """Pass a pot widget's current value to its setter; used as a command or event binding"""
+        setter(index, var.get())
+    
     def create_control_panel_ui(self, parent):
         """Create UI for control panel configuration"""
-        # Clear existing pot frames
+        # Clear existing pot frames and their settings variables
         self.pot_frames = []
-        
-        # Initialize control panel variables if they don't exist
-        if not hasattr(self, 'control_panel_baud_rate'):
-            self.control_panel_baud_rate = 115200
-        
-        if not hasattr(self, 'pot_name_vars'):
-            self.pot_name_vars = []
-        
-        if not hasattr(self, 'pot_type_vars'):
-            self.pot_type_vars = []
-        
-        if not hasattr(self, 'pot_inversion_vars'):
-            self.pot_inversion_vars = []
-        
-        if not hasattr(self, 'pot_threshold_vars'):
-            self.pot_threshold_vars = []
-        
-        if not hasattr(self, 'pot_axis_vars'):
-            self.pot_axis_vars = []
-        
-        if not hasattr(self, 'pot_button_vars'):
-            self.pot_button_vars = []
+        self.pot_ui_states = []
         
         # Create a frame for the potentiometers
         pots_frame = ttk.LabelFrame(parent, text="Potentiometers", padding=10)
         pots_frame.pack(fill='both', expand=True, padx=5, pady=5)
         
+        control_panel = self.controls.control_panel
+        pot_config = control_panel.pot_config
+        control_types = control_panel.CONTROL_TYPES
+        # Theme colours for the value bars
+        colors = self.root.style.colors
+        
         # Create UI for each potentiometer
         for i in range(7):
+            pot = pot_config[i]
             pot_frame = ttk.LabelFrame(pots_frame, text=f"Potentiometer {i+1}", padding=5)
             pot_frame.grid(row=i//3, column=i%3, padx=5, pady=5, sticky='ew')
             
@@ -3877,71 +4510,61 @@ Watch your simulator to see which buttons are detected."""
             name_frame.pack(fill='x', pady=2)
             ttk.Label(name_frame, text="Name:").pack(side='left')
             
-            name_var = tk.StringVar(value=self.controls.control_panel.pot_config[i]['name'])
+            name_var = tk.StringVar(value=pot['name'])
             name_entry = ttk.Entry(name_frame, textvariable=name_var, width=15)
             name_entry.pack(side='left', padx=5, fill='x', expand=True)
-            self.pot_name_vars.append(name_var)
             
             # Save button for name
             ttk.Button(name_frame, text="Set", 
-                      command=lambda idx=i, var=name_var: self.set_pot_name(idx, var.get())).pack(side='right')
+                      command=partial(self._apply_pot_var, self.set_pot_name, i, name_var)).pack(side='right')
             
             # Type selection
             type_frame = ttk.Frame(pot_frame)
             type_frame.pack(fill='x', pady=2)
             ttk.Label(type_frame, text="Type:").pack(side='left')
             
-            type_var = tk.StringVar(value=self.controls.control_panel.pot_config[i]['type'])
+            type_var = tk.StringVar(value=pot['type'])
             type_combo = ttk.Combobox(type_frame, textvariable=type_var, 
-                                     values=self.controls.control_panel.CONTROL_TYPES, width=10)
+                                     values=control_types, width=10)
             type_combo.pack(side='left', padx=5)
-            self.pot_type_vars.append(type_var)
             type_combo.bind("<<ComboboxSelected>>", 
-                           lambda e, idx=i, var=type_var: self.set_pot_type(idx, var.get()))
+                           partial(self._apply_pot_var, self.set_pot_type, i, type_var))
             
             # Inversion checkbox
-            invert_var = tk.BooleanVar(value=self.controls.control_panel.pot_config[i]['invert'])
+            invert_var = tk.BooleanVar(value=pot['invert'])
             invert_check = ttk.Checkbutton(type_frame, text="Invert", variable=invert_var,
-                                         command=lambda idx=i: self.toggle_pot_inversion(idx))
+                                         command=partial(self.toggle_pot_inversion, i))
             invert_check.pack(side='right')
-            self.pot_inversion_vars.append(invert_var)
             
             # Threshold for switch/button mode
             threshold_frame = ttk.Frame(pot_frame)
             threshold_frame.pack(fill='x', pady=2)
             ttk.Label(threshold_frame, text="Threshold:").pack(side='left')
             
-            threshold_var = tk.IntVar(value=self.controls.control_panel.pot_config[i]['threshold'])
+            threshold_var = tk.IntVar(value=pot['threshold'])
+            # The scale's command handles both the label and the stored threshold
             threshold_scale = ttk.Scale(threshold_frame, from_=0, to=100, variable=threshold_var,
-                                      orient='horizontal', length=100)
+                                      orient='horizontal', length=100,
+                                      command=partial(self._on_threshold_change, i))
             threshold_scale.pack(side='left', padx=5, fill='x', expand=True)
-            self.pot_threshold_vars.append(threshold_var)
-            threshold_scale.bind("<ButtonRelease-1>", 
-                               lambda e, idx=i, var=threshold_var: self.set_pot_threshold(idx, var.get()))
             
-            threshold_label = ttk.Label(threshold_frame, text="50%", width=5)
+            threshold_label = ttk.Label(threshold_frame, text=f"{pot['threshold']}%", width=5)
             threshold_label.pack(side='right')
-            threshold_var.trace_add("write", lambda *args, label=threshold_label, var=threshold_var: 
-                                  label.config(text=f"{var.get()}%"))
             
             # Add vJoy mapping UI
             vjoy_frame = ttk.Frame(pot_frame)
             vjoy_frame.pack(fill='x', pady=2)
             ttk.Label(vjoy_frame, text="vJoy:").pack(side='left')
             
-            # Create a list of available vJoy axes
-            vjoy_axes = ["None", "X", "Y", "Z", "RX", "RY", "RZ", "SL0", "SL1"]
-            
             # Get current vjoy_axis value or "None" if not set
-            current_axis = self.controls.control_panel.pot_config[i]['vjoy_axis'] or "None"
+            current_axis = pot['vjoy_axis'] or "None"
             
             axis_var = tk.StringVar(value=current_axis)
             vjoy_combo = ttk.Combobox(vjoy_frame, textvariable=axis_var, 
-                                     values=vjoy_axes, width=8)
+                                     values=VJOY_AXIS_CHOICES, width=8)
             vjoy_combo.pack(side='left', padx=5)
-            self.pot_axis_vars.append(axis_var)
             vjoy_combo.bind("<<ComboboxSelected>>", 
-                           lambda e, idx=i, var=axis_var: self.set_pot_vjoy_axis(idx, var.get()))
+                           partial(self._apply_pot_var, self.set_pot_vjoy_axis, i, axis_var))
             
             # Button ID for button/switch mode
             button_frame = ttk.Frame(pot_frame)
@@ -3949,61 +4572,75 @@ Watch your simulator to see which buttons are detected."""
             ttk.Label(button_frame, text="Button ID:").pack(side='left')
             
             # Get current button_id value or empty if not set
-            current_button = self.controls.control_panel.pot_config[i]['button_id'] or ""
+            current_button = pot['button_id'] or ""
             
             button_var = tk.StringVar(value=str(current_button))
             button_entry = ttk.Entry(button_frame, textvariable=button_var, width=5)
             button_entry.pack(side='left', padx=5)
-            self.pot_button_vars.append(button_var)
             
             # Save button for button ID
             ttk.Button(button_frame, text="Set", 
-                      command=lambda idx=i, var=button_var: self.set_pot_button_id(idx, var.get())).pack(side='left', padx=5)
+                      command=partial(self._apply_pot_var, self.set_pot_button_id, i, button_var)).pack(side='left', padx=5)
             
             # Add a test button for button/switch mode
             ttk.Button(button_frame, text="Test", 
-                      command=lambda idx=i: self.test_vjoy_button(idx)).pack(side='right', padx=5)
+                      command=partial(self.test_vjoy_button, i)).pack(side='right', padx=5)
             
             # Calibration buttons
             cal_frame = ttk.Frame(pot_frame)
             cal_frame.pack(fill='x', pady=2)
             ttk.Button(cal_frame, text="Set Min", 
-                      command=lambda idx=i: self.calibrate_pot_min(idx)).pack(side='left', padx=2)
+                      command=partial(self.calibrate_pot_min, i)).pack(side='left', padx=2)
             ttk.Button(cal_frame, text="Set Max", 
-                      command=lambda idx=i: self.calibrate_pot_max(idx)).pack(side='left', padx=2)
+                      command=partial(self.calibrate_pot_max, i)).pack(side='left', padx=2)
             
             # Value display
             value_frame = ttk.Frame(pot_frame)
             value_frame.pack(fill='x', pady=2)
             ttk.Label(value_frame, text="Value:").pack(side='left')
             
-            # Progress bar for value
-            value_bar = ttk.Progressbar(value_frame, length=100, mode='determinate')
-            value_bar.pack(side='left', padx=5, fill='x', expand=True)
-            
-            value_label = ttk.Label(value_frame, text="0%", width=5)
-            value_label.pack(side='right')
-            
-            # Add raw value display
-            raw_frame = ttk.Frame(pot_frame)
-            raw_frame.pack(fill='x', pady=2)
-            raw_label = ttk.Label(raw_frame, text="Raw: 0", width=15)
-            raw_label.pack(side='left')
+            # Bar and readouts on one canvas: the bar is a rectangle moved with coords()
+            # and the value and raw reading are text items, which skips the themed
+            # widgets' layout pass at panel update rates
+            value_canvas = tk.Canvas(value_frame, width=100, height=_POT_BAR_HEIGHT + _POT_TEXT_HEIGHT,
+                                     highlightthickness=0, bg=colors.bg)
+            value_trough = value_canvas.create_rectangle(0, 0, 100, _POT_BAR_HEIGHT,
+                                                         fill=colors.inputbg, outline='')
+            value_rect = value_canvas.create_rectangle(0, 0, 0, _POT_BAR_HEIGHT,
+                                                       fill=colors.primary, outline='')
+            raw_text = value_canvas.create_text(0, _POT_TEXT_Y, anchor='w', text="Raw: 0",
+                                                fill=colors.fg, font='TkDefaultFont')
+            value_text = value_canvas.create_text(100, _POT_TEXT_Y, anchor='e', text="0%",
+                                                  fill=colors.fg, font='TkDefaultFont')
+            value_canvas.pack(side='left', padx=5, fill='x', expand=True)
+            value_canvas.bind("<Configure>", partial(self._on_pot_bar_resize, i))
             
             # Add calibration values display
             cal_values_frame = ttk.Frame(pot_frame)
             cal_values_frame.pack(fill='x', pady=2)
-            cal_min_label = ttk.Label(cal_values_frame, text=f"Min: {self.controls.control_panel.pot_config[i]['calibrated_min']}")
+            # Text variables, so a new calibration is shown with one set() each
+            cal_min_var = tk.StringVar(value=f"Min: {pot['calibrated_min']}")
+            cal_max_var = tk.StringVar(value=f"Max: {pot['calibrated_max']}")
+            cal_min_label = ttk.Label(cal_values_frame, textvariable=cal_min_var)
             cal_min_label.pack(side='left', padx=5)
-            cal_max_label = ttk.Label(cal_values_frame, text=f"Max: {self.controls.control_panel.pot_config[i]['calibrated_max']}")
+            cal_max_label = ttk.Label(cal_values_frame, textvariable=cal_max_var)
             cal_max_label.pack(side='right', padx=5)
             
+            # Keep this pot's settings variables together
+            self.pot_ui_states.append(PotUIState(name_var, type_var, invert_var, threshold_var,
+                                                 threshold_label, axis_var, button_var,
+                                                 cal_min_var, cal_max_var))
+            
             # Store references to UI elements
             frame_data = {
                 'frame': pot_frame,
-                'value_bar': value_bar,
-                'value_label': value_label,
-                'raw_label': raw_label,
+                'value_canvas': value_canvas,
+                'value_rect': value_rect,
+                'value_trough': value_trough,
+                'value_text': value_text,
+                'raw_text': raw_text,
+                'bar_width': 100,  # Canvas width in pixels, kept current by <Configure>
+                'bar_value': 0.0,  # Percentage the bar currently shows
                 'cal_min_label': cal_min_label,
                 'cal_max_label': cal_max_label
             }
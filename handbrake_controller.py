@@ -4,8 +4,35 @@ import vgamepad as vg
 import tkinter as tk
 from tkinter import ttk
 import json
+import os
+import threading
 from serial.tools import list_ports
 
+# orjson is optional; it decodes and encodes faster than json
+try:
+    import orjson
+    
+    def _loads(data):
+        return orjson.loads(data)
+    
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+    
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# Serial read timeout; also how long the reader thread takes to notice a stop
+READ_TIMEOUT = 0.1
+# Longest run of bytes without a newline kept while waiting for the line to end
+MAX_LINE = 64
+# Minimum milliseconds between display refreshes
+DISPLAY_INTERVAL = 33
+# Milliseconds of quiet before changed settings are written to disk
+SAVE_DELAY = 500
+
 class HandbrakeController:
     def __init__(self):
         try:
@@ -13,12 +40,35 @@ class HandbrakeController:
             print("Virtual controller created")
             self.gamepad.reset()
             self.gamepad.update()
+            
+            # Bound once so each sample skips the attribute lookups
+            self.handbrake_button = vg.XUSB_BUTTON.XUSB_GAMEPAD_A
+            self.press_button = self.gamepad.press_button
+            self.release_button = self.gamepad.release_button
+            self.right_trigger = self.gamepad.right_trigger
+            self.send_report = self.gamepad.update
         except Exception as e:
             print(f"Error initializing gamepad: {e}")
             self.gamepad = None
 
         self.serial = None
         
+        # The reader thread keeps only the newest sample as (sequence, raw value);
+        # update_handbrake applies it once and skips the tick if nothing new arrived
+        self.latest_sample = (0, None)
+        self.applied_sequence = 0
+        # What the gamepad was last told: (digital mode, button down) or
+        # (analog mode, trigger value); a sample that maps to the same report
+        # skips the driver call
+        self.last_report = None
+        self.reader_thread = None
+        self.reader_stop = threading.Event()
+        # Called from the reader thread after each new sample, if set
+        self.on_sample = None
+        
+        # Bytes last written to the settings file, to skip saves that change nothing
+        self.saved_bytes = None
+        
         # Settings
         self.settings = {
             'threshold': 50,  # Default 50% threshold
@@ -26,58 +76,160 @@ class HandbrakeController:
             'last_port': 'COM1'
         }
         self.load_settings()
+        
+        # Copies of the settings read for every sample, kept in step by the GUI.
+        # The threshold is stored times 1023 so a raw reading compares against it
+        # as raw * 100, with no division
+        self.digital_mode = self.settings['digital_mode']
+        self.threshold_scaled = self.settings['threshold'] * 1023
 
     def connect(self, port):
+        self.disconnect()
+        if self.reader_running():
+            # The old reader still holds the port; see HandbrakeGUI.connect
+            print("Previous connection is still closing")
+            return False
         try:
-            if self.serial:
-                self.serial.close()
-            self.serial = serial.Serial(port, 115200, timeout=1)
+            self.serial = serial.Serial(port, 115200, timeout=READ_TIMEOUT)
             self.settings['last_port'] = port
             self.save_settings()
             print(f"Connected to {port}")
+            
+            # Read on a separate thread so the GUI never waits on the port
+            self.reader_stop = threading.Event()
+            self.reader_thread = threading.Thread(target=self.read_serial,
+                                                  args=(self.serial, self.reader_stop), daemon=True)
+            self.reader_thread.start()
             return True
         except Exception as e:
             print(f"Connection error: {e}")
             return False
 
+    def disconnect(self):
+        """Tell the reader thread to stop; it closes the port itself on the way out.
+        
+        Doesn't wait for it: the reader may be waiting on the GUI thread to take
+        a sample, so joining it from there could hang. Use reader_running to
+        see when it has gone.
+        """
+        self.reader_stop.set()
+        self.serial = None
+        # Samples from the old connection don't carry over
+        self.latest_sample = (0, None)
+        self.applied_sequence = 0
+
+    def reader_running(self):
+        """True while a reader thread (possibly a stopping one) still holds a port"""
+        return self.reader_thread is not None and self.reader_thread.is_alive()
+
+    def read_serial(self, ser, stop_event):
+        """Reader thread: keep the newest handbrake sample until stop_event is set"""
+        try:
+            self.read_lines(ser, stop_event)
+        finally:
+            ser.close()
+
+    def read_lines(self, ser, stop_event):
+        """Body of read_serial; returns on stop or on a read error"""
+        sequence = 0
+        # Bytes after the last complete line, carried into the next read
+        pending = bytearray()
+        while not stop_event.is_set():
+            try:
+                # Wait up to READ_TIMEOUT for a byte, then take everything queued at once
+                data = ser.read(ser.in_waiting or 1)
+                if not data:
+                    continue
+                pending += data
+                end = pending.rfind(b'\n')
+                if end < 0:
+                    # No complete line yet; drop junk that will never become one
+                    if len(pending) > MAX_LINE:
+                        pending.clear()
+                    continue
+                
+                # Only the newest complete line matters; older ones are stale
+                start = pending.rfind(b'\n', 0, end) + 1
+                line = bytes(pending[start:end])
+                del pending[:end + 1]
+                
+                # int() takes ASCII bytes directly and ignores the \r and spaces
+                # A stopped reader doesn't publish; a new connection may own the sample now
+                if line.strip() and not stop_event.is_set():
+                    value = int(line)
+                    sequence += 1
+                    # One tuple assignment, so the GUI thread never sees a half update
+                    self.latest_sample = (sequence, value)
+                    if self.on_sample:
+                        self.on_sample()
+            except ValueError:
+                # Partial or garbled line
+                pass
+            except Exception as e:
+                print(f"Read error: {e}")
+                return
+
     def update_handbrake(self):
         if not self.serial or not self.gamepad:
             return False
 
         try:
-            if self.serial.in_waiting:
-                raw_data = self.serial.readline().decode().strip()
-                if raw_data:
-                    handbrake_raw = int(raw_data)
-                    handbrake_percent = handbrake_raw / 1023.0 * 100
-
-                    if self.settings['digital_mode']:
-                        # Digital mode (button press)
-                        if handbrake_percent > self.settings['threshold']:
-                            self.gamepad.press_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_A)
-                        else:
-                            self.gamepad.release_button(vg.XUSB_BUTTON.XUSB_GAMEPAD_A)
-                    else:
-                        # Analog mode (trigger)
-                        self.gamepad.right_trigger(value=int(handbrake_percent * 327.67))
+            sequence, handbrake_raw = self.latest_sample
+            if sequence != self.applied_sequence:
+                # Older samples that arrived since the last tick are skipped;
+                # only the current handbrake position matters
+                self.applied_sequence = sequence
+                if self.digital_mode:
+                    # Digital mode (button press); same as percent > threshold
+                    report = (True, handbrake_raw * 100 > self.threshold_scaled)
+                else:
+                    # Analog mode (trigger); the trigger is a byte, so map 0-1023
+                    # onto 0-255 in integers to hit both end points exactly
+                    report = (False, max(0, min(255, handbrake_raw * 255 // 1023)))
 
-                    self.gamepad.update()
-                    return handbrake_percent
+                # Each update() is a driver round trip, so only send real changes;
+                # a resting handbrake sends nothing
+                if report != self.last_report:
+                    digital, state = report
+                    if not digital:
+                        self.right_trigger(value=state)
+                    elif state:
+                        self.press_button(self.handbrake_button)
+                    else:
+                        self.release_button(self.handbrake_button)
+                    self.send_report()
+                    self.last_report = report
+                # Percentage for the display
+                return handbrake_raw * 100 / 1023
         except Exception as e:
             print(f"Update error: {e}")
         return False
 
     def load_settings(self):
         try:
-            with open('handbrake_settings.json', 'r') as f:
-                saved_settings = json.load(f)
-                self.settings.update(saved_settings)
-        except:
+            with open('handbrake_settings.json', 'rb') as f:
+                self.settings.update(_loads(f.read()))
+        except FileNotFoundError:
             print("No settings file found, using defaults")
+        except (OSError, ValueError, TypeError) as e:
+            # Unreadable or corrupt file (both decoders raise ValueError subclasses),
+            # or JSON that isn't an object
+            print(f"Error loading settings, using defaults: {e}")
 
     def save_settings(self):
-        with open('handbrake_settings.json', 'w') as f:
-            json.dump(self.settings, f)
+        data = _dumps(self.settings)
+        if data == self.saved_bytes:
+            return
+        
+        # Write a temporary file and swap it in, so a crash mid-write
+        # can't leave a truncated settings file behind
+        try:
+            with open('handbrake_settings.json.tmp', 'wb') as f:
+                f.write(data)
+            os.replace('handbrake_settings.json.tmp', 'handbrake_settings.json')
+            self.saved_bytes = data
+        except OSError as e:
+            print(f"Error saving settings: {e}")
 
 class HandbrakeGUI:
     def __init__(self):
@@ -88,7 +240,19 @@ class HandbrakeGUI:
         # Set running flag before creating widgets
         self.running = True
         
+        # Newest handbrake value from polling, and the value the widgets show
+        self.latest_value = None
+        self.shown_value = None
+        # A poll / display refresh is already scheduled
+        self.poll_pending = False
+        self.display_pending = False
+        
+        # Pending debounced settings save
+        self.save_job = None
+        
         self.controller = HandbrakeController()
+        # The GUI only wakes when the reader thread has a new sample
+        self.controller.on_sample = self.request_poll
         self.create_widgets()
 
     def create_widgets(self):
@@ -96,7 +260,9 @@ class HandbrakeGUI:
         port_frame = ttk.LabelFrame(self.root, text="Connection", padding=10)
         port_frame.pack(fill='x', padx=5, pady=5)
 
-        self.ports = [p.device for p in list_ports.comports()]
+        # Start with just the last used port; the full list is filled in by
+        # refresh_ports in the background so the window isn't held up
+        self.ports = [self.controller.settings['last_port']]
         self.port_var = tk.StringVar(value=self.controller.settings['last_port'])
         
         ttk.Label(port_frame, text="COM Port:").pack(side='left', padx=5)
@@ -140,42 +306,111 @@ class HandbrakeGUI:
         self.value_label = ttk.Label(self.value_frame, text="0%")
         self.value_label.pack()
 
-        # Start the display update
-        self.root.after(10, self.update_display)
+        # Enumerate the ports once the window is up
+        self.refresh_ports()
 
     def connect(self):
-        if self.controller.connect(self.port_var.get()):
+        # The old reader stops on its own; reopen once it has released the port
+        self.controller.disconnect()
+        self.finish_connect(self.port_var.get())
+
+    def finish_connect(self, port):
+        """Connect once the previous reader thread has exited, without blocking Tk"""
+        if self.controller.reader_running():
+            # It notices the stop within one read timeout; check again shortly
+            self.root.after(20, self.finish_connect, port)
+            return
+        if self.controller.connect(port):
             self.status_label.config(text="Connected", foreground="green")
         else:
             self.status_label.config(text="Connection Failed", foreground="red")
 
     def refresh_ports(self):
-        self.ports = [p.device for p in list_ports.comports()]
+        # Port enumeration can take tens of ms on Windows, so it runs off the GUI thread
+        threading.Thread(target=self.enumerate_ports, daemon=True).start()
+
+    def enumerate_ports(self):
+        """Worker thread: list the COM ports and hand them to the GUI thread"""
+        try:
+            ports = [p.device for p in list_ports.comports()]
+        except Exception as e:
+            print(f"Port enumeration error: {e}")
+            return
+        if self.running:
+            self.root.after(0, self.show_ports, ports)
+
+    def show_ports(self, ports):
+        self.ports = ports
         self.port_combo['values'] = self.ports
 
     def update_mode(self):
-        self.controller.settings['digital_mode'] = self.mode_var.get()
-        self.controller.save_settings()
+        self.controller.settings['digital_mode'] = self.controller.digital_mode = self.mode_var.get()
+        self.schedule_save()
 
     def update_threshold(self, *args):
-        self.controller.settings['threshold'] = self.threshold_var.get()
-        self.controller.save_settings()
+        # Called for every pixel of a slider drag; the file is written once it settles
+        threshold = self.threshold_var.get()
+        self.controller.settings['threshold'] = threshold
+        self.controller.threshold_scaled = threshold * 1023
+        self.schedule_save()
 
-    def update_display(self):
+    def schedule_save(self):
+        """Save settings SAVE_DELAY ms after the last change"""
+        if self.save_job is not None:
+            self.root.after_cancel(self.save_job)
+        self.save_job = self.root.after(SAVE_DELAY, self.flush_save)
+
+    def flush_save(self):
+        """Write settings now if a save is pending"""
+        # Also runs after mainloop has ended, so the timer isn't touched here
+        if self.save_job is not None:
+            self.save_job = None
+            self.controller.save_settings()
+
+    def request_poll(self):
+        """Schedule one poll_handbrake; called from the reader thread for each new sample"""
+        # Samples arriving before the poll runs are picked up by that same poll
+        if not self.poll_pending and self.running:
+            self.poll_pending = True
+            try:
+                self.root.after(0, self.poll_handbrake)
+            except (RuntimeError, tk.TclError):
+                # The window is being torn down
+                pass
+
+    def poll_handbrake(self):
+        """Feed the newest sample to the gamepad; the widgets are refreshed separately"""
+        self.poll_pending = False
         if self.running:
             value = self.controller.update_handbrake()
             if value is not False:
+                self.latest_value = value
+                # Display refreshes are capped at ~30 Hz
+                if not self.display_pending:
+                    self.display_pending = True
+                    self.root.after(DISPLAY_INTERVAL, self.update_display)
+
+    def update_display(self):
+        """Show the latest value, touching the widgets only when it changed"""
+        self.display_pending = False
+        if self.running and self.latest_value is not None:
+            # The label shows one decimal, so compare at that precision
+            value = round(self.latest_value, 1)
+            if value != self.shown_value:
+                self.shown_value = value
                 self.value_bar['value'] = value
                 self.value_label['text'] = f"{value:.1f}%"
-            self.root.after(10, self.update_display)
 
     def run(self):
         try:
             self.root.mainloop()
         finally:
             self.running = False
-            if self.controller.serial:
-                self.controller.serial.close()
+            # Don't lose a change made just before closing
+            self.flush_save()
+            # Not joined: mainloop is gone, so a reader waiting on Tk never returns.
+            # It's a daemon thread and the port is released when the process exits
+            self.controller.disconnect()
 
 if __name__ == "__main__":
     app = HandbrakeGUI()